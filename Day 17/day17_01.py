@@ -26,10 +26,22 @@ def read_input_file(file_path):
         tuple: A tuple containing (register_values, program_instructions)
     """
     with open(file_path, "r") as file:
-        raw_text = file.read().strip()
+        return parse(file.read())
+
+
+# Function to parse the register values and program instructions from the puzzle text.
+def parse(raw_text):
+    """
+    Parse the puzzle text containing register values and program instructions.
     
+    Args:
+        raw_text (str): Contents of the input file.
+    
+    Returns:
+        tuple: A tuple containing (register_values, program_instructions)
+    """
     # Split input into register values and program instructions
-    raw_registers, raw_program = raw_text.split("\n\n")
+    raw_registers, raw_program = raw_text.strip().split("\n\n")
     
     # Extract register values (as integers)
     register_values = extract_integers(raw_registers)
@@ -158,6 +170,18 @@ def find_optimal_input(program, cursor, current_value):
     return None
 
 
+# Part 1: the comma separated program output.
+def part1(data):
+    registers, program = data
+    return ",".join(map(str, run_program(list(registers), program)))
+
+
+# Part 2: the lowest register A value that makes the program output itself.
+def part2(data):
+    _, program = data
+    return find_optimal_input(program, len(program) - 1, 0)
+
+
 # Main function to solve the problem for both parts.
 def solve(registers, program):
     """
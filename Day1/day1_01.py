@@ -1,29 +1,97 @@
 import numpy as np
 
-# Initialize empty lists for X and Y
-X = []
-Y = []
+# Bytes read per chunk when streaming a location file
+CHUNK_BYTES = 1 << 26
 
-# Read data from the file
-with open("day1.txt", "r") as file:
-    for row in file:
-        x, y = row.split()
-        X.append(int(x))
-        Y.append(int(y))
 
-# Convert lists to numpy arrays
-X = np.array(X)
-Y = np.array(Y)
+def _parse_block(block):
+    """Parse whitespace-separated pairs of integers into two int64 columns.
 
-# Sort the arrays
-x_sort = np.sort(X)
-y_sort = np.sort(Y)
+    When every line has the same layout (as in the puzzle input, where the IDs
+    are fixed-width), the digits are converted with one vectorized pass over
+    the bytes; otherwise numpy's C text parser handles arbitrary widths.
+    """
+    raw = np.frombuffer(block, dtype=np.uint8)
+    end = raw.size
+    while end and raw[end - 1] in b" \r\n":
+        end -= 1
+    width = int(np.argmax(raw[:end] == ord("\n"))) + 1 if end else 0
+    if width > 1 and (end + 1) % width == 0:
+        if end < raw.size and raw[end] == ord("\n"):
+            lines = raw[:end + 1]
+        else:
+            lines = np.append(raw[:end], np.uint8(ord("\n")))
+        lines = lines.reshape(-1, width)
+        is_digit = (lines[0] >= ord("0")) & (lines[0] <= ord("9"))
+        runs = np.flatnonzero(np.diff(np.concatenate(([0], is_digit.astype(np.int8), [0]))))
+        # Same layout on every line: separator columns are constant, digit columns hold only digits
+        same_layout = len(runs) == 4 and all((lines[:, column] == lines[0, column]).all()
+                                             for column in np.flatnonzero(~is_digit))
+        columns = []
+        for start, stop in zip(runs[::2], runs[1::2]) if same_layout else ():
+            # uint8 arithmetic wraps, so anything that is not a digit ends up above 9
+            digits = lines[:, start:stop] - ord("0")
+            if (digits > 9).any():
+                break
+            weights = 10 ** np.arange(stop - start - 1, -1, -1, dtype=np.int64)
+            columns.append(digits @ weights)
+        if len(columns) == 2:
+            return columns[0], columns[1]
+    values = np.fromstring(block[:end].decode(), dtype=np.int64, sep=" ")
+    if end and values.size != 2 * (block.count(b"\n", 0, end) + 1):
+        raise ValueError("Location lists must have two numbers on every line")
+    return values[0::2].copy(), values[1::2].copy()
 
-# Calculate the absolute difference at each position
-dist = np.abs(x_sort - y_sort)
 
-# Find the total distance
-total_dist = np.sum(dist)
+def iter_columns(path, chunk_bytes=CHUNK_BYTES):
+    """Stream a location file as (left, right) int64 chunks of whole lines."""
+    with open(path, "rb") as file:
+        tail = b""
+        while True:
+            chunk = file.read(chunk_bytes)
+            if not chunk:
+                break
+            block = tail + chunk
+            cut = block.rfind(b"\n") + 1
+            tail = block[cut:]
+            if cut:
+                yield _parse_block(block[:cut])
+        if tail.strip():
+            yield _parse_block(tail)
 
-# Print the total distance
-print("Total distance:", total_dist)
+
+def load_columns(path, chunk_bytes=CHUNK_BYTES):
+    """Read a location file of any size into two sorted int64 columns."""
+    chunks = list(iter_columns(path, chunk_bytes))
+    if not chunks:
+        return prepare(np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64))
+    X = np.concatenate([x for x, _ in chunks])
+    Y = np.concatenate([y for _, y in chunks])
+    return prepare(X, Y)
+
+
+def prepare(X, Y):
+    """Sort both columns in place; both parts work on the sorted lists."""
+    X.sort()
+    Y.sort()
+    return X, Y
+
+
+def parse(text):
+    """Parse the two location columns into sorted int64 numpy arrays."""
+    return prepare(*_parse_block(text.encode()))
+
+
+def part1(data):
+    X, Y = data
+
+    # Pair the sorted lists and find the total distance
+    return int(np.abs(X - Y).sum())
+
+
+if __name__ == "__main__":
+    # Read data from the file
+    data = load_columns("day1.txt")
+
+    # Print the total distance
+    print("Total distance:", part1(data))
@@ -0,0 +1,92 @@
+"""Out-of-core Day1 part 1 for location lists that do not fit in memory.
+
+Each chunk of the file is parsed, both columns are sorted in memory and written
+out as ``.npy`` runs. The runs of each column are then merged back through
+memory maps, a block at a time. Every round takes a window of ``block_rows``
+values from each run and emits everything up to the smallest window maximum
+(all of it is in final order). The two merged streams are paired by rank and
+their absolute differences summed in one pass. Memory stays around one chunk
+while sorting and ``runs * block_rows`` values per column while merging.
+"""
+import argparse
+import os
+import tempfile
+
+import numpy as np
+
+from day1_01 import CHUNK_BYTES, iter_columns
+
+# Values taken from each run per merge round
+BLOCK_ROWS = 1 << 16
+
+
+def sort_runs(path, workdir, chunk_bytes=CHUNK_BYTES):
+    """Write each chunk's sorted columns as ``.npy`` runs; returns the (left, right) run paths."""
+    left_runs, right_runs = [], []
+    for index, (X, Y) in enumerate(iter_columns(path, chunk_bytes)):
+        for column, runs, side in ((X, left_runs, "left"), (Y, right_runs, "right")):
+            column.sort()
+            run = os.path.join(workdir, f"{side}-{index:05d}.npy")
+            np.save(run, column)
+            runs.append(run)
+    return left_runs, right_runs
+
+
+def merge_runs(paths, block_rows=BLOCK_ROWS):
+    """Yield the values of sorted ``.npy`` runs as consecutive sorted blocks."""
+    runs = [np.load(path, mmap_mode="r") for path in paths]
+    cursors = [0] * len(runs)
+    while True:
+        windows = [(index, runs[index][cursor:cursor + block_rows])
+                   for index, cursor in enumerate(cursors) if cursor < len(runs[index])]
+        if not windows:
+            return
+        # Nothing left in any run can be smaller than the smallest window maximum
+        bound = min(window[-1] for _, window in windows)
+        pieces = []
+        for index, window in windows:
+            take = int(np.searchsorted(window, bound, side="right"))
+            pieces.append(window[:take])
+            cursors[index] += take
+        block = np.concatenate(pieces)
+        # The pieces are already sorted runs, which the stable sort merges cheaply
+        block.sort(kind="stable")
+        yield block
+
+
+def paired_distance(left_blocks, right_blocks):
+    """Sum of |left[i] - right[i]| over two sorted streams of blocks."""
+    total = 0
+    left = right = np.empty(0, dtype=np.int64)
+    left_blocks, right_blocks = iter(left_blocks), iter(right_blocks)
+    while True:
+        if not len(left):
+            left = next(left_blocks, None)
+        if not len(right):
+            right = next(right_blocks, None)
+        if left is None or right is None:
+            # Merged blocks are never empty, so both streams must run out together
+            if left is not None or right is not None:
+                raise ValueError("Location lists have different lengths")
+            return total
+        n = min(len(left), len(right))
+        total += int(np.abs(left[:n] - right[:n]).sum())
+        left, right = left[n:], right[n:]
+
+
+def total_distance(path, chunk_bytes=CHUNK_BYTES, block_rows=BLOCK_ROWS, workdir=None):
+    """Part 1 for a location file of any size, using ``workdir`` (default: a temp dir) for the runs."""
+    with tempfile.TemporaryDirectory(dir=workdir) as scratch:
+        left_runs, right_runs = sort_runs(path, scratch, chunk_bytes)
+        return paired_distance(merge_runs(left_runs, block_rows), merge_runs(right_runs, block_rows))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Day1 part 1 with an external-memory sort")
+    parser.add_argument("path", nargs="?", default="day1.txt")
+    parser.add_argument("--chunk-mb", type=int, default=CHUNK_BYTES >> 20, help="text read per sorted run")
+    parser.add_argument("--block-rows", type=int, default=BLOCK_ROWS, help="values taken per run per merge round")
+    parser.add_argument("--workdir", help="directory for the sorted runs (default: system temp dir)")
+    args = parser.parse_args()
+
+    print("Total distance:", total_distance(args.path, args.chunk_mb << 20, args.block_rows, args.workdir))
@@ -1,75 +1,56 @@
 import time
-from collections import deque
+
+from aoc.grid import DIGITS, Grid
+
+def parse(text):
+    return Grid.from_text(text, DIGITS)
 
 def read_map(filename):
     with open(filename, 'r') as file:
-        lines = file.readlines()
-    grid = [[int(char) for char in line.strip()] for line in lines if line.strip()]
-    return grid
-
-def neighbors(r, c, rows, cols):
-    directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]
-    for dr, dc in directions:
-        nr, nc = r + dr, c + dc
-        if 0 <= nr < rows and 0 <= nc < cols:
-            yield nr, nc
+        return parse(file.read())
 
 def find_trailhead_scores(grid):
-    rows, cols = len(grid), len(grid[0])
-
-    trailheads = [(r, c) for r in range(rows) for c in range(cols) if grid[r][c] == 0]
+    cells, offsets = grid.cells, grid.orthogonal
+    # Stamp cells with the trailhead that reached them instead of allocating a visited set per start
+    seen = [-1] * len(cells)
     total_score = 0
 
-    for start_r, start_c in trailheads:
-        visited = set()
-        queue = deque([(start_r, start_c)])
-        visited.add((start_r, start_c))
-        reachable_nines = set()
+    for start in grid.indices(0):
+        seen[start] = start
+        stack = [start]
 
-        while queue:
-            r, c = queue.popleft()
-            current_height = grid[r][c]
+        while stack:
+            index = stack.pop()
+            current_height = cells[index]
 
             if current_height == 9:
-                reachable_nines.add((r, c))
-            else:
-                next_height = current_height + 1
-                for nr, nc in neighbors(r, c, rows, cols):
-                    if (nr, nc) not in visited and grid[nr][nc] == next_height:
-                        visited.add((nr, nc))
-                        queue.append((nr, nc))
-
-        total_score += len(reachable_nines)
+                total_score += 1
+                continue
+            next_height = current_height + 1
+            for offset in offsets:
+                neighbor = index + offset
+                if cells[neighbor] == next_height and seen[neighbor] != start:
+                    seen[neighbor] = start
+                    stack.append(neighbor)
 
     return total_score
 
 def calculate_total_rating(grid):
-    rows, cols = len(grid), len(grid[0])
-
-    trailheads = [(r, c) for r in range(rows) for c in range(cols) if grid[r][c] == 0]
-    dp = [[-1] * cols for _ in range(rows)]
-
-    def count_paths(r, c):
-        if dp[r][c] != -1:
-            return dp[r][c]
-
-        current_height = grid[r][c]
-
-        if current_height == 9:
-            dp[r][c] = 1
-            return 1
+    cells, offsets = grid.cells, grid.orthogonal
+    paths = [0] * len(cells)
 
-        total_paths = 0
-        next_height = current_height + 1
-        for nr, nc in neighbors(r, c, rows, cols):
-            if grid[nr][nc] == next_height:
-                total_paths += count_paths(nr, nc)
+    for index in grid.indices(9):
+        paths[index] = 1
+    # Fill the number of distinct trails downhill, one height level at a time
+    for height in range(8, -1, -1):
+        next_height = height + 1
+        for index in grid.indices(height):
+            paths[index] = sum(paths[index + offset] for offset in offsets if cells[index + offset] == next_height)
 
-        dp[r][c] = total_paths
-        return total_paths
+    return sum(paths[index] for index in grid.indices(0))
 
-    total_rating = sum(count_paths(r, c) for r, c in trailheads)
-    return total_rating
+part1 = find_trailhead_scores
+part2 = calculate_total_rating
 
 if __name__ == "__main__":
     INPUT_FILE = "Day10/input.txt"
@@ -1,4 +1,5 @@
 import os
+from collections import Counter
 
 MAX_STONES = 100_000_000
 
@@ -67,5 +68,25 @@ def transform_stones(current_stones):
 def has_even_digits(number):
     return len(str(number)) % 2 == 0
 
+def count_stones(stones, num_of_blinks):
+    # Stones never interact, so only the count per engraved value matters
+    counts = Counter(stones)
+    for _ in range(num_of_blinks):
+        next_counts = Counter()
+        for stone, count in counts.items():
+            for new_stone in transform_stones([stone]):
+                next_counts[new_stone] += count
+        counts = next_counts
+    return sum(counts.values())
+
+def parse(text):
+    return list(map(int, text.split()))
+
+def part1(stones):
+    return count_stones(stones, 25)
+
+def part2(stones):
+    return count_stones(stones, 75)
+
 if __name__ == "__main__":
     main()
@@ -1,5 +1,5 @@
-from collections import deque, defaultdict
-from itertools import product
+
+from aoc.grid import Grid
 
 def read_input(file_path):
     """Read input data from a file."""
@@ -7,120 +7,88 @@ def read_input(file_path):
         return file.read().strip()
 
 class Garden:
-    def __init__(self, input_data):
-        self.grid = self.parse_input(input_data)
-        self.rows = len(self.grid)
-        self.cols = len(self.grid[0])
-    
-    @staticmethod
-    def parse_input(input_data):
-        return [list(line) for line in input_data.splitlines()]
-    
-    def get_plant_types(self):
-        plants = set()
-        for row in self.grid:
-            plants.update(row)
-        return plants
-    
-    def find_plots(self, plant_type):
-        visited = set()
+    def __init__(self, grid):
+        self.grid = grid
+        self.rows = grid.height
+        self.cols = grid.width
+        # Region id of every cell (border cells stay -1), filled by find_plots
+        self.labels = [-1] * len(grid.cells)
+
+    def find_plots(self):
+        """Flood-fill every region in one pass, returning the cell indices of each plot."""
+        cells, labels, offsets = self.grid.cells, self.labels, self.grid.orthogonal
         plots = []
 
-        for r in range(self.rows):
-            for c in range(self.cols):
-                if (r, c) not in visited and self.grid[r][c] == plant_type:
-                    plot = self._explore_plot(r, c, plant_type, visited)
-                    plots.append(plot)
-
-        return plots
-
-    def _explore_plot(self, r, c, plant_type, visited):
-        plot = []
-        queue = deque([(r, c)])
-        directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]
-
-        while queue:
-            x, y = queue.popleft()
-            if (x, y) in visited or not self._is_valid(x, y) or self.grid[x][y] != plant_type:
+        for start in self.grid.indices():
+            if labels[start] != -1:
                 continue
-            visited.add((x, y))
-            plot.append((x, y))
+            plant_type = cells[start]
+            label = len(plots)
+            labels[start] = label
+            plot = [start]
+            stack = [start]
+
+            while stack:
+                index = stack.pop()
+                for offset in offsets:
+                    neighbor = index + offset
+                    if labels[neighbor] == -1 and cells[neighbor] == plant_type:
+                        labels[neighbor] = label
+                        plot.append(neighbor)
+                        stack.append(neighbor)
+
+            plots.append(plot)
 
-            for dx, dy in directions:
-                queue.append((x + dx, y + dy))
-        
-        return plot
-    
-    def _is_valid(self, x, y):
-        return 0 <= x < self.rows and 0 <= y < self.cols
+        return plots
 
     def calculate_area_and_perimeter(self, plot):
-        area = len(plot)
+        labels, offsets = self.labels, self.grid.orthogonal
+        label = labels[plot[0]]
         perimeter = 0
-        directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]
 
-        for x, y in plot:
-            for dx, dy in directions:
-                nx, ny = x + dx, y + dy
-                if not self._is_valid(nx, ny) or self.grid[nx][ny] != self.grid[x][y]:
+        for index in plot:
+            for offset in offsets:
+                if labels[index + offset] != label:
                     perimeter += 1
 
-        return area, perimeter
+        return len(plot), perimeter
 
-def part_1(input_data):
-    garden = Garden(input_data)
+def part_1(grid):
+    garden = Garden(grid)
     total = 0
 
-    for plant_type in garden.get_plant_types():
-        plots = garden.find_plots(plant_type)
-        for plot in plots:
-            area, perimeter = garden.calculate_area_and_perimeter(plot)
-            total += area * perimeter
-    
-    return total
+    for plot in garden.find_plots():
+        area, perimeter = garden.calculate_area_and_perimeter(plot)
+        total += area * perimeter
 
-def part_2(input_data):
-    def find_sides(plot, mask):
-        sides = 0
-        for plant in plot:
-            sides += count_corners(plant, mask, corner_patterns)
-        return sides
+    return total
 
-    garden = Garden(input_data)
+def part_2(grid):
+    garden = Garden(grid)
+    patterns = [tuple(grid.offset(dx, dy) for dx, dy in pattern) for pattern in corner_patterns]
     total = 0
 
-    for plant_type in garden.get_plant_types():
-        plots = garden.find_plots(plant_type)
-        for plot in plots:
-            area = len(plot)
-            mask = create_mask(plot, garden.rows, garden.cols)
-            sides = find_sides(plot, mask)
-            total += area * sides
+    for plot in garden.find_plots():
+        sides = sum(count_corners(index, garden.labels, patterns) for index in plot)
+        total += len(plot) * sides
 
     return total
 
-def create_mask(plot, rows, cols):
-    mask = [[0] * cols for _ in range(rows)]
-    for x, y in plot:
-        mask[x][y] = 1
-    return mask
+def count_corners(index, labels, patterns):
+    """Corners of a cell's region at that cell; a region has as many sides as corners.
 
-def count_corners(plant, mask, corner_patterns):
-    x, y = plant
+    A corner is convex when both sides of it leave the region, and concave when
+    both stay in the region but the diagonal between them does not.
+    """
+    label = labels[index]
     count = 0
-    for pattern in corner_patterns:
-        if is_corner(x, y, mask, pattern):
+    for side, diagonal, other in patterns:
+        inside = labels[index + side] == label
+        if inside == (labels[index + other] == label) and not (inside and labels[index + diagonal] == label):
             count += 1
     return count
 
-def is_corner(x, y, mask, pattern):
-    for dx, dy in pattern:
-        nx, ny = x + dx, y + dy
-        if not (0 <= nx < len(mask) and 0 <= ny < len(mask[0])) or mask[nx][ny] != 1:
-            return False
-    return True
-
-# Corner patterns for different corner types
+# Corner patterns as (side, diagonal, other side) for different corner types
 corner_patterns = [
     [(-1, 0), (-1, 1), (0, 1)],  # Top-right
     [(0, -1), (-1, -1), (-1, 0)],  # Top-left
@@ -128,9 +96,15 @@ corner_patterns = [
     [(0, 1), (1, 1), (1, 0)],  # Bottom-right
 ]
 
+def parse(text):
+    return Grid.from_text(text)
+
+part1 = part_1
+part2 = part_2
+
 if __name__ == "__main__":
     file_path = "Day12/input.txt"  # Replace with your file path
-    input_data = read_input(file_path)
-    
-    print("Part 1:", part_1(input_data))
-    print("Part 2:", part_2(input_data))
+    grid = parse(read_input(file_path))
+
+    print("Part 1:", part_1(grid))
+    print("Part 2:", part_2(grid))
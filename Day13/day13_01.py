@@ -1,7 +1,5 @@
-import asyncio
 import re
 import time
-from pathlib import Path
 
 class Point:
     def __init__(self, x, y):
@@ -36,16 +34,15 @@ def calc_a_and_b(A, B, Prize):
     return A_val, B_val
 
 
-def parse_input_file(file_path):
+def parse(text):
     tasks = []
     task = {}
-    with open(file_path, "r") as file:
-        for line in file:
-            parse_line(line.strip(), task)
+    for line in text.splitlines():
+        parse_line(line.strip(), task)
 
-            if 'A' in task and 'B' in task and 'Prize' in task:
-                tasks.append(task)
-                task = {}
+        if 'A' in task and 'B' in task and 'Prize' in task:
+            tasks.append(task)
+            task = {}
 
     if 'A' in task and 'B' in task and 'Prize' in task:
         tasks.append(task)
@@ -53,8 +50,12 @@ def parse_input_file(file_path):
     return tasks
 
 
-def part1(file_path):
-    tasks = parse_input_file(file_path)
+def parse_input_file(file_path):
+    with open(file_path, "r") as file:
+        return parse(file.read())
+
+
+def part1(tasks):
     total_sum = 0
 
     for task in tasks:
@@ -65,8 +66,7 @@ def part1(file_path):
     return total_sum
 
 
-def part2(file_path):
-    tasks = parse_input_file(file_path)
+def part2(tasks):
     total_sum = 0
     shift = Point(10000000000000, 10000000000000)
 
@@ -82,13 +82,13 @@ def part2(file_path):
 def main():
     print("Processing Part 1")
     start_time = time.time()
-    part1_result = part1("Day13/input.txt")
+    part1_result = part1(parse_input_file("Day13/input.txt"))
     print(f"Part 1 Result: {part1_result}")
     print(f"Time Taken: {time.time() - start_time:.2f} seconds")
 
     print("\nProcessing Part 2")
     start_time = time.time()
-    part2_result = part2("Day13/input.txt")
+    part2_result = part2(parse_input_file("Day13/input.txt"))
     print(f"Part 2 Result: {part2_result}")
     print(f"Time Taken: {time.time() - start_time:.2f} seconds")
 
@@ -1,24 +1,28 @@
 import re
-import numpy as np
 
-def parse_input(filename):
+def parse(text):
     positions = []
     directions = []
-    
-    with open(filename, 'r') as file:
-        for line in file:
-            line = line.strip()
-            p_match = re.search(r"p=(-?\d+),(-?\d+)", line)
-            v_match = re.search(r"v=(-?\d+),(-?\d+)", line)
 
-            p_x, p_y = int(p_match.group(1)), int(p_match.group(2))
-            v_x, v_y = int(v_match.group(1)), int(v_match.group(2))
+    for line in text.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        p_match = re.search(r"p=(-?\d+),(-?\d+)", line)
+        v_match = re.search(r"v=(-?\d+),(-?\d+)", line)
 
-            positions.append((p_x, p_y))
-            directions.append((v_x, v_y))
+        p_x, p_y = int(p_match.group(1)), int(p_match.group(2))
+        v_x, v_y = int(v_match.group(1)), int(v_match.group(2))
+
+        positions.append((p_x, p_y))
+        directions.append((v_x, v_y))
 
     return positions, directions
 
+def parse_input(filename):
+    with open(filename, 'r') as file:
+        return parse(file.read())
+
 MAP_WIDTH = 101
 MAP_HEIGHT = 103
 TIMESTEPS = 100
@@ -53,6 +57,9 @@ def solve1(positions, directions):
     return result[0] * result[1] * result[2] * result[3]
 
 def solve2(positions, directions):
+    # Imported here so loading the module (and part one) does not pay for numpy
+    import numpy as np
+
     final_positions = list()
 
     best_xt = 0
@@ -82,8 +89,15 @@ def solve2(positions, directions):
     # crazy application of Chinese Remainder Thm
     return best_xt + ((pow(MAP_WIDTH, -1, MAP_HEIGHT)*(best_yt-best_xt)) % MAP_HEIGHT) * MAP_WIDTH
 
-positions, directions = parse_input('Day14/input.txt')
-ans1 = solve1(positions, directions)
-print('part one -', ans1)
-ans2 = solve2(positions, directions)
-print('part two -', ans2)
\ No newline at end of file
+def part1(data):
+    return solve1(*data)
+
+def part2(data):
+    return solve2(*data)
+
+if __name__ == '__main__':
+    positions, directions = parse_input('Day14/input.txt')
+    ans1 = solve1(positions, directions)
+    print('part one -', ans1)
+    ans2 = solve2(positions, directions)
+    print('part two -', ans2)
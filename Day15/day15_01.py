@@ -1,23 +1,12 @@
-from collections import defaultdict
-from time import perf_counter as measure_time
-
-def performance_profiler(method):
-    def timing_wrapper(*args, **kwargs):
-        # Record the start time before method execution
-        start_time = measure_time()
-        
-        # Execute the original method
-        result = method(*args, **kwargs)
-        
-        # Print the execution time with high precision
-        print(
-            f"Method {method.__name__} took: "
-            f"{measure_time() - start_time:2.5f} sec"
-        )
-        
-        # Return the original method's result
-        return result
-    return timing_wrapper
+
+from aoc import profiling
+from aoc.grid import Grid
+
+
+def parse(text):
+    raw_grid, raw_moves = text.strip().split("\n\n")
+    moves = list(map(lambda d: move_direction(d), "".join(raw_moves.split("\n"))))
+    return raw_grid, moves
 
 
 def parse_input(file_path):
@@ -27,14 +16,13 @@ def parse_input(file_path):
     return parts[0], parts[1]
 
 
+WALL, BOX, BOX_LEFT, BOX_RIGHT, ROBOT, EMPTY = b"#O[]@."
+
+
 def create_grid(raw_grid):
-    grid = defaultdict(lambda: "#")
-    for y, line in enumerate(raw_grid.split("\n")):
-        for x, tile in enumerate(line):
-            grid[(x, y)] = tile
-            if tile == "@":
-                start = (x, y)
-    return grid, start
+    # Walls as the border value, so stepping off the map behaves like hitting one
+    grid = Grid.from_text(raw_grid, border=WALL)
+    return grid, grid.find(ROBOT)
 
 
 def scale_up_grid_text(raw_grid):
@@ -49,101 +37,118 @@ def move_direction(symbol):
     return movements[symbol]
 
 
-def next_position(position, move):
-    px, py = position
-    dx, dy = move
-    return (px + dx, py + dy)
+def move_offsets(grid, moves):
+    return [grid.offset(dy, dx) for dx, dy in moves]
 
 
 def sum_gps_coordinates(grid):
-    return sum((100 * y + x) for (x, y) in grid if grid[(x, y)] in "O[")
+    total = 0
+    for tile in (BOX, BOX_LEFT):
+        for index in grid.indices(tile):
+            y, x = grid.position(index)
+            total += 100 * y + x
+    return total
 
 
-@performance_profiler
+@profiling.profile
 def part_one(current_pos, grid, moves):
-    for move in moves:
-        new_pos = next_position(current_pos, move)
+    cells = grid.cells
+    for move in move_offsets(grid, moves):
+        new_pos = current_pos + move
         # Skip if new position is a wall
-        if grid[new_pos] == "#":
+        if cells[new_pos] == WALL:
             continue
         # Handle box movement
-        elif grid[new_pos] == "O":
+        elif cells[new_pos] == BOX:
             # Find end of current box sequence
             end_box = new_pos
-            while grid[end_box] == "O":
-                end_box = next_position(end_box, move)
+            while cells[end_box] == BOX:
+                end_box += move
 
             # Cannot move if blocked by wall
-            if grid[end_box] == "#":
+            if cells[end_box] == WALL:
                 continue
             else:
-                grid[end_box] = "O"
-                grid[new_pos] = "@"
-                grid[current_pos] = "."
+                cells[end_box] = BOX
+                cells[new_pos] = ROBOT
+                cells[current_pos] = EMPTY
                 current_pos = new_pos
 
         # Simple movement
-        elif grid[new_pos] == ".":
-            grid[new_pos] = "@"
-            grid[current_pos] = "."
+        elif cells[new_pos] == EMPTY:
+            cells[new_pos] = ROBOT
+            cells[current_pos] = EMPTY
             current_pos = new_pos
 
     return sum_gps_coordinates(grid)
 
 
-@performance_profiler
+@profiling.profile
 def part_two(current_pos, grid, moves):
-    
+    cells = grid.cells
+
     def can_move(box_pos, move, boxes):
         checked = set()
         # Handle different box sides
-        if grid[box_pos] == "[":
-            checked = set([box_pos, next_position(box_pos, move_direction(">"))])
-        elif grid[box_pos] == "]":
-            checked = set([box_pos, next_position(box_pos, move_direction("<"))])
+        if cells[box_pos] == BOX_LEFT:
+            checked = {box_pos, box_pos + 1}
+        elif cells[box_pos] == BOX_RIGHT:
+            checked = {box_pos, box_pos - 1}
 
-        new_positions = set([next_position(p, move) for p in checked]) - checked
+        new_positions = {p + move for p in checked} - checked
 
         # Fail if new positions would hit a wall
-        if any(grid[p] == "#" for p in new_positions):
+        if any(cells[p] == WALL for p in new_positions):
             return False
 
         # Recursively check if all new positions are valid
-        valid = all(grid[p] == "." or can_move(p, move, boxes) for p in new_positions)
+        valid = all(cells[p] == EMPTY or can_move(p, move, boxes) for p in new_positions)
 
         if valid:
-            for c in checked:
-                boxes.add(c)
+            boxes.update(checked)
             return valid
 
         return False
 
-    for move in moves:
-        new_pos = next_position(current_pos, move)
-        if grid[new_pos] == "#":
+    for move in move_offsets(grid, moves):
+        new_pos = current_pos + move
+        if cells[new_pos] == WALL:
             continue
-        elif grid[new_pos] in "[]":
+        elif cells[new_pos] in (BOX_LEFT, BOX_RIGHT):
             boxes = set()
             if can_move(new_pos, move, boxes):
                 # Move boxes and update grid
                 new_boxes = {}
                 for box_pos in boxes:
-                    new_boxes[next_position(box_pos, move)] = grid[box_pos]
-                    grid[box_pos] = "."
-                for box_pos in new_boxes:
-                    grid[box_pos] = new_boxes[box_pos]
-                grid[new_pos] = "@"
-                grid[current_pos] = "."
+                    new_boxes[box_pos + move] = cells[box_pos]
+                    cells[box_pos] = EMPTY
+                for box_pos, tile in new_boxes.items():
+                    cells[box_pos] = tile
+                cells[new_pos] = ROBOT
+                cells[current_pos] = EMPTY
                 current_pos = new_pos
-        elif grid[new_pos] == ".":
-            grid[new_pos] = "@"
-            grid[current_pos] = "."
+        elif cells[new_pos] == EMPTY:
+            cells[new_pos] = ROBOT
+            cells[current_pos] = EMPTY
             current_pos = new_pos
 
     return sum_gps_coordinates(grid)
 
 
+def part1(data):
+    raw_grid, moves = data
+    grid, start = create_grid(raw_grid)
+    return part_one(start, grid, moves)
+
+
+def part2(data):
+    raw_grid, moves = data
+    grid, start = create_grid(scale_up_grid_text(raw_grid))
+    return part_two(start, grid, moves)
+
+
 if __name__ == "__main__":
+    profiling.enable()
     raw_grid, raw_moves = parse_input("Day15/input.txt")
 
     moves = list(map(lambda d: move_direction(d), "".join(raw_moves.split("\n"))))
@@ -158,3 +163,5 @@ if __name__ == "__main__":
 
     p2 = part_two(start, grid, moves)
     print(f"Part 2: {p2}")
+
+    print(profiling.format_report())
@@ -1,74 +1,88 @@
-import heapq
-import copy
+
+from aoc.grid import Grid
+from aoc.search import bfs
+
+SAFE, CORRUPTED = b".#"
 
 def parse_input(filename, size=7):
-    grid = []
-    for _ in range(size):
-        grid.append(['.']*size)
-    
-    obstacles = []
     with open(filename, 'r') as file:
-        for line in file:
-            x, y = line.strip().split(',')
-            obstacles.append((int(y),int(x)))
+        return parse(file.read(), size)
+
+def parse(text, size=None):
+    obstacles = []
+    for line in text.splitlines():
+        if not line.strip():
+            continue
+        x, y = line.strip().split(',')
+        obstacles.append((int(y),int(x)))
 
-    return grid, obstacles
+    # The memory space is just large enough to hold every falling byte
+    if size is None:
+        size = max(max(i, j) for i, j in obstacles) + 1
+
+    return Grid(size, size, fill=SAFE), obstacles
 
 
 def solve1(grid, obs, step=12):
-    N = len(grid)
-    M = len(grid[0])
-    def is_inside(i, j):
-        return 0 <= i < N and 0 <= j < M
-
-    for i in range(step):
-        grid[obs[i][0]][obs[i][1]] = '#'
-
-    h = [(0,0,0,-1,0)] # dist,curi,curj,previ,prevj
-    heapq.heapify(h)
-    visited = set()
-
-    while h:
-        d,i,j,pi,pj = heapq.heappop(h)
-        di = i-pi
-        dj = j-pj
-        
-        if not is_inside(i,j) or (i,j,pi,pj) in visited:
-            continue
-        if grid[i][j] == '#':
-            continue
-        if i == N-1 and j == M-1:
-            return d
-        # print(d,i,j,pi,pj,'|',di,dj)
-        visited.add((i,j,pi,pj))
-        for (ii,jj) in [(-1,0),(1,0),(0,1),(0,-1)]:
-            if (ii,jj) == (-di,-dj): continue
-            heapq.heappush(h, (d+1, i+ii, j+jj, i, j))
+    # Drop the bytes on a copy of the cells so the grid can be reused between calls
+    cells = bytearray(grid.cells)
+    for i, j in obs[:step]:
+        cells[grid.index(i, j)] = CORRUPTED
+    offsets = grid.orthogonal
+    start = grid.index(0, 0)
+    target = grid.index(grid.height - 1, grid.width - 1)
 
-    raise ValueError('Check the grid :(')
+    def neighbors(index):
+        for offset in offsets:
+            if cells[index + offset] == SAFE:
+                yield index + offset
+
+    if cells[start] != SAFE:
+        raise ValueError('Check the grid :(')
+    result = bfs([start], neighbors, len(cells), goal=lambda index: index == target)
+    if result.goal is None:
+        raise ValueError('Check the grid :(')
+    return result.distance(target)
 
 def solve2(grid, obs):
+    # Smallest number of fallen bytes that cuts off the exit, assuming all of them do
     left = 0
-    right = len(obs)-1
+    right = len(obs)
     while (left < right):
         mid = (left + right) // 2
         try:
-            ans = solve1(copy.deepcopy(grid), obs, step=mid)
+            solve1(grid, obs, step=mid)
             left = mid+1
-            print(mid, ans)
         except ValueError:
             right = mid
 
+    if left == len(obs):
+        try:
+            solve1(grid, obs, step=left)
+        except ValueError:
+            pass
+        else:
+            raise ValueError('No byte cuts off the exit')
+
     y, x = obs[left-1]
     return f"{x},{y}"
 
         
 
-grid, obstacles = parse_input('Day18/input.txt', size=71)
-# grid, obstacles = parse_input('./inputs/day18toy.txt')
+def part1(data):
+    grid, obstacles = data
+    return solve1(grid, obstacles, step=1024)
+
+def part2(data):
+    grid, obstacles = data
+    return solve2(grid, obstacles)
+
+if __name__ == '__main__':
+    grid, obstacles = parse_input('Day18/input.txt', size=71)
+    # grid, obstacles = parse_input('./inputs/day18toy.txt')
 
-ans = solve1(copy.deepcopy(grid), obstacles, step=1024)
-# ans = solve1(copy.deepcopy(grid), obstacles)
-print(f'Part one - {ans}')
-ans = solve2(grid, obstacles)
-print(f'Part two - {ans}')
\ No newline at end of file
+    ans = solve1(grid, obstacles, step=1024)
+    # ans = solve1(grid, obstacles)
+    print(f'Part one - {ans}')
+    ans = solve2(grid, obstacles)
+    print(f'Part two - {ans}')
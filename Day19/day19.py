@@ -1,16 +1,26 @@
+from aoc import profiling
+
 def parse_input(filename):
+    with open(filename, 'r') as file:
+        return parse_designs(file.read())
+
+def parse_designs(text):
     resources = []
     targets = []
-    with open(filename, 'r') as file:
-        for i, line in enumerate(file):
-            line = line.strip()
-            if i == 0:
-                resources = [x.strip() for x in line.split(',')]
-            elif i > 1:
-                targets.append(line)
+    for i, line in enumerate(text.splitlines()):
+        line = line.strip()
+        if i == 0:
+            resources = [x.strip() for x in line.split(',')]
+        elif i > 1:
+            targets.append(line)
 
     return resources, targets
 
+def parse(text):
+    # Both parts need the number of ways to make each design, so count them once here
+    return solve1(*parse_designs(text))
+
+@profiling.profile
 def solve1(resources, targets):
     output = []
     memo = {} # memoized
@@ -18,10 +28,12 @@ def solve1(resources, targets):
         ans = 0
         def recursion(partial_target):
             if partial_target in memo:
+                profiling.count("memo hits")
                 return memo[partial_target]
             if len(partial_target) == 0:
                 return True
 
+            profiling.count("memo misses")
             possibilities = 0
             for r in resources:
                 l = len(r)
@@ -36,9 +48,18 @@ def solve1(resources, targets):
 
     return output
 
-# resources, targets = parse_input('./inputs/day19toy.txt')
-resources, targets = parse_input('Day19/input.txt')
+def part1(ans):
+    return sum(1 if x>0 else 0 for x in ans)
+
+def part2(ans):
+    return sum(ans)
+
+if __name__ == '__main__':
+    profiling.enable()
+    # resources, targets = parse_input('./inputs/day19toy.txt')
+    resources, targets = parse_input('Day19/input.txt')
 
-ans = solve1(resources, targets)
-print(f"Part One - {sum(1 if x>0 else 0 for x in ans)}")
-print(f"Part Two - {sum(ans)}")
\ No newline at end of file
+    ans = solve1(resources, targets)
+    print(f"Part One - {sum(1 if x>0 else 0 for x in ans)}")
+    print(f"Part Two - {sum(ans)}")
+    print(profiling.format_report())
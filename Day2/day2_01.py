@@ -1,40 +1,83 @@
 import numpy as np
 
-# Read the input file and parse it into a list of lists of integers
-with open("Day2/input.txt") as f:
-    arr = [[int(i) for i in l.split()] for l in f]
+# Reports checked per vectorized pass; keeps the temporaries small for huge inputs
+BATCH_ROWS = 1 << 15
 
-def is_safe(diffs):
-    """
-    Check if the differences array is safe.
-    A report is safe if all differences are either:
-    - Positive and between 1 and 3 inclusive, or
-    - Negative and between -3 and -1 inclusive.
+
+def parse(text):
+    """Parse the reports into a padded (reports x levels) array plus the length of each report."""
+    lines = [line for line in text.splitlines() if line.strip()]
+    lengths = np.array([len(line.split()) for line in lines], dtype=np.int64)
+    values = np.fromstring(" ".join(lines), dtype=np.int64, sep=" ") if lines else np.empty(0, dtype=np.int64)
+    levels = np.zeros((len(lines), int(lengths.max()) if lines else 0), dtype=np.int64)
+    levels[np.arange(levels.shape[1]) < lengths[:, None]] = values
+    return levels, lengths
+
+
+def _steps_ok(before, after, sign):
+    """A step is safe if it moves 1 to 3 in the given direction."""
+    step = (after - before) * sign
+    return (step >= 1) & (step <= 3)
+
+
+def _edges(levels, lengths, sign):
+    """Safety of each step between neighbouring levels; steps past the end count as safe."""
+    positions = np.arange(1, levels.shape[1])
+    return _steps_ok(levels[:, :-1], levels[:, 1:], sign) | (positions >= lengths[:, None])
+
+
+def safe_reports(levels, lengths):
+    """Reports whose levels all increase or all decrease by 1 to 3."""
+    return np.logical_or.reduce([_edges(levels, lengths, sign).all(axis=1) for sign in (1, -1)])
+
+
+def dampened_reports(levels, lengths):
+    """Reports that are safe after removing at most one level, in O(levels) per report.
+
+    Removing level ``i`` works when every step before ``i - 1`` is safe (prefix
+    validity), every step after ``i + 1`` is safe (suffix validity) and the step
+    from ``i - 1`` to ``i + 1`` that replaces the two around ``i`` is safe.
     """
-    return len(diffs[(diffs > 0) & (diffs <= 3)]) == len(diffs) or \
-           len(diffs[(diffs < 0) & (diffs >= -3)]) == len(diffs)
-
-# Initialize counters for Part 1 and Part 2
-p1, p2 = 0, 0
-
-# Process each report
-for a in arr:
-    # Compute differences between consecutive elements
-    diffs = np.diff(a)
-    
-    # Part 1: Check if the report is safe
-    if is_safe(diffs):
-        p1 += 1
-        p2 += 1  # Safe reports also contribute to Part 2
-    else:
-        # Part 2: Try fixing the report by removing one element
-        for i in range(len(a)):
-            # Compute differences excluding the i-th element
-            fixed_diffs = np.diff(a[:i] + a[i+1:])
-            if is_safe(fixed_diffs):
-                p2 += 1
-                break
-
-# Print the results for Part 1 and Part 2
-print(p1)
-print(p2)
+    rows, width = levels.shape
+    if width < 3:
+        return np.ones(rows, dtype=bool)
+    result = np.zeros(rows, dtype=bool)
+    positions = np.arange(width)
+    ones = np.ones((rows, 1), dtype=bool)
+    for sign in (1, -1):
+        edges = _edges(levels, lengths, sign)
+        # prefix[:, i]: steps 0..i-2 all safe; suffix[:, i]: steps i+1.. all safe
+        prefix = np.hstack([ones, ones, np.logical_and.accumulate(edges, axis=1)[:, :-1]])
+        suffix = np.hstack([np.logical_and.accumulate(edges[:, ::-1], axis=1)[:, ::-1][:, 1:], ones, ones])
+        bridge = np.hstack([ones, _steps_ok(levels[:, :-2], levels[:, 2:], sign), ones])
+        bridge |= positions + 1 >= lengths[:, None]
+        removable = prefix & suffix & bridge & (positions < lengths[:, None])
+        result |= removable.any(axis=1)
+    # Reports with nothing to remove are trivially safe
+    return result | (lengths <= 2)
+
+
+def _batches(data):
+    levels, lengths = data
+    for start in range(0, len(lengths), BATCH_ROWS):
+        yield levels[start:start + BATCH_ROWS], lengths[start:start + BATCH_ROWS]
+
+
+def part1(data):
+    """Count the reports that are safe as they are."""
+    return sum(int(safe_reports(*batch).sum()) for batch in _batches(data))
+
+
+def part2(data):
+    """Count the reports that are safe after removing at most one level."""
+    return sum(int(dampened_reports(*batch).sum()) for batch in _batches(data))
+
+
+if __name__ == "__main__":
+    # Read the input file and parse it into a padded array of levels
+    with open("Day2/input.txt") as f:
+        data = parse(f.read())
+
+    # Print the results for Part 1 and Part 2
+    print(part1(data))
+    print(part2(data))
@@ -1,142 +1,80 @@
-from collections import defaultdict
-import heapq
+
+from aoc.grid import Grid
+from aoc.search import INF, bfs
+
+WALL, START, END = b"#SE"
+MAX_CHEAT = 20
 
 # Function to read and parse the grid input from a file
 def parse_input(filename):
-    grid = []
     with open(filename, 'r') as file:
-        for line in file:
-            grid.append([char for char in line.strip()])
-    return grid
+        return parse(file.read())
+
+# Function to parse the grid from the puzzle text; the wide margin lets cheats jump without bounds checks
+def parse(text):
+    return Grid.from_text(text, margin=MAX_CHEAT)
 
-# Helper function to check if a coordinate is inside the grid boundaries
-def inside(i, j, N, M):
-    return 0 <= i < N and 0 <= j < M
+# Distance along the track from the start to every cell up to the end (-1 elsewhere)
+def track_costs(grid):
+    cells, offsets, border = grid.cells, grid.orthogonal, grid.border
+
+    def neighbors(index):
+        for offset in offsets:
+            tile = cells[index + offset]
+            if tile != WALL and tile != border:
+                yield index + offset
+
+    end = grid.find(END)
+    result = bfs([grid.find(START)], neighbors, len(cells), goal=lambda index: index == end)
+    return [-1 if cost == INF else cost for cost in result.dist]
 
 # Function to solve the first part of the problem
 def solve1(grid, minsave):
-    N, M = len(grid), len(grid[0])
-    
-    # Initialize start and end positions
-    si, sj, ei, ej = 0, 0, 0, 0
-    for i in range(N):
-        for j in range(M):
-            if grid[i][j] == 'S':
-                si, sj = i, j
-            elif grid[i][j] == 'E':
-                ei, ej = i, j
-
-    # Priority queue for BFS/DFS and visited path tracking
-    h = [(0, si, sj, 0, 0)]
-    path = []
-    cost = {}
-
-    while h:
-        c, i, j, pi, pj = h.pop()
-        
-        # Skip walls
-        if grid[i][j] == "#":
-            continue
-        
-        # Mark this cell as part of the path
-        path.append((i, j))
-        cost[(i, j)] = c
-        
-        # Stop if the end is reached
-        if grid[i][j] == "E":
-            break
-
-        # Check all adjacent cells
-        nxt = [(i + 1, j), (i - 1, j), (i, j + 1), (i, j - 1)]
-        for ni, nj in nxt:
-            if (ni, nj) != (pi, pj):  # Avoid revisiting the previous cell
-                h.append((c + 1, ni, nj, i, j))
-
-    # Calculate potential savings for each path step
-    savings = {}
+    cells = grid.cells
+    cost = track_costs(grid)
+    path = [index for index, c in enumerate(cost) if c >= 0]
+
+    # Count two-step cheats straight through a single wall
     count = 0
-    for i, j in path:
-        nxt = [(i + 2, j), (i - 2, j), (i, j + 2), (i, j - 2)]
-        thru = [(i + 1, j), (i - 1, j), (i, j + 1), (i, j - 1)]
-        
-        for x in range(len(nxt)):
-            ni, nj = nxt[x]
-            ti, tj = thru[x]
-
-            # Skip invalid positions
-            if not inside(ni, nj, N, M) or grid[ni][nj] == '#':
-                continue
-            
-            # Check if we can "save" a step
-            if cost[(ni, nj)] - cost[(i, j)] - 2 >= minsave and grid[ti][tj] == '#':
-                savings[(i, j, ni, nj)] = cost[(ni, nj)] - cost[(i, j)] - 2
+    for offset in grid.orthogonal:
+        for index in path:
+            if cost[index + 2 * offset] - cost[index] - 2 >= minsave and cells[index + offset] == WALL:
                 count += 1
 
-    print(f"Part One - {count}")  # Expected: 1518
+    return count
 
 # Function to solve the second part of the problem
 def solve2(grid, minsave):
-    N, M = len(grid), len(grid[0])
-
-    # Initialize start and end positions
-    si, sj, ei, ej = 0, 0, 0, 0
-    for i in range(N):
-        for j in range(M):
-            if grid[i][j] == 'S':
-                si, sj = i, j
-            elif grid[i][j] == 'E':
-                ei, ej = i, j
-
-    # Priority queue for BFS/DFS and visited path tracking
-    h = [(0, si, sj, 0, 0)]
-    path = []
-    cost = {}
-
-    while h:
-        c, i, j, pi, pj = h.pop()
-        
-        # Skip walls
-        if grid[i][j] == "#":
-            continue
-        
-        # Mark this cell as part of the path
-        path.append((i, j))
-        cost[(i, j)] = c
-        
-        # Stop if the end is reached
-        if grid[i][j] == "E":
-            break
-
-        # Check all adjacent cells
-        nxt = [(i + 1, j), (i - 1, j), (i, j + 1), (i, j - 1)]
-        for ni, nj in nxt:
-            if (ni, nj) != (pi, pj):  # Avoid revisiting the previous cell
-                h.append((c + 1, ni, nj, i, j))
-
-    # Calculate potential savings for each path step
-    savings = {}
+    cost = track_costs(grid)
+    path = [index for index, c in enumerate(cost) if c >= 0]
+
+    # Every jump of Manhattan length 2..20, grouped by length
+    jumps = {}
+    for di in range(-MAX_CHEAT, MAX_CHEAT + 1):
+        for dj in range(-MAX_CHEAT, MAX_CHEAT + 1):
+            step = abs(di) + abs(dj)
+            if 2 <= step <= MAX_CHEAT:
+                jumps.setdefault(step, []).append(grid.offset(di, dj))
+
     count = 0
-    for i, j in path:
-        for step in range(2, 21):  # Loop through different Manhattan distances
-            for di in range(step + 1):
-                dj = step - di
-                nxt = [
-                    (i + di, j + dj), (i + di, j - dj),
-                    (i - di, j + dj), (i - di, j - dj)
-                ]
-                for ni, nj in nxt:
-                    # Skip invalid positions and already visited paths
-                    if not inside(ni, nj, N, M) or grid[ni][nj] == '#' or (i, j, ni, nj) in savings:
-                        continue
-                    
-                    # Check if we can "save" a step
-                    if cost[(ni, nj)] - cost[(i, j)] - step >= minsave:
-                        savings[(i, j, ni, nj)] = cost[(ni, nj)] - cost[(i, j)] - step
-                        count += 1
-
-    print(f"Part Two - {count}")  # Expected: 1032257
+    for index in path:
+        for step, offsets in jumps.items():
+            # A cheat landing on a cell at least this far along the track saves enough
+            needed = cost[index] + step + minsave
+            for offset in offsets:
+                if cost[index + offset] >= needed:
+                    count += 1
+
+    return count
+
+def part1(grid):
+    return solve1(grid, 100)
+
+def part2(grid):
+    return solve2(grid, 100)
 
 # Main code to parse the input file and call the solution functions
-grid = parse_input('Day20/input.txt')
-solve1(grid, 100)
-solve2(grid, 100)
+if __name__ == '__main__':
+    grid = parse_input('Day20/input.txt')
+    print(f"Part One - {solve1(grid, 100)}")
+    print(f"Part Two - {solve2(grid, 100)}")
@@ -1,21 +1,6 @@
 from collections import Counter
-from time import perf_counter as measure_time
 
-def performance_profiler(method):
-    """
-    A decorator to measure and print the execution time of a method.
-    """
-    def timing_wrapper(*args, **kwargs):
-        start_time = measure_time()  # Start the timer
-        
-        # Execute the original method
-        result = method(*args, **kwargs)
-        
-        # Print the execution time
-        print(f"Method {method.__name__} took: {measure_time() - start_time:2.5f} sec")
-        
-        return result  # Return the original method's result
-    return timing_wrapper
+from aoc import profiling
 
 
 def calculate_manhattan_distance(point1, point2):
@@ -88,27 +73,46 @@ def generate_input_sequences(sequence, keypad):
     return current_paths
 
 
-def precalculate_best_paths(direction_keypad):
+def sequence_cost(sequence, keypad, depth, cache):
+    """
+    Count the presses needed to type a sequence on the keypad through the given number of robot levels.
+    """
+    if depth == 0:
+        return len(sequence)
+
+    sequence = 'A' + sequence  # Every robot starts on 'A'
+    total = 0
+    for start, end in zip(sequence, sequence[1:]):
+        key = (start, end, depth)
+        if key not in cache:
+            cache[key] = min(
+                sequence_cost(path + 'A', keypad, depth - 1, cache)
+                for path in find_shortest_paths(keypad[start], keypad[end], keypad)
+            )
+        total += cache[key]
+    return total
+
+
+def precalculate_best_paths(direction_keypad, max_depth=25):
     """
     Pre-calculate optimal paths for all pairs of directions (valid directions: ^, <, v, >, A).
     """
     valid_directions = "^<>vA"
     best_paths = {}
-    
+    cache = {}
+
     # Calculate the best paths between all direction pairs
     for dir1 in valid_directions:
         for dir2 in valid_directions:
             # Find all possible paths between dir1 and dir2
-            paths = [(x, x) for x in find_shortest_paths(
-                direction_keypad[dir1], direction_keypad[dir2], direction_keypad
-            )]
-            
-            # Keep refining the paths until all paths are the same
-            while len(set(x for x, _ in paths)) != 1:
-                paths = find_optimal_sequences(paths, direction_keypad)
-            
-            best_paths[(dir1, dir2)] = paths[0][0]  # Store the best path for the direction pair
-    
+            paths = find_shortest_paths(direction_keypad[dir1], direction_keypad[dir2], direction_keypad)
+
+            # Rank the paths by how many presses they expand to at every robot level
+            best_paths[(dir1, dir2)] = min(paths, key=lambda path: [
+                sequence_cost(path + 'A', direction_keypad, depth, cache)
+                for depth in range(1, max_depth + 1)
+            ])
+
     return best_paths
 
 
@@ -159,10 +163,9 @@ def solve_sequence(sequence, number_keypad, best_paths, iterations):
     return min(sum(seq[0].values()) + 1 for seq in sequences)
 
 
-@performance_profiler
-def solve_day_21(codes):
+def sum_complexities(codes, iterations):
     """
-    Solve the problem for both parts using the provided codes.
+    Sum the complexities of all codes typed through the given number of robot keypads.
     """
     # Create keypad mappings for numbers and directions
     number_keypad = create_keypad_mapping("789,456,123,_0A")
@@ -171,16 +174,35 @@ def solve_day_21(codes):
     # Pre-calculate optimal paths for directions
     best_paths = precalculate_best_paths(direction_keypad)
     
-    # Initialize results for both parts
-    part1 = part2 = 0
-    
-    # Solve for each code and accumulate the results
+    total = 0
     for code in codes:
         multiplier = int(code[:3])
-        part1 += int(multiplier * solve_sequence(code, number_keypad, best_paths, 2))
-        part2 += int(multiplier * solve_sequence(code, number_keypad, best_paths, 25))
+        total += int(multiplier * solve_sequence(code, number_keypad, best_paths, iterations))
+
+    return total
+
+
+@profiling.profile
+def solve_day_21(codes):
+    """
+    Solve the problem for both parts using the provided codes.
+    """
+    return part1(codes), part2(codes)
+
+
+def part1(codes):
+    return sum_complexities(codes, 2)
+
 
-    return part1, part2
+def part2(codes):
+    return sum_complexities(codes, 25)
+
+
+def parse(text):
+    """
+    Return the list of codes from the puzzle text.
+    """
+    return text.strip().splitlines()
 
 
 def parse_input(file_path):
@@ -188,12 +210,13 @@ def parse_input(file_path):
     Parse the input file and return the list of codes.
     """
     with open(file_path, "r") as f:
-        lines = f.read().strip().splitlines()
-    return lines
+        return parse(f.read())
 
 
 if __name__ == "__main__":
+    profiling.enable()
     codes = parse_input("Day21/input.txt")  # Parse the input file
     p1, p2 = solve_day_21(codes)  # Solve both parts
     print(f"Part 1:", p1)
     print(f"Part 2:", p2)
+    print(profiling.format_report())
@@ -1,25 +1,5 @@
-from time import perf_counter as measure_time
 
-def measure_execution_time(function):
-    """
-    This decorator function measures and prints the time taken to execute another function.
-    It wraps the function and prints how long it took to run.
-    """
-    def wrapper(*args, **kwargs):
-        # Start the timer before running the function
-        start_time = measure_time()
-        
-        # Run the function
-        result = function(*args, **kwargs)
-        
-        # Calculate the time it took to run and print it
-        elapsed_time = measure_time() - start_time
-        print(f"Function {function.__name__} executed in {elapsed_time:2.5f} seconds")
-        
-        # Return the result of the function
-        return result
-    
-    return wrapper
+from aoc import profiling
 
 def calculate_secret_number(secret):
     """
@@ -40,7 +20,7 @@ def calculate_secret_number(secret):
 
     return secret
 
-@measure_execution_time
+@profiling.profile
 def part_one(values):
     """
     This function runs the secret number evolution 2000 times for each value,
@@ -54,7 +34,7 @@ def part_one(values):
         total += value
     return total
 
-@measure_execution_time
+@profiling.profile
 def part_two(values):
     """
     This function looks for patterns in the evolution of secret numbers.
@@ -88,17 +68,25 @@ def part_two(values):
     # Return the highest summed value from the patterns
     return max(pattern_values.values())
 
+def parse(text):
+    """
+    This function converts each line of the puzzle text into an integer.
+    """
+    return [int(x) for x in text.strip().splitlines()]
+
 def read_input(file_path):
     """
     This function reads the input values from a file and converts them into a list of integers.
     """
     with open(file_path, "r") as file:
-        lines = file.read().strip().splitlines()
-    
-    # Convert each line into an integer and return as a list
-    return [int(x) for x in lines]
+        return parse(file.read())
+
+part1 = part_one
+part2 = part_two
 
 if __name__ == "__main__":
+    profiling.enable()
+
     # Read the input values from the file
     input_values = read_input("Day22/input.txt")
 
@@ -108,3 +96,5 @@ if __name__ == "__main__":
 
     result_part_two = part_two(input_values)
     print(f"Part 2 Result: {result_part_two}")
+
+    print(profiling.format_report())
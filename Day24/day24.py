@@ -5,10 +5,10 @@ def main(args):
     grid = parse_input('Day24/input.txt')
     
     # Assuming 'grid' is a list of lines, as 'parse' would return values and operations
-    values, operations = parse(grid)
+    values, operations = parse_lines(grid)
 
-    print('Part 1:', part1(values, operations))
-    print('Part 2:', part2(values, operations))
+    print('Part 1:', part1((values, operations)))
+    print('Part 2:', part2((values, operations)))
 
 def parse_input(filename):
     # Function to read the input file
@@ -19,17 +19,23 @@ def parse_input(filename):
 def is_input(operand):
     return operand[0] in 'xy'
 
-def part2(values, operations):
+def part2(data):
+    values, operations = data
     use_map = defaultdict(list)
     for op in operations:
         use_map[op[0]].append(op)
         use_map[op[2]].append(op)
 
+    # The adder's width comes from the input: the lowest input bit and the final carry (top z) are special
+    first_x = min(name for name in values if name[0] == 'x')
+    first_z = min(op[3] for op in operations if op[3][0] == 'z')
+    last_z = max(op[3] for op in operations if op[3][0] == 'z')
+
     swapped = set()
     for operation in operations:
         left, op, right, result = operation
         # Special-case the first and last bits
-        if result == 'z45' or left == 'x00':
+        if result == last_z or first_x in (left, right):
             continue
 
         if op == 'XOR':
@@ -37,12 +43,12 @@ def part2(values, operations):
                 if not is_input(right):
                     swapped.add(result)
                     print(operation, 'only 1 is an input')
-                if result[0] == 'z' and result != 'z00':
+                if result[0] == 'z' and result != first_z:
                     swapped.add(result)
                     print(operation, 'output is a z when using an input')
                 usage = use_map[result]
                 using_ops = [o[1] for o in usage]
-                if result != 'z00' and sorted(using_ops) != ['AND', 'XOR']:
+                if result != first_z and sorted(using_ops) != ['AND', 'XOR']:
                     swapped.add(result)
                     print(operation, 'wrong output ops', usage)
             else:
@@ -76,7 +82,8 @@ def part2(values, operations):
 
     return ','.join(sorted(swapped))
 
-def part1(values, operations):
+def part1(data):
+    values, operations = data
     results = apply_operations(values, operations)
     return sum_zvalues(results)
 
@@ -119,7 +126,10 @@ def sum_zvalues(results):
         result += results[k]
     return result
 
-def parse(lines):
+def parse(text):
+    return parse_lines([line.strip() for line in text.splitlines()])
+
+def parse_lines(lines):
     values = {}
     operations = []
     for line in lines:
@@ -1,22 +1,15 @@
 import itertools
-from time import perf_counter as time_tracker
 
-def measure_performance(function):
-    def wrapper(*args, **kwargs):
-        start_time = time_tracker()
-        
-        result = function(*args, **kwargs)
-        
-        elapsed_time = time_tracker() - start_time
-        print(f"Execution time for {function.__name__}: {elapsed_time:2.5f} seconds")
-        
-        return result
-    return wrapper
+from aoc import profiling
 
 
 def read_input(file_path):
     with open(file_path, "r") as file:
-        lock_data = [section.splitlines() for section in file.read().split("\n\n")]
+        return parse(file.read())
+
+
+def parse(text):
+    lock_data = [section.splitlines() for section in text.split("\n\n")]
     
     return [
         {(col, row) for col, line in enumerate(lock) 
@@ -25,7 +18,7 @@ def read_input(file_path):
     ]
 
 
-@measure_performance
+@profiling.profile
 def solve_part_one(locks):
     no_overlap_pairs = 0
     for pattern_a, pattern_b in itertools.combinations(locks, 2):
@@ -34,7 +27,12 @@ def solve_part_one(locks):
     return no_overlap_pairs
 
 
+part1 = solve_part_one
+
+
 if __name__ == "__main__":
+    profiling.enable()
     lock_patterns = read_input("Day25/input.txt")
     result = solve_part_one(lock_patterns)
     print("Part 1:", result)
+    print(profiling.format_report())
@@ -1,11 +1,5 @@
 import re
 
-filename = 'Day3/input.txt'
-
-# Read the input file
-with open(filename, 'r') as file:
-    data = file.read()
-
 # Part-1: Calculate the sum of products from 'mul(x, y)' patterns
 def calculate_multiplications(text):
     """
@@ -52,10 +46,56 @@ def calculate_multiplications_with_control(text):
 
     return total_product
 
-# Execute Part-1
-part1_result = calculate_multiplications(data)
-print(f"Part 1 Result: {part1_result}")
+# Single pass: one regex for all three tokens, folded into both totals as it streams
+TOKEN = re.compile(r"mul\((\d{1,3}),(\d{1,3})\)|do\(\)|don't\(\)")
+TOKEN_BYTES = re.compile(TOKEN.pattern.encode())
+
+def fold_tokens(matches):
+    """
+    Folds a stream of TOKEN (or TOKEN_BYTES) matches without materializing them.
+
+    Returns:
+        tuple: (sum of all products, products before the first do()/don't(),
+        enabled products after it, the final enabled state or None).
+    """
+    total = leading = enabled = 0
+    state = None
+    for match in matches:
+        if match.lastindex:
+            product = int(match.group(1)) * int(match.group(2))
+            total += product
+            if state is None:
+                leading += product
+            elif state:
+                enabled += product
+        else:
+            # "do()" is the only four-character control token
+            state = match.end() - match.start() == 4
+    return total, leading, enabled, state
+
+def scan(text):
+    """Both parts in one pass: (sum of products, sum of enabled products)."""
+    total, leading, enabled, _ = fold_tokens(TOKEN.finditer(text))
+    return total, leading + enabled
+
+def parse(text):
+    """Scans the corrupted memory once: (sum of products, sum of enabled products)."""
+    return scan(text)
+
+def part1(totals):
+    return totals[0]
+
+def part2(totals):
+    return totals[1]
+
+if __name__ == "__main__":
+    filename = 'Day3/input.txt'
+
+    # Read the input file
+    with open(filename, 'r') as file:
+        data = file.read()
 
-# Execute Part-2
-part2_result = calculate_multiplications_with_control(data)
-print(f"Part 2 Result: {part2_result}")
+    # Execute both parts in a single pass
+    part1_result, part2_result = scan(data)
+    print(f"Part 1 Result: {part1_result}")
+    print(f"Part 2 Result: {part2_result}")
@@ -0,0 +1,64 @@
+"""Compare the two-pass regex solution of Day3 with the single-pass tokenizer.
+
+The input is the puzzle input repeated up to the requested size. Each approach
+is timed best-of-``repeat``, and all of them must agree on both totals.
+"""
+import argparse
+import os
+import sys
+import tempfile
+from time import perf_counter
+
+from day3_01 import calculate_multiplications, calculate_multiplications_with_control, scan
+from day3_parallel import scan_file
+
+
+def two_pass(text):
+    return calculate_multiplications(text), calculate_multiplications_with_control(text)
+
+
+def best_of(function, argument, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = perf_counter()
+        result = function(argument)
+        timings.append(perf_counter() - start)
+    return min(timings), result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--input", default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "input.txt"))
+    parser.add_argument("--mb", type=float, default=16, help="size of the benchmark input in MiB")
+    parser.add_argument("-n", "--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    with open(args.input, "r") as file:
+        seed = file.read()
+    text = seed * max(1, int(args.mb * (1 << 20)) // len(seed))
+    size_mb = len(text) / (1 << 20)
+
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as file:
+        file.write(text)
+    try:
+        approaches = [
+            ("two-pass regex", two_pass, text),
+            ("single pass", scan, text),
+            ("single pass, mmap chunks", lambda path: scan_file(path, jobs=1), file.name),
+        ]
+        expected = None
+        print(f"{'approach':<26} {'best':>10} {'MiB/s':>8}  totals ({size_mb:.1f} MiB input)")
+        for name, function, argument in approaches:
+            elapsed, result = best_of(function, argument, args.repeat)
+            print(f"{name:<26} {elapsed:>9.3f}s {size_mb / elapsed:>8.1f}  {result}")
+            if expected is not None and result != expected:
+                print(f"MISMATCH: {name} disagrees with {approaches[0][0]}", file=sys.stderr)
+                return 1
+            expected = expected or result
+    finally:
+        os.unlink(file.name)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,90 @@
+"""Map-reduce scanner for Day3 over memory dumps too large to read into a string.
+
+The file is memory-mapped and split into chunks that worker processes scan
+independently with the single-pass tokenizer from ``day3_01``. A token is
+decided by the bytes at its start, and no token can start inside another, so a
+chunk scans ``[start, end + OVERLAP)`` and keeps only the matches starting
+before ``end``. Tokens straddling a boundary are then counted exactly once.
+
+A chunk cannot know whether multiplications are enabled when it starts, so it
+returns a ``Summary`` of both cases: the sum if it starts enabled, the sum if
+it starts disabled (they differ only by the products before its first
+``do()``/``don't()``), and the state it leaves behind. The reduce step walks
+the summaries in order and picks one of the sums for each chunk.
+"""
+import argparse
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import takewhile
+from typing import Iterable, List, Optional, Tuple
+
+from day3_01 import TOKEN_BYTES, fold_tokens
+
+# Longest token is "mul(123,456)": a match starting before a chunk's end finishes within this many bytes past it
+OVERLAP = len(b"mul(123,456)") - 1
+
+CHUNK_BYTES = 1 << 26
+
+
+@dataclass
+class Summary:
+    total: int = 0
+    if_enabled: int = 0
+    if_disabled: int = 0
+    final_state: Optional[bool] = None
+
+
+def summarize(buffer, start: int = 0, end: Optional[int] = None) -> Summary:
+    """Summarize the tokens starting in ``buffer[start:end]``."""
+    end = len(buffer) if end is None else end
+    matches = TOKEN_BYTES.finditer(buffer, start, min(end + OVERLAP, len(buffer)))
+    total, leading, enabled, state = fold_tokens(takewhile(lambda match: match.start() < end, matches))
+    # Products before the first control token depend on the state the chunk starts in
+    return Summary(total, leading + enabled, enabled, state)
+
+
+def combine(summaries: Iterable[Summary]) -> Tuple[int, int]:
+    """Reduce chunk summaries, in file order, to the part 1 and part 2 totals."""
+    total = enabled_total = 0
+    enabled = True
+    for summary in summaries:
+        total += summary.total
+        enabled_total += summary.if_enabled if enabled else summary.if_disabled
+        if summary.final_state is not None:
+            enabled = summary.final_state
+    return total, enabled_total
+
+
+def _scan_chunk(path: str, start: int, end: int) -> Summary:
+    with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        return summarize(buffer, start, end)
+
+
+def chunk_bounds(size: int, chunk_bytes: int = CHUNK_BYTES) -> List[Tuple[int, int]]:
+    return [(start, min(start + chunk_bytes, size)) for start in range(0, size, chunk_bytes)]
+
+
+def scan_file(path: str, jobs: Optional[int] = None, chunk_bytes: int = CHUNK_BYTES) -> Tuple[int, int]:
+    """Both parts for the file at ``path``, scanning chunks on ``jobs`` processes (1 scans in-process)."""
+    bounds = chunk_bounds(os.path.getsize(path), chunk_bytes)
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1 or len(bounds) <= 1:
+        summaries = [_scan_chunk(path, start, end) for start, end in bounds]
+    else:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(bounds))) as executor:
+            summaries = list(executor.map(_scan_chunk, [path] * len(bounds), *zip(*bounds)))
+    return combine(summaries)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Day3 over a memory-mapped file, scanned in parallel chunks")
+    parser.add_argument("path", nargs="?", default="Day3/input.txt")
+    parser.add_argument("-j", "--jobs", type=int, help="worker processes (default: core count)")
+    parser.add_argument("--chunk-mb", type=float, default=CHUNK_BYTES / (1 << 20), help="bytes per chunk, in MiB")
+    args = parser.parse_args()
+
+    part1_result, part2_result = scan_file(args.path, args.jobs, max(1, int(args.chunk_mb * (1 << 20))))
+    print(f"Part 1 Result: {part1_result}")
+    print(f"Part 2 Result: {part2_result}")
@@ -1,56 +1,113 @@
-def check_word(grid, x, y, dx, dy, word, rows, cols):
-    for i in range(len(word)):
-        nx = x + i * dx
-        ny = y + i * dy
-        if nx < 0 or ny < 0 or nx >= rows or ny >= cols or grid[nx][ny] != word[i]:
-            return False
-    return True
-
-def count_xmas(grid, rows, cols):
-    target_word = "XMAS"
-    directions = [
-        (0, 1),   # Right
-        (1, 0),   # Down
-        (1, 1),   # Diagonal-right-down
-        (1, -1),  # Diagonal-left-down
-        (0, -1),  # Left
-        (-1, 0),  # Up
-        (-1, -1), # Diagonal-left-up
-        (-1, 1)   # Diagonal-right-up
-    ]
-
-    count = 0
-    for r in range(rows):
-        for c in range(cols):
-            for dx, dy in directions:
-                if check_word(grid, r, c, dx, dy, target_word, rows, cols):
-                    count += 1
-    return count
-
-def count_all_xmas_patterns(grid, rows, cols):
-    count = 0
-    for r in range(1, rows - 1):
-        for c in range(1, cols - 1):
-            center = grid[r][c]
-            top_left = grid[r - 1][c - 1]
-            top_right = grid[r - 1][c + 1]
-            bottom_left = grid[r + 1][c - 1]
-            bottom_right = grid[r + 1][c + 1]
-
-            if center == 'A':
-                # Pattern 1: M.S
-                if top_left == 'M' and top_right == 'S' and bottom_left == 'M' and bottom_right == 'S':
-                    count += 1
-                # Pattern 2: S.M
-                if top_left == 'S' and top_right == 'M' and bottom_left == 'S' and bottom_right == 'M':
-                    count += 1
-                # Pattern 3: M.M
-                if top_left == 'M' and top_right == 'M' and bottom_left == 'S' and bottom_right == 'S':
-                    count += 1
-                # Pattern 4: S.S
-                if top_left == 'S' and top_right == 'S' and bottom_left == 'M' and bottom_right == 'M':
-                    count += 1
-    return count
+import numpy as np
+
+# (row step, column step) of every reading direction
+DIRECTIONS = [
+    (0, 1),   # Right
+    (1, 0),   # Down
+    (1, 1),   # Diagonal-right-down
+    (1, -1),  # Diagonal-left-down
+    (0, -1),  # Left
+    (-1, 0),  # Up
+    (-1, -1), # Diagonal-left-up
+    (-1, 1)   # Diagonal-right-up
+]
+
+class LetterBits:
+    """Bit-packed letter masks of a grid: one bit per cell, 64 columns per uint64 word.
+
+    Shifted copies are built on demand and memoized, so every comparison of a
+    search is a bitwise AND over rows x ceil(cols / 64) words instead of a
+    comparison per cell.
+    """
+
+    def __init__(self, grid):
+        self.grid = grid
+        self.rows, self.cols = grid.shape
+        self._masks = {}
+
+    def mask(self, letter, shift=0):
+        """Bits set where ``grid[r, c + shift] == letter`` (columns past the edge read as unset)."""
+        key = (letter, shift)
+        if key not in self._masks:
+            if shift == 0:
+                packed = np.packbits(self.grid == ord(letter), axis=1, bitorder="little")
+                packed = np.pad(packed, ((0, 0), (0, -packed.shape[1] % 8)))
+                self._masks[key] = packed.view("<u8")
+            else:
+                self._masks[key] = _shift_columns(self.mask(letter), shift)
+        return self._masks[key]
+
+def _shift_columns(bits, shift):
+    """Move column ``c + shift`` to column ``c`` in little-endian packed rows."""
+    words, shift = divmod(shift, 64)
+    shifted = np.zeros_like(bits)
+    shifted[:, :bits.shape[1] - words] = bits[:, words:]
+    if shift:
+        carry = shifted[:, 1:] << np.uint64(64 - shift)
+        shifted >>= np.uint64(shift)
+        shifted[:, :-1] |= carry
+    return shifted
+
+if hasattr(np, "bitwise_count"):
+    def _count_bits(bits):
+        return int(np.bitwise_count(bits).sum(dtype=np.int64))
+else:
+    # numpy < 2.0 has no bitwise_count: look up the set bits of every byte instead
+    _BYTE_BITS = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1).sum(axis=1, dtype=np.uint8)
+
+    def _count_bits(bits):
+        return int(_BYTE_BITS[np.ascontiguousarray(bits).view(np.uint8)].sum(dtype=np.int64))
+
+def match_window(bits, cells, height=None):
+    """Bits set at the windows whose ``(row, column, letter)`` cells all match.
+
+    Offsets are relative to the window's top-left corner and non-negative, and
+    the result has a row for every window ``height`` rows tall (by default just
+    tall enough for the cells) that fits in the grid.
+    """
+    height = height or max(row for row, _, _ in cells) + 1
+    if height > bits.rows:
+        return np.zeros((0, 0), dtype="<u8")
+    result = None
+    for row, column, letter in cells:
+        rows = bits.mask(letter, column)[row:row + bits.rows - height + 1]
+        result = rows.copy() if result is None else np.bitwise_and(result, rows, out=result)
+    return result
+
+def word_cells(word, dx, dy):
+    """Window cells of ``word`` read in direction ``(dx, dy)``, shifted to non-negative offsets."""
+    last = len(word) - 1
+    top, left = min(0, last * dx), min(0, last * dy)
+    return [(i * dx - top, i * dy - left, letter) for i, letter in enumerate(word)]
+
+def count_word(bits, word):
+    """Occurrences of ``word`` in all 8 directions (palindromes count once per direction)."""
+    return sum(_count_bits(match_window(bits, word_cells(word, dx, dy))) for dx, dy in DIRECTIONS)
+
+def count_xmas(grid, target_word="XMAS"):
+    return count_word(LetterBits(grid), target_word)
+
+def count_all_xmas_patterns(grid):
+    """Count the 3x3 windows with an A in the middle and M-A-S read forwards or backwards on both diagonals."""
+    bits = LetterBits(grid)
+    centers = match_window(bits, [(1, 1, "A")], height=3)
+    # Each diagonal holds M and S at its ends, in either order
+    falling = match_window(bits, [(0, 0, "M"), (2, 2, "S")]) | match_window(bits, [(0, 0, "S"), (2, 2, "M")])
+    rising = match_window(bits, [(0, 2, "M"), (2, 0, "S")]) | match_window(bits, [(0, 2, "S"), (2, 0, "M")])
+    return _count_bits(centers & falling & rising)
+
+def parse(text):
+    """Load the letter grid as a 2D uint8 array."""
+    lines = text.split()
+    if not lines:
+        return np.zeros((0, 0), dtype=np.uint8)
+    return np.frombuffer("".join(lines).encode(), dtype=np.uint8).reshape(len(lines), -1)
+
+def part1(grid):
+    return count_xmas(grid)
+
+def part2(grid):
+    return count_all_xmas_patterns(grid)
 
 def main():
     file_path = "Day4/input.txt"
@@ -58,20 +115,17 @@ def main():
     # Read the grid from the file
     try:
         with open(file_path, 'r') as file:
-            grid = [line.strip() for line in file]
+            grid = parse(file.read())
     except FileNotFoundError:
         print("Error: Unable to open file.")
         return
 
-    rows = len(grid)
-    cols = len(grid[0]) if rows > 0 else 0
-
     # Count occurrences of "XMAS"
-    xmas_count = count_xmas(grid, rows, cols)
+    xmas_count = part1(grid)
     print(f"Count of XMAS: {xmas_count}")
 
     # Count all X-MAS patterns
-    xmas_patterns = count_all_xmas_patterns(grid, rows, cols)
+    xmas_patterns = part2(grid)
     print(f"Total X-MAS patterns: {xmas_patterns}")
 
 if __name__ == "__main__":
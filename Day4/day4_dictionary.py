@@ -0,0 +1,131 @@
+"""Count every word of a dictionary in a Day4 grid, in all 8 directions at once.
+
+The words are compiled into one Aho-Corasick automaton with a dense transition
+table, so scanning a line costs one table lookup per cell no matter how many
+words there are. Reading a line backwards finds the same occurrences as reading
+it forwards with the reversed words, so every word is added twice (once per
+direction; a palindrome therefore counts twice, like ``count_word``) and only
+the four line families are scanned forwards: rows, columns and both diagonal
+families. All lines of a family advance together, one vectorized lookup per
+position. The automaton records how often each state is visited, and the
+visits are then summed up the failure links, which gives the occurrences of
+every word from one pass.
+"""
+import argparse
+from collections import deque
+
+import numpy as np
+
+from day4_01 import parse
+
+# Positions scanned between two tallies of the visited states
+BLOCK_POSITIONS = 64
+
+
+class Automaton:
+    """Aho-Corasick automaton over the letters used by ``words``; other bytes reset it to the root."""
+
+    def __init__(self, words):
+        self.words = list(dict.fromkeys(word for word in words if word))
+        letters = sorted({byte for word in self.words for byte in word.encode()})
+        # Class 0 is every byte outside the dictionary's alphabet
+        self.classes = np.zeros(256, dtype=np.uint16)
+        self.classes[letters] = np.arange(1, len(letters) + 1)
+
+        children = [{}]
+        self.ends = []
+        for word in self.words:
+            ends = []
+            for spelling in (word, word[::-1]):
+                state = 0
+                for letter in self.classes[list(spelling.encode())]:
+                    if letter not in children[state]:
+                        children[state][letter] = len(children)
+                        children.append({})
+                    state = children[state][letter]
+                ends.append(state)
+            self.ends.append(ends)
+
+        self.fail = np.zeros(len(children), dtype=np.int64)
+        self.delta = np.zeros((len(children), len(letters) + 1), dtype=np.int32)
+        self.order = []
+        queue = deque([0])
+        while queue:
+            state = queue.popleft()
+            self.order.append(state)
+            if state:
+                self.delta[state] = self.delta[self.fail[state]]
+            for letter, child in children[state].items():
+                self.fail[child] = self.delta[state, letter] if state else 0
+                self.delta[state, letter] = child
+                queue.append(child)
+        # The class 0 column stays all zeros: a byte outside the alphabet always returns to the root
+
+    def visits(self, lines):
+        """Visit counts of every state after scanning each column of ``lines`` (positions x lines of classes)."""
+        counts = np.zeros(len(self.delta), dtype=np.int64)
+        states = np.zeros(lines.shape[1], dtype=np.int32)
+        block = np.empty((BLOCK_POSITIONS, lines.shape[1]), dtype=np.int32)
+        for start in range(0, lines.shape[0], BLOCK_POSITIONS):
+            stop = min(start + BLOCK_POSITIONS, lines.shape[0])
+            for offset, position in enumerate(range(start, stop)):
+                states = self.delta[states, lines[position]]
+                block[offset] = states
+            counts += np.bincount(block[:stop - start].ravel(), minlength=len(counts))
+        return counts
+
+    def occurrences(self, visits):
+        """Occurrences of each word, both spellings, given the visit counts of a scan."""
+        totals = visits.copy()
+        # Every match of a state's longest word is also a match of all words along its failure chain
+        for state in reversed(self.order[1:]):
+            totals[self.fail[state]] += totals[state]
+        return {word: int(totals[forward] + totals[backward])
+                for word, (forward, backward) in zip(self.words, self.ends)}
+
+
+def _skew(classes, rising=False):
+    """Lay the diagonals of ``classes`` out as columns, padded with class 0 at both ends."""
+    rows, cols = classes.shape
+    skewed = np.zeros((rows, rows + cols - 1), dtype=classes.dtype)
+    for r in range(rows):
+        offset = rows - 1 - r if rising else r
+        skewed[r, offset:offset + cols] = classes[r]
+    return skewed
+
+
+def line_families(classes):
+    """Rows, columns, falling and rising diagonals, each as a positions x lines array."""
+    yield classes.T
+    yield classes
+    yield _skew(classes)
+    yield _skew(classes, rising=True)
+
+
+def count_words(grid, words):
+    """Occurrences of each of ``words`` in ``grid`` (a uint8 letter array) in all 8 directions."""
+    automaton = Automaton(words)
+    classes = automaton.classes[grid]
+    visits = sum(automaton.visits(family) for family in line_families(classes))
+    return automaton.occurrences(visits)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Day4 word search for a whole dictionary")
+    parser.add_argument("words", nargs="*", help="words to count (default: XMAS)")
+    parser.add_argument("--grid", default="Day4/input.txt", help="letter grid to search")
+    parser.add_argument("--dictionary", help="file with one word per line, added to the words")
+    parser.add_argument("--top", type=int, default=20, help="most frequent words to print")
+    args = parser.parse_args()
+
+    words = list(args.words)
+    if args.dictionary:
+        with open(args.dictionary) as file:
+            words.extend(line.strip() for line in file if line.strip())
+    with open(args.grid) as file:
+        grid = parse(file.read())
+
+    counts = count_words(grid, words or ["XMAS"])
+    for word, count in sorted(counts.items(), key=lambda item: -item[1])[:args.top]:
+        print(f"{word}: {count}")
+    print(f"Total: {sum(counts.values())} occurrences of {len(counts)} words")
@@ -1,5 +1,11 @@
 import os
 from collections import defaultdict, deque
+from functools import cmp_to_key
+
+import numpy as np
+
+# Rule lookups per vectorized validation batch (updates x page pairs); keeps the temporaries small
+BATCH_LOOKUPS = 1 << 22
 
 def split(string, delimiter):
     """Splits a string by the given delimiter."""
@@ -9,28 +15,87 @@ def trim(string):
     """Trims whitespace from both ends of the string."""
     return string.strip()
 
-def is_update_ordered(update, rules):
-    """Checks if an update is ordered according to the rules."""
-    index_map = {value: idx for idx, value in enumerate(update)}
-    for x, y in rules:
-        if x in index_map and y in index_map:
-            if index_map[x] > index_map[y]:
-                return False
+class RuleIndex:
+    """Ordering rules indexed once: the set of (before, after) pairs, each page's successors
+    and a dense "must precede" matrix over the pages the rules mention (also packed as bitsets).
+    """
+
+    def __init__(self, rules):
+        self.pairs = set(rules)
+        self.successors = defaultdict(set)
+        for x, y in self.pairs:
+            self.successors[x].add(y)
+
+        pairs = np.array(sorted(self.pairs), dtype=np.int64).reshape(-1, 2)
+        self.pages = np.unique(pairs)
+        # The extra last id stands for every page no rule mentions (and for padding)
+        self.matrix = np.zeros((len(self.pages) + 1, len(self.pages) + 1), dtype=bool)
+        self.matrix[self.ids(pairs[:, 0]), self.ids(pairs[:, 1])] = True
+
+        # The same relation as bitsets of 64 pages per word, for checking against many pages at once
+        ids = np.arange(len(self.pages))
+        self.page_bits = np.zeros((len(self.pages) + 1, len(self.pages) // 64 + 1), dtype=np.uint64)
+        self.page_bits[ids, ids // 64] = np.left_shift(np.uint64(1), (ids % 64).astype(np.uint64))
+        successor_bits = np.packbits(self.matrix, axis=1, bitorder="little")
+        successor_bits = np.pad(successor_bits, ((0, 0), (0, self.page_bits.shape[1] * 8 - successor_bits.shape[1])))
+        self.successor_bits = successor_bits.view("<u8")
+
+    def ids(self, pages):
+        """Matrix ids of page numbers."""
+        pages = np.asarray(pages, dtype=np.int64)
+        ids = np.searchsorted(self.pages, pages)
+        known = ids < len(self.pages)
+        known[known] = self.pages[ids[known]] == pages[known]
+        return np.where(known, ids, len(self.pages))
+
+    def compare(self, x, y):
+        """Comparator for ``cmp_to_key``: pages without a rule between them compare equal."""
+        if (x, y) in self.pairs:
+            return -1
+        if (y, x) in self.pairs:
+            return 1
+        return 0
+
+def is_update_ordered(update, index):
+    """Checks if an update is ordered according to the rules, in O(k^2) set lookups."""
+    for i, later in enumerate(update):
+        if not index.successors[later].isdisjoint(update[:i]):
+            return False
     return True
 
-def topological_sort_update(update, rules):
+def ordered_updates(updates, index):
+    """Checks every update at once: no page may come after a page the matrix says it must precede."""
+    if not updates:
+        return np.zeros(0, dtype=bool)
+    lengths = np.array([len(update) for update in updates], dtype=np.int64)
+    width = int(lengths.max())
+    ids = np.full((len(updates), width), len(index.pages), dtype=np.int64)
+    ids[np.arange(width) < lengths[:, None]] = index.ids([page for update in updates for page in update])
+
+    # An adjacent pair in the wrong order settles most updates with one lookup per page
+    ordered = ~index.matrix[ids[:, 1:], ids[:, :-1]].any(axis=1)
+
+    # The rules need not be transitive, so the rest are checked against every earlier page: a running
+    # bitset of the pages seen so far must not meet the successors of the next page
+    candidates = np.flatnonzero(ordered)
+    words = index.successor_bits.shape[1]
+    batch = max(1, BATCH_LOOKUPS // (width * words))
+    for start in range(0, len(candidates), batch):
+        rows = ids[candidates[start:start + batch]]
+        seen = np.bitwise_or.accumulate(index.page_bits[rows], axis=1)
+        ordered[candidates[start:start + batch]] = ~(index.successor_bits[rows[:, 1:]] & seen[:, :-1]).any(axis=(1, 2))
+    return ordered
+
+def topological_sort_update(update, index):
     """Performs topological sorting on the update according to the rules."""
-    graph = defaultdict(list)
-    in_degree = defaultdict(int)
     nodes = set(update)
+    graph = {node: index.successors[node] & nodes for node in nodes}
+    in_degree = {node: 0 for node in nodes}
+    for successors in graph.values():
+        for successor in successors:
+            in_degree[successor] += 1
 
-    for x, y in rules:
-        if x in nodes and y in nodes:
-            graph[x].append(y)
-            in_degree[y] += 1
-            in_degree.setdefault(x, 0)
-
-    queue = deque([node for node in nodes if in_degree[node] == 0])
+    queue = deque([node for node in update if in_degree[node] == 0])
     sorted_update = []
 
     while queue:
@@ -46,24 +111,67 @@ def topological_sort_update(update, rules):
         return []  # Cycle detected or unable to sort
     return sorted_update
 
-def get_middle_page(update):
-    """Gets the middle page of an update."""
-    return update[len(update) // 2]
+def repair_update(update, index):
+    """Reorders an update with a comparator sort, falling back to a topological sort.
 
-def main():
-    file_path = "Day5/input.txt"
+    The comparator only gives a valid order when the rules rank every pair of
+    pages in the update (as they do in the puzzle input); otherwise the
+    topological sort handles partial orders and reports cycles.
+    """
+    repaired = sorted(update, key=cmp_to_key(index.compare))
+    if is_update_ordered(repaired, index):
+        return repaired
+    return topological_sort_update(update, index)
 
-    if not os.path.exists(file_path):
-        print(f"Error: Unable to open the file {file_path}")
-        return
+def cycle_members(update, index):
+    """Pages of an update that lie on a rule cycle, grouped by strongly connected component (Tarjan)."""
+    nodes = set(update)
+    graph = {node: sorted(index.successors[node] & nodes) for node in nodes}
+    order, low, stack, on_stack = {}, {}, [], set()
+    components = []
+
+    def visit(node):
+        order[node] = low[node] = len(order)
+        stack.append(node)
+        on_stack.add(node)
+        work.append((node, iter(graph[node])))
+
+    for root in update:
+        if root in order:
+            continue
+        work = []
+        visit(root)
+        while work:
+            node, successors = work[-1]
+            for successor in successors:
+                if successor not in order:
+                    visit(successor)
+                    break
+                if successor in on_stack:
+                    low[node] = min(low[node], order[successor])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+                if low[node] == order[node]:
+                    component = []
+                    while not component or component[-1] != node:
+                        component.append(stack.pop())
+                        on_stack.discard(component[-1])
+                    if len(component) > 1 or node in graph[node]:
+                        components.append(component[::-1])
+    return components
 
-    with open(file_path, "r") as file:
-        content = trim(file.read())
+def get_middle_page(update):
+    """Gets the middle page of an update."""
+    return update[len(update) // 2]
 
-    sections = split(content, "\n\n")
+def parse(text):
+    """Parses the rules and updates sections of the input."""
+    sections = split(trim(text), "\n\n")
     if len(sections) != 2:
-        print("Invalid input format. Expected two sections separated by two newlines.")
-        return
+        raise ValueError("Invalid input format. Expected two sections separated by two newlines.")
 
     rules_section, updates_section = sections
 
@@ -82,30 +190,55 @@ def main():
         except ValueError:
             print(f"Invalid update format: {update_line}")
 
-    correct_updates = []
-    middle_pages = []
+    # Both parts need to know which updates are ordered; check them all once here
+    index = RuleIndex(rules)
+    return index, updates, ordered_updates(updates, index).tolist()
 
-    for update in updates:
-        if is_update_ordered(update, rules):
-            correct_updates.append(update)
+def part1(data):
+    """Sums the middle pages of the correctly ordered updates."""
+    _, updates, ordered = data
+
+    middle_pages = []
+    for update, is_ordered in zip(updates, ordered):
+        if is_ordered:
             middle_pages.append(get_middle_page(update))
 
-    sum_middle_pages = sum(middle_pages)
-    print(f"Sum of middle pages for correctly ordered updates: {sum_middle_pages}")
+    return sum(middle_pages)
 
-    incorrect_updates = []
-    incorrect_middle_pages = []
+def part2(data):
+    """Sums the middle pages of the incorrectly ordered updates after sorting them."""
+    index, updates, ordered = data
 
-    for update in updates:
-        if not is_update_ordered(update, rules):
-            corrected_update = topological_sort_update(update, rules)
+    incorrect_middle_pages = []
+    for update, is_ordered in zip(updates, ordered):
+        if not is_ordered:
+            corrected_update = repair_update(update, index)
             if not corrected_update:
-                print("Cycle detected or unable to sort update:", ", ".join(map(str, update)))
+                cycles = "; ".join(", ".join(map(str, component)) for component in cycle_members(update, index))
+                print(f"Cycle detected in update {','.join(map(str, update))}: pages on a cycle: {cycles}")
                 continue
-            incorrect_updates.append(corrected_update)
             incorrect_middle_pages.append(get_middle_page(corrected_update))
 
-    sum_incorrect_middle_pages = sum(incorrect_middle_pages)
+    return sum(incorrect_middle_pages)
+
+def main():
+    file_path = "Day5/input.txt"
+
+    if not os.path.exists(file_path):
+        print(f"Error: Unable to open the file {file_path}")
+        return
+
+    with open(file_path, "r") as file:
+        try:
+            data = parse(file.read())
+        except ValueError as e:
+            print(e)
+            return
+
+    sum_middle_pages = part1(data)
+    print(f"Sum of middle pages for correctly ordered updates: {sum_middle_pages}")
+
+    sum_incorrect_middle_pages = part2(data)
     print(f"Sum of middle pages for corrected updates: {sum_incorrect_middle_pages}")
 
 if __name__ == "__main__":
@@ -30,7 +30,10 @@ def parse_grid(file_path: str) -> List[List[str]]:
         raise FileNotFoundError(f"Unable to open file: {file_path}")
 
     with open(file_path, 'r') as file:
-        grid = [list(trim(line)) for line in file if trim(line)]
+        return grid_from_lines(file)
+
+def grid_from_lines(lines) -> List[List[str]]:
+    grid = [list(trim(line)) for line in lines if trim(line)]
 
     if not grid:
         raise ValueError("The grid is empty.")
@@ -85,6 +88,9 @@ def simulate_movement(grid: List[List[str]], start_pos: Position, start_dir: int
             r, c = new_r, new_c
 
 def count_distinct_positions_visited(grid: List[List[str]], guard_pos: Position, guard_dir: int) -> int:
+    return len(positions_visited(grid, guard_pos, guard_dir))
+
+def positions_visited(grid: List[List[str]], guard_pos: Position, guard_dir: int) -> Set[Position]:
     visited_positions: Set[Position] = {guard_pos}
 
     current_pos = guard_pos
@@ -104,7 +110,29 @@ def count_distinct_positions_visited(grid: List[List[str]], guard_pos: Position,
             current_pos = Position(new_r, new_c)
             visited_positions.add(current_pos)
 
-    return len(visited_positions)
+    return visited_positions
+
+def count_loop_obstructions(grid: List[List[str]], guard_pos: Position, guard_dir: int) -> int:
+    # Only an obstruction on the guard's original path can change where it walks
+    count = 0
+    for position in positions_visited(grid, guard_pos, guard_dir) - {guard_pos}:
+        grid[position.row][position.col] = '#'
+        try:
+            count += simulate_movement(grid, guard_pos, guard_dir)
+        finally:
+            grid[position.row][position.col] = '.'
+    return count
+
+def parse(text: str) -> Tuple[List[List[str]], Position, int]:
+    grid = grid_from_lines(text.splitlines())
+    guard_pos, guard_dir = find_guard(grid)
+    return grid, guard_pos, guard_dir
+
+def part1(data) -> int:
+    return count_distinct_positions_visited(*data)
+
+def part2(data) -> int:
+    return count_loop_obstructions(*data)
 
 # Example Usage
 if __name__ == "__main__":
@@ -18,7 +18,8 @@ class Solution:
         self.starting_position = D6Point(0, 0)
         self.height = len(input_lines)
         self.width = len(input_lines[0])
-        self.visited = 0
+        # The start cell counts as visited, which also keeps an obstruction from being placed on it
+        self.visited = 1
         self.possible_obstructions = 0
         self.obstruction_map = {}
 
@@ -32,6 +33,7 @@ class Solution:
                 if cell_type == "^":
                     self.starting_position = point
                     point.type = "."
+                    point.visited = True
 
     def is_out_of_bounds(self, point: D6Point):
         return point.x < 0 or point.x >= self.width or point.y < 0 or point.y >= self.height
@@ -129,23 +131,27 @@ class Solution:
             position, direction = moved
             moved = self.move(position, direction)
 
-        print("Start:", vars(self.starting_position))
-        print("Obstacle on start:", self.get_key(self.starting_position) in self.obstruction_map)
-
-        if self.get_key(self.starting_position) in self.obstruction_map:
-            self.possible_obstructions -= 1
-            print("Reduced 1 from possible obstructions")
-
-        print("Part 1:", self.visited)
-        print("Part 2:", self.possible_obstructions)
+        return self.visited, self.possible_obstructions
 
 # Function to read input from a file
 def read_input_file(file_path):
     with open(file_path, 'r') as file:
-        return [line.strip() for line in file.readlines()]
+        return parse(file.read())
+
+def parse(text):
+    return [line.strip() for line in text.splitlines()]
+
+def part1(input_lines):
+    return Solution(input_lines).solve()[0]
+
+def part2(input_lines):
+    return Solution(input_lines).solve()[1]
 
 # Example usage
-file_path = 'Day6/input.txt'  # Specify your input file path here
-input_lines = read_input_file(file_path)
-solution = Solution(input_lines)
-solution.solve()
+if __name__ == "__main__":
+    file_path = 'Day6/input.txt'  # Specify your input file path here
+    input_lines = read_input_file(file_path)
+    solution = Solution(input_lines)
+    visited, possible_obstructions = solution.solve()
+    print("Part 1:", visited)
+    print("Part 2:", possible_obstructions)
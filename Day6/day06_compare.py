@@ -0,0 +1,87 @@
+"""Run the Day6 engines side by side on generated maps and check that they agree.
+
+Every engine is a module with the same ``parse(text)``, ``part1(data)`` and
+``part2(data)`` interface as the registry expects. For each map all engines must
+give the same answers, and the report shows each engine's time (a plain run)
+and peak traced memory (a second run under ``tracemalloc``), so a faster engine
+can replace the registered one once it has agreed everywhere.
+"""
+import argparse
+import os
+import tracemalloc
+from time import perf_counter
+
+import day06_01
+import day06_02
+import day06_jump
+import day06_parallel
+from aoc.generators import generate
+from aoc.registry import ROOT
+from aoc.runner import format_duration
+
+ENGINES = {
+    "step": day06_01,
+    "objects": day06_02,
+    "jump": day06_jump,
+    "parallel": day06_parallel,
+}
+
+
+def solve(engine, text):
+    data = engine.parse(text)
+    return engine.part1(data), engine.part2(data)
+
+
+def measure(engine, text):
+    """Answers, wall time and peak traced memory (KiB) of one engine on one map."""
+    start = perf_counter()
+    answers = solve(engine, text)
+    elapsed = perf_counter() - start
+    tracemalloc.start()
+    try:
+        solve(engine, text)
+        peak = tracemalloc.get_traced_memory()[1] / 1024
+    finally:
+        tracemalloc.stop()
+    return answers, elapsed, peak
+
+
+def maps(scales, seeds, path=None):
+    """``(scale, seed, text)`` of every map to compare, starting with the real input at ``path`` if given."""
+    if path:
+        with open(path) as file:
+            yield "input", "-", file.read()
+    for scale in scales:
+        for seed in range(seeds):
+            yield scale, seed, generate(6, scale, seed)
+
+
+def compare(names, scales, seeds, path=None):
+    """Yield one report line per map and engine; raises AssertionError on the first disagreement."""
+    for scale, seed, text in maps(scales, seeds, path):
+        expected = None
+        for name in names:
+            answers, elapsed, peak = measure(ENGINES[name], text)
+            if expected is None:
+                expected = (names[0], answers)
+            assert answers == expected[1], (f"{name} gives {answers} but {expected[0]} gives {expected[1]} "
+                                            f"on the map with scale {scale} and seed {seed}")
+            yield (f"{scale:>6} {seed:>4} {name:<9} {format_duration(elapsed):>10} {peak:>10.0f} KiB  "
+                   f"{answers[0]}, {answers[1]}")
+
+
+if __name__ == "__main__":
+    default_input = os.path.join(ROOT, "Day6", "input.txt")
+    parser = argparse.ArgumentParser(description="Differential test and benchmark of the Day6 engines")
+    parser.add_argument("--engines", nargs="+", choices=sorted(ENGINES), default=list(ENGINES))
+    # Generated maps have the real input's obstacle density; scale 1 is the real input's size
+    parser.add_argument("--scales", nargs="+", type=float, default=[1.0, 4.0])
+    parser.add_argument("--seeds", type=int, default=3, help="maps generated per scale")
+    parser.add_argument("--input", default=default_input if os.path.exists(default_input) else None,
+                        help="real puzzle input compared first (default: Day6/input.txt when present)")
+    args = parser.parse_args()
+
+    print(f"{'scale':>6} {'seed':>4} {'engine':<9} {'time':>10} {'peak':>14}  answers")
+    for line in compare(args.engines, args.scales, args.seeds, args.input):
+        print(line)
+    print("All engines agree.")
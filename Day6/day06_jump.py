@@ -0,0 +1,163 @@
+"""Day6 guard simulation on a jump table instead of single steps.
+
+For every cell and heading the table stores the last free cell before the next
+obstacle (or ``EXIT`` when the guard would walk off the map), so a whole
+straight run is one lookup. A guard state is the integer ``cell * 4 +
+heading`` and loop detection marks states in a bytearray, clearing only the
+entries it set. An extra obstruction only changes the runs that cross it: a
+jump is patched on the fly when the obstruction lies between the guard and
+the stop the table gives, which leaves the shared table untouched.
+"""
+from array import array
+
+from aoc.grid import Grid
+
+OBSTACLE, FREE = b"#."
+UP, RIGHT, DOWN, LEFT = range(4)
+HEADINGS = {ord("^"): UP, ord(">"): RIGHT, ord("v"): DOWN, ord("<"): LEFT}
+EXIT = -1
+
+
+def _next_blocked(blocked):
+    """Column of the first blocked cell strictly right of each cell (the width when there is none)."""
+    import numpy as np
+
+    height, width = blocked.shape
+    columns = np.where(blocked, np.arange(width), width)
+    nearest = np.minimum.accumulate(columns[:, ::-1], axis=1)[:, ::-1]
+    return np.hstack([nearest[:, 1:], np.full((height, 1), width)])
+
+
+class Lab:
+    """The lab map as a padded ``Grid``, the guard's start state and the jump table."""
+
+    __slots__ = ("grid", "start", "stops", "seen")
+
+    def __init__(self, grid: Grid, start: int, stops=None):
+        self.grid = grid
+        self.start = start
+        # A prebuilt table (any sequence of ints, e.g. a view of shared memory) skips the numpy sweeps
+        self.stops = self._jump_table() if stops is None else stops
+        self.seen = bytearray(len(self.stops))
+
+    @classmethod
+    def from_text(cls, text: str) -> "Lab":
+        grid = Grid.from_text(text)
+        for symbol, heading in HEADINGS.items():
+            cell = grid.find(symbol)
+            if cell >= 0:
+                grid[cell] = FREE
+                return cls(grid, cell * 4 + heading)
+        raise ValueError("Guard not found in the grid.")
+
+    def _jump_table(self) -> array:
+        # Imported here so loading the module, and workers handed a prebuilt table, do not pay for numpy
+        import numpy as np
+
+        cells = self.grid.to_numpy(padded=True)
+        rows, cols = cells.shape
+        blocked = (cells == OBSTACLE) | (cells == self.grid.border)
+        row_numbers, col_numbers = np.indices(cells.shape)
+        # Row and column of the cell that stops each heading, in the order of grid.orthogonal
+        blockers = [
+            (rows - 1 - _next_blocked(blocked[::-1].T).T[::-1], col_numbers),
+            (row_numbers, _next_blocked(blocked)),
+            (_next_blocked(blocked.T).T, col_numbers),
+            (row_numbers, cols - 1 - _next_blocked(blocked[:, ::-1])[:, ::-1]),
+        ]
+        stops = np.empty((cells.size, 4), dtype=np.int64)
+        for heading, ((blocker_rows, blocker_cols), step) in enumerate(zip(blockers, self.grid.orthogonal)):
+            blocker = np.clip(blocker_rows, 0, rows - 1) * cols + np.clip(blocker_cols, 0, cols - 1)
+            stops[:, heading] = np.where(cells.ravel()[blocker.ravel()] == OBSTACLE, blocker.ravel() - step, EXIT)
+        return array("q", stops.ravel().tobytes())
+
+    def jump(self, state: int, obstruction: int = EXIT) -> int:
+        """Cell where the guard stops before the next obstacle, taking an extra ``obstruction`` into account."""
+        stop = self.stops[state]
+        if obstruction == EXIT:
+            return stop
+        cell, heading = state >> 2, state & 3
+        step, stride = self.grid.orthogonal[heading], self.grid.stride
+        ahead = obstruction - cell
+        # Horizontal runs stay in their row, vertical ones in their column
+        on_line = obstruction // stride == cell // stride if heading & 1 else ahead % stride == 0
+        if on_line and ahead * step > 0 and (stop == EXIT or (stop - obstruction) * step >= 0):
+            return obstruction - step
+        return stop
+
+    def loops(self, state: int, obstruction: int = EXIT) -> bool:
+        """Whether the guard starting in ``state`` walks in a loop (with an optional extra obstruction)."""
+        seen, touched = self.seen, []
+        try:
+            while not seen[state]:
+                seen[state] = 1
+                touched.append(state)
+                stop = self.jump(state, obstruction)
+                if stop == EXIT:
+                    return False
+                state = stop * 4 + ((state + 1) & 3)
+            return True
+        finally:
+            for state in touched:
+                seen[state] = 0
+
+    def route(self):
+        """Cells of the patrol in the order they are first entered, each with the state the guard was in
+        one step before (``EXIT`` for the start)."""
+        grid, cells = self.grid, self.grid.cells
+        entered = bytearray(len(cells))
+        state = self.start
+        path = [(state >> 2, EXIT)]
+        entered[state >> 2] = 1
+        turns = set()
+        while True:
+            if state in turns:
+                raise ValueError("The guard never leaves the map.")
+            turns.add(state)
+            cell, heading = state >> 2, state & 3
+            step = grid.orthogonal[heading]
+            stop = self.stops[state]
+            end = stop
+            if stop == EXIT:
+                # Walk the last run out to the edge of the map
+                end = cell
+                while cells[end + step] != grid.border:
+                    end += step
+            for target in range(cell + step, end + step, step):
+                if not entered[target]:
+                    entered[target] = 1
+                    path.append((target, (target - step) * 4 + heading))
+            if stop == EXIT:
+                return path
+            state = stop * 4 + ((heading + 1) & 3)
+
+
+def count_loops(lab, candidates) -> int:
+    """How many of the ``(cell, state before)`` candidates from ``route`` trap the guard when obstructed.
+
+    The guard's walk is unchanged until it first reaches the obstruction, so
+    each simulation resumes from the state just before it instead of the start.
+    """
+    return sum(lab.loops(state, cell) for cell, state in candidates)
+
+
+def parse(text):
+    return Lab.from_text(text)
+
+
+def part1(lab):
+    """Number of distinct cells the guard visits before leaving the map."""
+    return len(lab.route())
+
+
+def part2(lab):
+    """Number of cells where one new obstruction traps the guard in a loop."""
+    return count_loops(lab, lab.route()[1:])
+
+
+if __name__ == "__main__":
+    with open("Day6/input.txt") as file:
+        lab = parse(file.read())
+
+    print("Part 1:", part1(lab))
+    print("Part 2:", part2(lab))
@@ -0,0 +1,75 @@
+"""Day6 part 2 with the obstruction candidates shared out over a process pool.
+
+Only cells on the guard's original route can change its walk, so those are the
+candidates, each paired with the guard state just before it is first entered
+(see ``day06_jump.count_loops``). The jump table, which is all a simulation
+reads, is copied once into shared memory. Every worker attaches to it instead
+of receiving a pickled copy of the map. The candidates are cut into chunks,
+the workers count the loops in each chunk and the counts are summed.
+"""
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import List, Optional, Tuple
+
+from aoc.grid import Grid
+import day06_jump
+from day06_jump import Lab, count_loops, parse
+
+# Chunks per worker: enough to even out candidates whose walks are much longer than others
+CHUNKS_PER_JOB = 8
+
+_lab: Optional[Lab] = None
+_memory: Optional[shared_memory.SharedMemory] = None
+
+
+def _attach(name: str, height: int, width: int, start: int):
+    """Pool initializer: rebuild the lab around the shared jump table."""
+    global _lab, _memory
+    _memory = shared_memory.SharedMemory(name=name)
+    # Simulations only read the grid's geometry, so a blank grid of the same shape will do
+    _lab = Lab(Grid(height, width), start, _memory.buf.cast("q"))
+
+
+def _count_chunk(candidates: List[Tuple[int, int]]) -> int:
+    return count_loops(_lab, candidates)
+
+
+def count_loops_parallel(lab: Lab, jobs: Optional[int] = None) -> int:
+    """Part 2 for ``lab``, evaluating the candidates on ``jobs`` processes (1 runs in-process)."""
+    candidates = lab.route()[1:]
+    jobs = min(jobs or os.cpu_count() or 1, len(candidates))
+    if jobs <= 1:
+        return count_loops(lab, candidates)
+
+    size = jobs * CHUNKS_PER_JOB
+    chunks = [candidates[index::size] for index in range(size)]
+    memory = shared_memory.SharedMemory(create=True, size=len(lab.stops) * lab.stops.itemsize)
+    try:
+        memory.buf.cast("q")[:] = lab.stops
+        initargs = (memory.name, lab.grid.height, lab.grid.width, lab.start)
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_attach, initargs=initargs) as executor:
+            return sum(executor.map(_count_chunk, chunks))
+    finally:
+        memory.close()
+        memory.unlink()
+
+
+# day06_compare runs every engine through the same parse/part1/part2 interface
+part1 = day06_jump.part1
+
+
+def part2(lab):
+    return count_loops_parallel(lab)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Day6 part 2 with candidates evaluated in parallel")
+    parser.add_argument("path", nargs="?", default="Day6/input.txt")
+    parser.add_argument("-j", "--jobs", type=int, help="worker processes (default: core count)")
+    args = parser.parse_args()
+
+    with open(args.path) as file:
+        lab = parse(file.read())
+    print("Part 2:", count_loops_parallel(lab, args.jobs))
@@ -1,73 +1,75 @@
-import itertools
 from time import time
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 class TestCase:
     def __init__(self, target: int, numbers: List[int]):
         self.target = target
         self.numbers = numbers
+        # Part 1 outcome, kept for part 2: an equation solvable with + and * needs no ||
+        self.solvable_without_concat: Optional[bool] = None
 
-def evaluate_left_to_right(numbers: List[int], ops: List[str]) -> int:
-    result = numbers[0]
-    for i, op in enumerate(ops):
-        next_number = numbers[i + 1]
-        if op == "+":
-            result += next_number
-        elif op == "*":
-            result *= next_number
-        else:
-            raise ValueError(f"Unsupported operator: {op}")
-    return result
-
-def evaluate_with_concat(numbers: List[int], ops: List[str]) -> int:
-    result = numbers[0]
-    for i, op in enumerate(ops):
-        next_number = numbers[i + 1]
-        if op == "+":
-            result += next_number
-        elif op == "*":
-            result *= next_number
-        elif op == "||":
-            result = int(str(result) + str(next_number))
-        else:
-            raise ValueError(f"Unsupported operator: {op}")
-    return result
-
-def parse_input(file_path: str) -> List[TestCase]:
+def parse(text: str) -> List[TestCase]:
     test_cases = []
-    with open(file_path, "r") as file:
-        for line in file:
-            if ":" not in line:
-                continue
-            target_str, numbers_str = line.split(":")
-            target = int(target_str.strip())
-            numbers = list(map(int, numbers_str.strip().split()))
-            test_cases.append(TestCase(target, numbers))
+    for line in text.splitlines():
+        if ":" not in line:
+            continue
+        target_str, numbers_str = line.split(":")
+        target = int(target_str.strip())
+        numbers = list(map(int, numbers_str.strip().split()))
+        test_cases.append(TestCase(target, numbers))
     return test_cases
 
-def generate_operator_combinations(operators: List[str], length: int) -> List[List[str]]:
-    return list(itertools.product(operators, repeat=length))
+def parse_input(file_path: str) -> List[TestCase]:
+    with open(file_path, "r") as file:
+        return parse(file.read())
+
+def concat_power(number: int) -> int:
+    """Power of ten that ``||`` shifts the left operand by: a || b == a * concat_power(b) + b."""
+    power = 10
+    while power <= number:
+        power *= 10
+    return power
+
+def can_reach(target: int, numbers: List[int], concat: bool = False) -> bool:
+    """Whether some choice of +, * (and || with ``concat``) evaluated left to right gives ``target``.
+
+    The search runs backwards from the target: the last operator has to be
+    undone with the last number, by subtracting it, dividing by it exactly or
+    stripping it off as a suffix. Operands are never negative, so a value below
+    the number it should absorb is a dead end, and most branches die at once.
+    """
+    stack = [(target, len(numbers) - 1)]
+    while stack:
+        value, index = stack.pop()
+        number = numbers[index]
+        if index == 0:
+            if value == number:
+                return True
+            continue
+        if number == 0 and value == 0:
+            return True  # Multiplying by zero reaches zero from any prefix
+        if value >= number:
+            stack.append((value - number, index - 1))
+        if number and value % number == 0:
+            stack.append((value // number, index - 1))
+        if concat and value >= number:
+            # Stripping a suffix is the most selective step, so it is tried first
+            prefix, suffix = divmod(value, concat_power(number))
+            if suffix == number:
+                stack.append((prefix, index - 1))
+    return False
 
 def solve_part_one(test_cases: List[TestCase]) -> int:
-    operators = ["+", "*"]
     valid_test_values_sum = 0
 
     for test_case in test_cases:
-        possible = False
-        ops_length = len(test_case.numbers) - 1
-        all_ops = generate_operator_combinations(operators, ops_length)
-
-        for ops in all_ops:
-            if evaluate_left_to_right(test_case.numbers, ops) == test_case.target:
-                possible = True
-                break
-        if possible:
+        test_case.solvable_without_concat = can_reach(test_case.target, test_case.numbers)
+        if test_case.solvable_without_concat:
             valid_test_values_sum += test_case.target
 
     return valid_test_values_sum
 
 def solve_part_two(test_cases: List[TestCase], part_one_time: float) -> Tuple[int, float]:
-    operators = ["+", "*", "||"]
     valid_test_values_sum = 0
 
     total_cases = len(test_cases)
@@ -76,21 +78,13 @@ def solve_part_two(test_cases: List[TestCase], part_one_time: float) -> Tuple[in
     cumulative1 = 0.0
     cumulative2 = part_one_time
 
-    print("\nProgress    Interval(s)      Cumulative1(s)    Cumulative2(s)")
-    print("-------------------------------------------------------------")
+    print("\nProgress    Interval(s)      Cumulative1(s)    Cumulative2(s)    Equations/s          ETA(s)")
+    print("---------------------------------------------------------------------------------------------")
 
     start = time()
 
     for index, test_case in enumerate(test_cases):
-        possible = False
-        ops_length = len(test_case.numbers) - 1
-        all_ops = generate_operator_combinations(operators, ops_length)
-
-        for ops in all_ops:
-            if evaluate_with_concat(test_case.numbers, ops) == test_case.target:
-                possible = True
-                break
-        if possible:
+        if test_case.solvable_without_concat or can_reach(test_case.target, test_case.numbers, concat=True):
             valid_test_values_sum += test_case.target
 
         if (index + 1) % progress_interval == 0 or (index + 1) == total_cases:
@@ -98,13 +92,23 @@ def solve_part_two(test_cases: List[TestCase], part_one_time: float) -> Tuple[in
             interval_elapsed = now - start
             cumulative1 += interval_elapsed
             cumulative2 = part_one_time + cumulative1
+            # Throughput so far, and the time left for the remaining equations at that rate
+            rate = (index + 1) / cumulative1 if cumulative1 else float("inf")
+            eta = (total_cases - index - 1) / rate
 
-            print(f"{index + 1:10}/{total_cases} {interval_elapsed:20.9f} {cumulative1:20.9f} {cumulative2:20.9f}")
+            print(f"{index + 1:10}/{total_cases} {interval_elapsed:20.9f} {cumulative1:20.9f} {cumulative2:20.9f} "
+                  f"{rate:14.1f} {eta:15.3f}")
 
             start = time()
 
     return valid_test_values_sum, cumulative2
 
+def part1(test_cases: List[TestCase]) -> int:
+    return solve_part_one(test_cases)
+
+def part2(test_cases: List[TestCase]) -> int:
+    return solve_part_two(test_cases, 0.0)[0]
+
 def main():
     file_path = "Day7/input.txt"  # Change this to your actual input file location
 
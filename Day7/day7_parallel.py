@@ -0,0 +1,77 @@
+"""Day7 over many equations, spread across worker processes in chunks.
+
+Each chunk is checked with + and * first, and only the equations that fail
+are searched again with ``||``: anything solvable without concatenation is
+solvable with it, so part 1 successes count for part 2 as they are. Chunks are
+collected as they finish, and the progress table shows the throughput so far
+and the estimated time left.
+"""
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from time import perf_counter
+from typing import List, Optional, Tuple
+
+from day7_01 import TestCase, can_reach, parse_input
+
+CHUNK_SIZE = 256
+
+
+def check_chunk(test_cases: List[TestCase]) -> Tuple[int, int, int]:
+    """Part 1 and part 2 totals of a chunk, and its size."""
+    part_one = part_two = 0
+    for test_case in test_cases:
+        if can_reach(test_case.target, test_case.numbers):
+            part_one += test_case.target
+            part_two += test_case.target
+        elif can_reach(test_case.target, test_case.numbers, concat=True):
+            part_two += test_case.target
+    return part_one, part_two, len(test_cases)
+
+
+def _completed(test_cases, jobs, chunk_size):
+    chunks = [test_cases[start:start + chunk_size] for start in range(0, len(test_cases), chunk_size)]
+    if jobs == 1 or len(chunks) <= 1:
+        yield from map(check_chunk, chunks)
+        return
+    with ProcessPoolExecutor(max_workers=min(jobs, len(chunks))) as executor:
+        for future in as_completed([executor.submit(check_chunk, chunk) for chunk in chunks]):
+            yield future.result()
+
+
+def solve_parallel(test_cases: List[TestCase], jobs: Optional[int] = None,
+                   chunk_size: int = CHUNK_SIZE, report=print) -> Tuple[int, int]:
+    """Both parts, on ``jobs`` processes (1 runs in-process), reporting progress about every 10%."""
+    jobs = jobs or os.cpu_count() or 1
+    total_cases = len(test_cases)
+    progress_interval = max(1, total_cases // 10)
+
+    report("\nProgress      Elapsed(s)    Equations/s          ETA(s)")
+    report("--------------------------------------------------------")
+
+    part_one = part_two = done = 0
+    next_report = progress_interval
+    start = perf_counter()
+    for chunk_one, chunk_two, count in _completed(test_cases, jobs, chunk_size):
+        part_one += chunk_one
+        part_two += chunk_two
+        done += count
+        if done >= next_report or done == total_cases:
+            elapsed = perf_counter() - start
+            rate = done / elapsed if elapsed else float("inf")
+            eta = (total_cases - done) / rate
+            report(f"{done:10}/{total_cases} {elapsed:12.3f} {rate:14.1f} {eta:15.3f}")
+            next_report = (done // progress_interval + 1) * progress_interval
+    return part_one, part_two
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Day7 with the equations checked in parallel chunks")
+    parser.add_argument("path", nargs="?", default="Day7/input.txt")
+    parser.add_argument("-j", "--jobs", type=int, help="worker processes (default: core count)")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help="equations per task")
+    args = parser.parse_args()
+
+    part_one_result, part_two_result = solve_parallel(parse_input(args.path), args.jobs, args.chunk_size)
+    print(f"Part 1 Total Calibration Result: {part_one_result}")
+    print(f"Part 2 Total Calibration Result: {part_two_result}")
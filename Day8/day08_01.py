@@ -1,124 +1,181 @@
 import os
-from typing import List, Set, Tuple, Dict
-from collections import defaultdict
-from math import gcd
 from time import perf_counter
+from typing import Dict, Iterator, Tuple
 
+import numpy as np
 
-def read_map(filename: str) -> List[str]:
+
+# Antenna pairs (part 1) or line points (part 2) handled per vectorized block
+BLOCK_SIZE = 1 << 20
+
+
+class AntennaMap:
+    """
+    The map size plus an index of antenna coordinates by frequency, built once for both parts.
+    """
+
+    def __init__(self, rows: int, cols: int, antennas: Dict[str, np.ndarray]):
+        self.rows = rows
+        self.cols = cols
+        self.antennas = antennas
+
+    def occupancy(self) -> np.ndarray:
+        """
+        Returns a fresh flat boolean array with one entry per cell, for marking antinodes.
+        """
+        return np.zeros(self.rows * self.cols, dtype=bool)
+
+    def mark(self, occupied: np.ndarray, r: np.ndarray, c: np.ndarray):
+        """
+        Marks the given positions that fall inside the map.
+        """
+        inside = (r >= 0) & (r < self.rows) & (c >= 0) & (c < self.cols)
+        occupied[r[inside] * self.cols + c[inside]] = True
+
+
+def parse(text: str) -> AntennaMap:
+    """
+    Indexes the antennas of the grid map by frequency.
+
+    :param text: The contents of the grid map file.
+    :return: The map size and an (n, 2) array of antenna coordinates per frequency.
+    """
+    lines = text.split()
+    rows = len(lines)
+    cols = len(lines[0]) if rows > 0 else 0
+    cells = np.frombuffer("".join(lines).encode(), dtype=np.uint8)
+    if cells.size != rows * cols:
+        raise ValueError("Inconsistent row lengths in the grid map.")
+
+    positions = np.flatnonzero(cells != ord("."))
+    frequencies = cells[positions]
+    order = np.argsort(frequencies, kind="stable")
+    positions, frequencies = positions[order], frequencies[order]
+    starts = np.flatnonzero(np.diff(frequencies, prepend=-1))
+    antennas = {
+        chr(frequencies[start]): np.column_stack(np.divmod(group, cols))
+        for start, group in zip(starts, np.split(positions, starts[1:]))
+    }
+    return AntennaMap(rows, cols, antennas)
+
+
+def read_map(filename: str) -> AntennaMap:
     """
     Reads the grid map from a file.
 
     :param filename: The name of the file containing the grid map.
-    :return: A list of strings representing the grid.
+    :return: The indexed antenna map.
     """
     if not os.path.exists(filename):
         raise FileNotFoundError(f"Failed to open file: {filename}")
     with open(filename, 'r') as file:
-        grid = file.read().splitlines()
+        grid = parse(file.read())
     return grid
 
 
-def compute_antinodes_pairwise(grid: List[str]) -> Set[Tuple[int, int]]:
+def antenna_pairs(coords: np.ndarray) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
     """
-    Computes unique antinode positions using the pairwise method.
+    Yields every unordered pair of antennas of one frequency, in blocks of about BLOCK_SIZE pairs.
 
-    :param grid: A list of strings representing the grid map.
-    :return: A set of unique antinode positions.
+    :param coords: An (n, 2) array of antenna coordinates.
+    :return: Blocks of (A, B) coordinate arrays, each of shape (pairs, 2).
     """
-    rows = len(grid)
-    cols = len(grid[0]) if rows > 0 else 0
+    n = len(coords)
+    rows_per_block = max(1, BLOCK_SIZE // max(1, n))
+    for start in range(0, n - 1, rows_per_block):
+        first = np.arange(start, min(start + rows_per_block, n - 1))
+        i, j = np.nonzero(np.arange(n) > first[:, None])
+        yield coords[first[i]], coords[j]
 
-    antennas_by_freq = defaultdict(list)
-    for r in range(rows):
-        for c in range(cols):
-            ch = grid[r][c]
-            if ch != '.':
-                antennas_by_freq[ch].append((r, c))
 
-    antinodes = set()
-    for coords in antennas_by_freq.values():
-        n = len(coords)
-        if n < 2:
-            continue
-
-        for i in range(n):
-            rA, cA = coords[i]
-            for j in range(i + 1, n):
-                rB, cB = coords[j]
-
-                # Compute P1 = 2B - A
-                p1_r, p1_c = 2 * rB - rA, 2 * cB - cA
-                if 0 <= p1_r < rows and 0 <= p1_c < cols:
-                    antinodes.add((p1_r, p1_c))
-
-                # Compute P2 = 2A - B
-                p2_r, p2_c = 2 * rA - rB, 2 * cA - cB
-                if 0 <= p2_r < rows and 0 <= p2_c < cols:
-                    antinodes.add((p2_r, p2_c))
+def compute_antinodes_pairwise(antenna_map: AntennaMap) -> np.ndarray:
+    """
+    Computes unique antinode positions using the pairwise method.
 
-    return antinodes
+    :param antenna_map: The indexed antenna map.
+    :return: A flat boolean array marking the antinode cells.
+    """
+    occupied = antenna_map.occupancy()
+    for coords in antenna_map.antennas.values():
+        for A, B in antenna_pairs(coords):
+            # P1 = 2B - A and P2 = 2A - B
+            for P in (2 * B - A, 2 * A - B):
+                antenna_map.mark(occupied, P[:, 0], P[:, 1])
+    return occupied
 
 
-def add_line_points(rA: int, cA: int, rB: int, cB: int, rows: int, cols: int, antinodes: Set[Tuple[int, int]]):
+def steps_within(position: np.ndarray, step: np.ndarray, size: int) -> Tuple[np.ndarray, np.ndarray]:
     """
-    Adds all points along a line between two antennas to the antinodes set.
+    Computes the range of k keeping position + k * step inside [0, size), for each line.
 
-    :param rA: Row of the first antenna.
-    :param cA: Column of the first antenna.
-    :param rB: Row of the second antenna.
-    :param cB: Column of the second antenna.
-    :param rows: Number of rows in the grid.
-    :param cols: Number of columns in the grid.
-    :param antinodes: Set to store unique antinode positions.
+    :param position: Starting coordinates along one axis.
+    :param step: Step along the same axis (0 leaves that axis unbounded).
+    :param size: Size of the grid along that axis.
+    :return: The lowest and highest valid k.
     """
-    dr, dc = rB - rA, cB - cA
-    g = gcd(abs(dr), abs(dc))
-    dr, dc = dr // g, dc // g
-
-    rP, cP = rA, cA
-    while 0 <= rP < rows and 0 <= cP < cols:
-        antinodes.add((rP, cP))
-        rP += dr
-        cP += dc
+    unbounded = np.iinfo(np.int64).max // 4
+    # Mirror the lines that step backwards so every step is positive; the range of k does not change
+    mirrored = np.where(step < 0, size - 1 - position, position)
+    stride = np.maximum(np.abs(step), 1)
+    low = np.where(step == 0, -unbounded, -(mirrored // stride))
+    high = np.where(step == 0, unbounded, (size - 1 - mirrored) // stride)
+    return low, high
 
-    rP, cP = rA - dr, cA - dc
-    while 0 <= rP < rows and 0 <= cP < cols:
-        antinodes.add((rP, cP))
-        rP -= dr
-        cP -= dc
 
-
-def compute_antinodes_lines(grid: List[str]) -> Set[Tuple[int, int]]:
+def compute_antinodes_lines(antenna_map: AntennaMap) -> np.ndarray:
     """
     Computes unique antinode positions using the line-drawing method.
 
-    :param grid: A list of strings representing the grid map.
-    :return: A set of unique antinode positions.
+    :param antenna_map: The indexed antenna map.
+    :return: A flat boolean array marking the antinode cells.
+    """
+    occupied = antenna_map.occupancy()
+    for coords in antenna_map.antennas.values():
+        for A, B in antenna_pairs(coords):
+            step = B - A
+            step //= np.gcd(step[:, 0], step[:, 1])[:, None]
+            low_r, high_r = steps_within(A[:, 0], step[:, 0], antenna_map.rows)
+            low_c, high_c = steps_within(A[:, 1], step[:, 1], antenna_map.cols)
+            low = np.maximum(low_r, low_c)
+            counts = np.minimum(high_r, high_c) - low + 1
+            # Every point of a line is inside the map, so lines can run on flat cell indices
+            first = (A[:, 0] + low * step[:, 0]) * antenna_map.cols + A[:, 1] + low * step[:, 1]
+            stride = step[:, 0] * antenna_map.cols + step[:, 1]
+            last = first + (counts - 1) * stride
+            ends = np.cumsum(counts)
+
+            # Expand the lines a block of about BLOCK_SIZE points at a time: repeat each line's stride over
+            # its points, put the jump from the previous line's last point at its first one, and sum up
+            start = 0
+            while start < len(counts):
+                base = ends[start - 1] if start else 0
+                stop = max(start + 1, int(np.searchsorted(ends, base + BLOCK_SIZE, side="right")))
+                deltas = np.repeat(stride[start:stop], counts[start:stop])
+                previous = np.concatenate(([0], last[start:stop - 1]))
+                deltas[ends[start:stop] - counts[start:stop] - base] = first[start:stop] - previous
+                occupied[np.cumsum(deltas)] = True
+                start = stop
+    return occupied
+
+
+def part1(antenna_map: AntennaMap) -> int:
     """
-    rows = len(grid)
-    cols = len(grid[0]) if rows > 0 else 0
+    Counts the unique antinodes produced by the pairwise method.
 
-    antennas_by_freq = defaultdict(list)
-    for r in range(rows):
-        for c in range(cols):
-            ch = grid[r][c]
-            if ch != '.':
-                antennas_by_freq[ch].append((r, c))
+    :param antenna_map: The indexed antenna map.
+    :return: The number of unique antinode positions.
+    """
+    return int(compute_antinodes_pairwise(antenna_map).sum())
 
-    antinodes = set()
-    for coords in antennas_by_freq.values():
-        n = len(coords)
-        if n < 2:
-            continue
 
-        for i in range(n):
-            rA, cA = coords[i]
-            for j in range(i + 1, n):
-                rB, cB = coords[j]
-                add_line_points(rA, cA, rB, cB, rows, cols, antinodes)
+def part2(antenna_map: AntennaMap) -> int:
+    """
+    Counts the unique antinodes produced by the line-drawing method.
 
-    return antinodes
+    :param antenna_map: The indexed antenna map.
+    :return: The number of unique antinode positions.
+    """
+    return int(compute_antinodes_lines(antenna_map).sum())
 
 
 def format_time(seconds: float) -> str:
@@ -135,15 +192,13 @@ def main():
     try:
         grid = read_map("Day8/input.txt")
 
-        overall_start = perf_counter()
-
         # Part 1: Compute using Pairwise method
         start_time = perf_counter()
         pairwise_antinodes = compute_antinodes_pairwise(grid)
         part1_time = perf_counter() - start_time
 
         print(f"Part 1 finished in {format_time(part1_time)}")
-        print(f"Number of unique antinodes (Pairwise method): {len(pairwise_antinodes)}")
+        print(f"Number of unique antinodes (Pairwise method): {int(pairwise_antinodes.sum())}")
 
         # Part 2: Compute using Line-drawing method
         start_time = perf_counter()
@@ -151,7 +206,7 @@ def main():
         part2_time = perf_counter() - start_time
 
         print(f"Part 2 finished in {format_time(part2_time)}")
-        print(f"Number of unique antinodes (Line-drawing method): {len(line_antinodes)}")
+        print(f"Number of unique antinodes (Line-drawing method): {int(line_antinodes.sum())}")
 
     except Exception as e:
         print(f"Error: {e}")
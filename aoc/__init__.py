@@ -0,0 +1 @@
+"""Shared tooling for running the daily solvers from a single process."""
@@ -0,0 +1,247 @@
+"""Command line entry point: ``python -m aoc run [days...]``.
+
+Subsystems with heavy imports (the daemon's asyncio, the benchmark's
+statistics, the process pool) are imported by the commands that use them, so
+a plain ``run`` only pays for the runner.
+"""
+import argparse
+import json
+import sys
+
+from aoc import profiling
+from aoc.registry import PARTS, parse_selection, run_script
+from aoc.runner import format_duration, format_report, run_days
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="aoc", description="Advent of Code solver tooling")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="solve days in a single process")
+    run.add_argument("days", nargs="*", help="days to run, e.g. 1 3-5 9,12 (default: all)")
+    run.add_argument("--parts", type=int, nargs="+", choices=PARTS, default=list(PARTS))
+    run.add_argument("-q", "--quiet", action="store_true", help="hide output printed by the solvers")
+    run.add_argument("--json", action="store_true", help="print the report as JSON")
+    run.add_argument("-j", "--jobs", type=int, nargs="?", const=0, default=None,
+                     help="run on a process pool with this many workers (default when given: core count)")
+    run.add_argument("--timeout", type=float, help="per-task wall-clock limit in seconds (parallel mode)")
+    run.add_argument("--memory", type=int, help="per-task peak RSS limit in MB (parallel mode)")
+    run.add_argument("--whole-days", action="store_true",
+                     help="keep both parts of a day in one task instead of running them independently")
+    run.add_argument("--cache", action="store_true", help="reuse parsed inputs from the content-hash cache")
+    run.add_argument("--profile", action="store_true", help="print the span tree and counters after the run")
+    run.add_argument("--trace-memory", action="store_true", help="record tracemalloc allocations per span")
+    run.add_argument("--trace", metavar="FILE", help="write the spans in Chrome trace format")
+    run.add_argument("--profile-json", metavar="FILE", help="write the span tree and counters as JSON")
+    run.add_argument("--scale", type=float, help="solve a generated input of this scale instead of input.txt")
+    run.add_argument("--seed", type=int, default=0, help="seed for generated inputs")
+    run.set_defaults(handler=command_run)
+
+    bench = commands.add_parser("bench", help="benchmark days against a stored baseline")
+    bench.add_argument("days", nargs="*", help="days to benchmark (default: all)")
+    bench.add_argument("--parts", type=int, nargs="+", choices=PARTS, default=list(PARTS))
+    bench.add_argument("-n", "--repeat", type=int, default=5, help="timed runs per benchmark")
+    bench.add_argument("--warmup", type=int, default=1, help="untimed runs before measuring")
+    bench.add_argument("--scale", type=float, help="benchmark a generated input of this scale")
+    bench.add_argument("--seed", type=int, default=0)
+    bench.add_argument("--history", help="JSON history file (default: bench_history.json)")
+    bench.add_argument("--threshold", type=float, default=0.10,
+                       help="flag medians this fraction slower than the baseline (default: 0.10)")
+    bench.add_argument("--min-delta", type=float, default=0.001,
+                       help="ignore slowdowns smaller than this many seconds (default: 0.001)")
+    bench.add_argument("--label", default="", help="note stored with this run")
+    bench.add_argument("--set-baseline", action="store_true", help="make this run the new baseline")
+    bench.add_argument("--no-save", action="store_true", help="compare only, do not record the run")
+    bench.set_defaults(handler=command_bench)
+
+    cache = commands.add_parser("cache", help="manage the parsed-input cache")
+    cache.add_argument("action", choices=["clear"])
+    cache.set_defaults(handler=command_cache)
+
+    daemon = commands.add_parser("daemon", help="serve solve requests from a warm process over a Unix socket")
+    daemon.add_argument("--socket", help="socket path (default: .aoc_daemon.sock)")
+    daemon.add_argument("--status", action="store_true", help="show the state of a running daemon")
+    daemon.add_argument("--invalidate", type=int, nargs="*", metavar="DAY",
+                        help="drop warm modules and inputs of these days (all when none given)")
+    daemon.add_argument("--stop", action="store_true", help="shut down a running daemon")
+    daemon.set_defaults(handler=command_daemon)
+
+    query = commands.add_parser("query", help="solve days on a running daemon")
+    query.add_argument("days", nargs="*", help="days to run (default: all)")
+    query.add_argument("--parts", type=int, nargs="+", choices=PARTS, default=list(PARTS))
+    query.add_argument("--scale", type=float, help="solve a generated input of this scale")
+    query.add_argument("--seed", type=int, default=0)
+    query.add_argument("--json", action="store_true", help="print the daemon's responses as JSON")
+    query.add_argument("--socket", help="socket path (default: .aoc_daemon.sock)")
+    query.set_defaults(handler=command_query)
+
+    startup = commands.add_parser("startup", help="profile import time and first-call latency of each day")
+    startup.add_argument("days", nargs="*", help="days to profile (default: all)")
+    startup.add_argument("--solve", action="store_true", help="also time the first call of part 1")
+    startup.add_argument("--top", type=int, default=3, help="heaviest imports listed per day")
+    startup.add_argument("--json", action="store_true", help="print the profiles as JSON")
+    startup.set_defaults(handler=command_startup)
+
+    gen = commands.add_parser("generate", help="write a synthetic input for a day")
+    gen.add_argument("day", type=int)
+    gen.add_argument("--scale", type=float, default=1, help="size relative to a real puzzle input")
+    gen.add_argument("--seed", type=int, default=0)
+    gen.add_argument("-o", "--output", help="file to write (default: stdout)")
+    gen.set_defaults(handler=command_generate)
+
+    script = commands.add_parser("script", help="run a solver file as a script, e.g. Day6/day06_compare.py")
+    script.add_argument("path", help="the file to run, relative to the repository root")
+    script.add_argument("arguments", nargs=argparse.REMAINDER, help="arguments passed on to the script")
+    script.set_defaults(handler=command_script)
+
+    return parser
+
+
+def command_run(args) -> int:
+    if args.jobs is not None:
+        return command_run_parallel(args)
+    profiled = args.profile or args.trace_memory or args.trace or args.profile_json
+    if profiled:
+        profiling.enable(track_memory=args.trace_memory)
+    results = run_days(parse_selection(args.days), args.parts, quiet=args.quiet, scale=args.scale, seed=args.seed,
+                       use_cache=args.cache)
+    if args.json:
+        print(json.dumps([result.to_dict() for result in results], indent=2))
+    else:
+        print(format_report(results))
+    if profiled:
+        if args.trace:
+            profiling.export_chrome_trace(args.trace)
+        if args.profile_json:
+            profiling.export_json(args.profile_json)
+        if args.profile or args.trace_memory:
+            print()
+            print(profiling.format_report())
+        profiling.disable()
+    return 1 if any(result.errors for result in results) else 0
+
+
+def command_run_parallel(args) -> int:
+    from aoc.parallel import format_parallel_report, run_parallel
+
+    results, elapsed = run_parallel(
+        parse_selection(args.days), args.parts, jobs=args.jobs or None,
+        timeout=args.timeout, memory_limit_mb=args.memory, split_parts=not args.whole_days,
+        scale=args.scale, seed=args.seed, use_cache=args.cache,
+    )
+    if args.json:
+        print(json.dumps({"wall": elapsed, "tasks": [result.to_dict() for result in results]}, indent=2))
+    else:
+        print(format_parallel_report(results, elapsed))
+    return 1 if any(result.errors for result in results) else 0
+
+
+def command_bench(args) -> int:
+    from aoc.bench import (DEFAULT_HISTORY, baseline_results, find_regressions, format_bench_report, input_key,
+                           load_history, record_run, run_benchmarks, save_history)
+
+    args.history = args.history or DEFAULT_HISTORY
+    results = run_benchmarks(parse_selection(args.days), args.parts, args.repeat, args.warmup, args.scale, args.seed)
+    history = load_history(args.history)
+    baseline = baseline_results(history, args.scale, args.seed)
+    if not baseline:
+        print(f"note: no baseline for {input_key(args.scale, args.seed)} yet; nothing to compare against",
+              file=sys.stderr)
+    regressions = find_regressions(results, baseline, args.threshold, args.min_delta)
+    print(format_bench_report(results, baseline, regressions))
+    for regression in regressions:
+        print(f"REGRESSION {regression.key}: median {format_duration(regression.current)} "
+              f"vs baseline {format_duration(regression.baseline)} ({regression.ratio:.2f}x)")
+    if not args.no_save:
+        record_run(history, results, args.label, args.scale, args.seed, as_baseline=args.set_baseline)
+        save_history(args.history, history)
+    return 1 if regressions or any(result.error for result in results) else 0
+
+
+def command_cache(args) -> int:
+    from aoc.cache import clear as clear_cache
+
+    print(f"Removed {clear_cache()} cached inputs")
+    return 0
+
+
+def command_daemon(args) -> int:
+    from aoc.daemon import DEFAULT_SOCKET, DaemonError, request, serve
+
+    args.socket = args.socket or DEFAULT_SOCKET
+    try:
+        if args.stop:
+            request({"op": "shutdown"}, args.socket)
+        elif args.status:
+            print(json.dumps(request({"op": "status"}, args.socket), indent=2))
+        elif args.invalidate is not None:
+            days = args.invalidate or [None]
+            for day in days:
+                print(json.dumps(request({"op": "invalidate", "day": day}, args.socket)))
+        else:
+            print(f"Listening on {args.socket}", file=sys.stderr)
+            serve(args.socket)
+    except DaemonError as e:
+        print(e, file=sys.stderr)
+        return 1
+    return 0
+
+
+def command_query(args) -> int:
+    from aoc.daemon import DEFAULT_SOCKET, DaemonError, request, result_from_dict
+
+    args.socket = args.socket or DEFAULT_SOCKET
+    results = []
+    try:
+        for number in parse_selection(args.days):
+            response = request({"op": "solve", "day": number, "parts": args.parts,
+                                "scale": args.scale, "seed": args.seed}, args.socket)
+            results.append(response["result"])
+    except DaemonError as e:
+        print(e, file=sys.stderr)
+        return 1
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(format_report([result_from_dict(result) for result in results]))
+    return 1 if any(result["errors"] for result in results) else 0
+
+
+def command_startup(args) -> int:
+    from aoc.startup import format_startup_report, profile_startup, suite_startup
+
+    numbers = parse_selection(args.days)
+    profiles = profile_startup(numbers, solve=args.solve)
+    interpreter, suite = suite_startup(numbers)
+    if args.json:
+        print(json.dumps({"interpreter": interpreter, "suite": suite,
+                          "days": [profile.to_dict() for profile in profiles]}, indent=2))
+    else:
+        print(format_startup_report(profiles, interpreter, suite, args.top))
+    return 1 if any(profile.error for profile in profiles) else 0
+
+
+def command_generate(args) -> int:
+    from aoc.generators import generate
+
+    text = generate(args.day, args.scale, args.seed)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(text)
+    else:
+        sys.stdout.write(text)
+    return 0
+
+
+def command_script(args) -> int:
+    run_script(args.path, args.arguments)
+    return 0
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,237 @@
+"""Repeatable benchmarks with a JSON history and regression detection.
+
+Each selected day/part is solved ``warmup + repeat`` times on a freshly parsed
+input (several solvers mutate their data), then once more under tracemalloc to
+record peak Python memory. Runs are appended to a history file; for each input
+(the puzzle inputs, or a generated scale and seed) one stored run acts as the
+baseline that later runs on that input are compared against by median time.
+"""
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import traceback
+import tracemalloc
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from time import perf_counter
+from typing import Dict, Iterable, List, Optional
+
+from aoc.generators import generate
+from aoc.registry import PARTS, ROOT, get_day, get_part, load_module
+from aoc.runner import format_duration
+
+DEFAULT_HISTORY = os.path.join(ROOT, "bench_history.json")
+
+
+@dataclass
+class BenchResult:
+    key: str
+    repeat: int
+    min: float
+    median: float
+    p95: float
+    mean: float
+    peak_kb: float
+    error: Optional[str] = None
+
+    @classmethod
+    def failed(cls, key: str, error: str) -> "BenchResult":
+        return cls(key=key, repeat=0, min=0.0, median=0.0, p95=0.0, mean=0.0, peak_kb=0.0, error=error)
+
+
+@dataclass
+class Regression:
+    key: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline else float("inf")
+
+
+def percentile(samples: List[float], fraction: float) -> float:
+    """Nearest-rank percentile."""
+    ordered = sorted(samples)
+    rank = max(1, min(len(ordered), round(fraction * len(ordered) + 0.5)))
+    return ordered[rank - 1]
+
+
+def summarize(key: str, samples: List[float], peak_kb: float) -> BenchResult:
+    return BenchResult(
+        key=key,
+        repeat=len(samples),
+        min=min(samples),
+        median=statistics.median(samples),
+        p95=percentile(samples, 0.95),
+        mean=statistics.fmean(samples),
+        peak_kb=peak_kb,
+    )
+
+
+def _sample(parse, solver, text: str) -> float:
+    """Time ``parse`` alone, or ``solver`` on a freshly parsed input."""
+    if solver is None:
+        start = perf_counter()
+        parse(text)
+        return perf_counter() - start
+    data = parse(text)
+    start = perf_counter()
+    solver(data)
+    return perf_counter() - start
+
+
+def _peak_kb(parse, solver, text: str) -> float:
+    data = None if solver is None else parse(text)
+    tracemalloc.start()
+    try:
+        if solver is None:
+            parse(text)
+        else:
+            solver(data)
+        return tracemalloc.get_traced_memory()[1] / 1024
+    finally:
+        tracemalloc.stop()
+
+
+def benchmark_day(number: int, parts: Iterable[int] = PARTS, repeat: int = 5, warmup: int = 1,
+                  text: Optional[str] = None) -> List[BenchResult]:
+    """Benchmark one day; a phase that raises is recorded as a failed result instead of aborting the run."""
+    day = get_day(number)
+    try:
+        module = load_module(day)
+        if text is None:
+            text = day.read_input()
+    except Exception:
+        return [BenchResult.failed(f"{day.name}.setup", traceback.format_exc(limit=-1).strip())]
+
+    phases = [("parse", None)]
+    for part in parts:
+        solver = get_part(module, part)
+        if solver is not None:
+            phases.append((f"part{part}", solver))
+
+    results = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for phase, solver in phases:
+            key = f"{day.name}.{phase}"
+            try:
+                for _ in range(warmup):
+                    _sample(module.parse, solver, text)
+                samples = [_sample(module.parse, solver, text) for _ in range(repeat)]
+                peak = _peak_kb(module.parse, solver, text)
+            except Exception:
+                results.append(BenchResult.failed(key, traceback.format_exc(limit=-1).strip()))
+                if solver is None:
+                    # Nothing can be solved without a parsed input
+                    break
+                continue
+            results.append(summarize(key, samples, peak))
+    return results
+
+
+def input_key(scale: Optional[float] = None, seed: int = 0) -> str:
+    """Name of the input a run measured: the puzzle inputs, or a generated scale and seed."""
+    return "input" if scale is None else f"scale={scale:g},seed={seed}"
+
+
+def load_history(path: str) -> dict:
+    if not os.path.exists(path):
+        return {"baselines": {}, "runs": []}
+    with open(path, "r") as file:
+        history = json.load(file)
+    # Older histories kept a single baseline; it becomes the baseline of the input it was measured on
+    if "baselines" not in history:
+        index = history.pop("baseline", None)
+        history["baselines"] = {}
+        if index is not None:
+            run = history["runs"][index]
+            history["baselines"][input_key(run.get("scale"), run.get("seed", 0))] = index
+    return history
+
+
+def save_history(path: str, history: dict):
+    with open(path, "w") as file:
+        json.dump(history, file, indent=2)
+        file.write("\n")
+
+
+def record_run(history: dict, results: List[BenchResult], label: str = "", scale: Optional[float] = None,
+               seed: int = 0, as_baseline: bool = False) -> dict:
+    """Append a run; it becomes the baseline for its input when asked to or when that input has none yet."""
+    run = {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "label": label,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "scale": scale,
+        "seed": seed,
+        "results": {result.key: asdict(result) for result in results},
+    }
+    history["runs"].append(run)
+    key = input_key(scale, seed)
+    if as_baseline or key not in history["baselines"]:
+        history["baselines"][key] = len(history["runs"]) - 1
+    return run
+
+
+def baseline_run(history: dict, scale: Optional[float] = None, seed: int = 0) -> Optional[dict]:
+    """The baseline run measured on the same input, if there is one."""
+    index = history["baselines"].get(input_key(scale, seed))
+    return None if index is None else history["runs"][index]
+
+
+def baseline_results(history: dict, scale: Optional[float] = None, seed: int = 0) -> Dict[str, dict]:
+    """Results of the baseline run for this input, or nothing when it has no baseline yet."""
+    run = baseline_run(history, scale, seed)
+    return {} if run is None else run["results"]
+
+
+def find_regressions(results: List[BenchResult], baseline: Dict[str, dict], threshold: float,
+                     min_delta: float = 0.0) -> List[Regression]:
+    """Results whose median is more than ``threshold`` (a fraction) slower than the baseline.
+
+    ``min_delta`` (seconds) ignores changes too small to be anything but timer noise.
+    """
+    regressions = []
+    for result in results:
+        previous = baseline.get(result.key)
+        if result.error or not previous or previous.get("error"):
+            continue
+        if (result.median > previous["median"] * (1 + threshold)
+                and result.median - previous["median"] >= min_delta):
+            regressions.append(Regression(result.key, previous["median"], result.median))
+    return regressions
+
+
+def format_bench_report(results: List[BenchResult], baseline: Dict[str, dict],
+                        regressions: Iterable[Regression] = ()) -> str:
+    header = f"{'benchmark':<14} {'min':>10} {'median':>10} {'p95':>10} {'peak mem':>10} {'vs base':>8}"
+    lines = [header, "-" * len(header)]
+    flagged = {regression.key for regression in regressions}
+    for result in results:
+        if result.error:
+            lines.append(f"{result.key:<14} failed: {result.error.splitlines()[-1]}")
+            continue
+        previous = baseline.get(result.key)
+        change = ""
+        if previous and not previous.get("error") and previous["median"]:
+            change = f"{result.median / previous['median']:.2f}x" + (" !" if result.key in flagged else "")
+        lines.append(
+            f"{result.key:<14} {format_duration(result.min):>10} {format_duration(result.median):>10} "
+            f"{format_duration(result.p95):>10} {result.peak_kb / 1024:>8.2f}MB {change:>8}"
+        )
+    return "\n".join(lines)
+
+
+def run_benchmarks(numbers: Iterable[int], parts: Iterable[int] = PARTS, repeat: int = 5, warmup: int = 1,
+                   scale: Optional[float] = None, seed: int = 0) -> List[BenchResult]:
+    parts = tuple(parts)
+    results = []
+    for number in numbers:
+        text = generate(number, scale, seed) if scale is not None else None
+        results.extend(benchmark_day(number, parts, repeat, warmup, text))
+    return results
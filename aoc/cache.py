@@ -0,0 +1,179 @@
+"""Parsed-input cache keyed by the content hash of the raw input.
+
+The key combines the day, a BLAKE2 hash of the input text and a hash of the
+solver sources (every module in the day's directory plus the shared helpers
+parsed values are built from), so editing either the input or any parser
+invalidates the entry. Parsed values are stored in the most compact form available:
+
+* NumPy arrays, and tuples/lists of them, are written as ``.npy`` files and
+  reloaded with ``mmap_mode="c"`` (copy-on-write, so solvers may still modify
+  them without touching the cache);
+* rectangular lists of ints (1-D or 2-D) are stored as ``int64`` ``.npy`` and
+  converted back to lists on load, which skips all ``int()`` parsing;
+* a ``Grid`` stores its cells as a ``uint8`` ``.npy`` next to its dimensions,
+  and is rebuilt by copying the memory-mapped cells into a fresh ``bytearray``;
+  a tuple holding a ``Grid`` stores each of its items on its own this way;
+* anything else falls back to pickle.
+"""
+import hashlib
+import json
+import os
+import pickle
+import shutil
+import tempfile
+from typing import Callable, Optional, Tuple
+
+from aoc.grid import Grid
+from aoc.registry import ROOT, Day
+
+DEFAULT_CACHE_DIR = os.path.join(ROOT, ".aoc_cache")
+
+HIT, MISS = "hit", "miss"
+
+# Shared modules whose classes end up in parsed values (e.g. ``Grid``)
+HELPER_MODULES = ("grid.py", "search.py")
+
+
+def _digest(data: bytes, size: int = 16) -> str:
+    return hashlib.blake2b(data, digest_size=size).hexdigest()
+
+
+def _source_files(day: Day):
+    """Every module in the day's directory (sibling imports included) and the shared helpers."""
+    directory = os.path.dirname(day.module_file)
+    modules = sorted(os.path.join(directory, name) for name in os.listdir(directory) if name.endswith(".py"))
+    return modules + [os.path.join(ROOT, "aoc", name) for name in HELPER_MODULES]
+
+
+def cache_key(day: Day, text: str) -> str:
+    sources = hashlib.blake2b(digest_size=4)
+    for path in _source_files(day):
+        with open(path, "rb") as file:
+            sources.update(os.path.basename(path).encode() + b"\0" + file.read())
+    return f"{day.name}-{_digest(text.encode())}-{sources.hexdigest()}"
+
+
+def _int_rows(value) -> Optional[int]:
+    """Dimensionality if ``value`` is a non-empty rectangular list of ints (or of int lists)."""
+    if not isinstance(value, list) or not value:
+        return None
+    if all(type(item) is int for item in value):
+        return 1
+    if all(isinstance(item, list) for item in value):
+        width = len(value[0])
+        if width and all(len(row) == width and all(type(item) is int for item in row) for row in value):
+            return 2
+    return None
+
+
+def _is_array(value) -> bool:
+    return type(value).__module__ == "numpy" and type(value).__name__ == "ndarray"
+
+
+def _encode(value, directory: str) -> dict:
+    """Write ``value`` into ``directory`` and return the manifest needed to read it back."""
+    import numpy as np
+
+    if _is_array(value) and value.dtype != object:
+        np.save(os.path.join(directory, "0.npy"), value)
+        return {"kind": "array"}
+    if isinstance(value, (tuple, list)) and value and all(_is_array(item) and item.dtype != object for item in value):
+        for index, item in enumerate(value):
+            np.save(os.path.join(directory, f"{index}.npy"), item)
+        return {"kind": "arrays", "count": len(value), "container": type(value).__name__}
+    if isinstance(value, Grid):
+        np.save(os.path.join(directory, "0.npy"), np.frombuffer(value.cells, dtype=np.uint8))
+        return {"kind": "grid", "height": value.height, "width": value.width, "border": value.border,
+                "margin": value.margin}
+    if isinstance(value, tuple) and any(isinstance(item, Grid) for item in value):
+        items = []
+        for index, item in enumerate(value):
+            os.mkdir(os.path.join(directory, str(index)))
+            items.append(_encode(item, os.path.join(directory, str(index))))
+        return {"kind": "tuple", "items": items}
+    if _int_rows(value):
+        try:
+            array = np.array(value, dtype=np.int64)
+        except OverflowError:
+            pass
+        else:
+            np.save(os.path.join(directory, "0.npy"), array)
+            return {"kind": "int-list"}
+    with open(os.path.join(directory, "value.pkl"), "wb") as file:
+        pickle.dump(value, file, protocol=pickle.HIGHEST_PROTOCOL)
+    return {"kind": "pickle"}
+
+
+def _decode(manifest: dict, directory: str):
+    kind = manifest["kind"]
+    if kind == "pickle":
+        with open(os.path.join(directory, "value.pkl"), "rb") as file:
+            return pickle.load(file)
+
+    import numpy as np
+
+    if kind == "array":
+        return np.load(os.path.join(directory, "0.npy"), mmap_mode="c")
+    if kind == "arrays":
+        items = [np.load(os.path.join(directory, f"{index}.npy"), mmap_mode="c") for index in range(manifest["count"])]
+        return tuple(items) if manifest["container"] == "tuple" else items
+    if kind == "int-list":
+        return np.load(os.path.join(directory, "0.npy")).tolist()
+    if kind == "grid":
+        grid = Grid(manifest["height"], manifest["width"], border=manifest["border"], margin=manifest["margin"])
+        grid.cells[:] = memoryview(np.load(os.path.join(directory, "0.npy"), mmap_mode="r"))
+        return grid
+    if kind == "tuple":
+        return tuple(_decode(item, os.path.join(directory, str(index))) for index, item in enumerate(manifest["items"]))
+    raise ValueError(f"Unknown cache entry kind: {kind}")
+
+
+def load(key: str, cache_dir: str = DEFAULT_CACHE_DIR):
+    """Return ``(True, value)`` for a cached entry, ``(False, None)`` otherwise."""
+    directory = os.path.join(cache_dir, key)
+    try:
+        with open(os.path.join(directory, "manifest.json"), "r") as file:
+            manifest = json.load(file)
+        return True, _decode(manifest, directory)
+    except (OSError, ValueError, pickle.UnpicklingError, EOFError):
+        return False, None
+
+
+def store(key: str, value, cache_dir: str = DEFAULT_CACHE_DIR):
+    os.makedirs(cache_dir, exist_ok=True)
+    staging = tempfile.mkdtemp(prefix=f".{key}-", dir=cache_dir)
+    try:
+        manifest = _encode(value, staging)
+        with open(os.path.join(staging, "manifest.json"), "w") as file:
+            json.dump(manifest, file)
+        target = os.path.join(cache_dir, key)
+        if os.path.exists(target):
+            shutil.rmtree(target)
+        # Publish atomically so a concurrent reader never sees a half-written entry
+        os.rename(staging, target)
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+
+
+def cached_parse(day: Day, parse: Callable, text: str, cache_dir: str = DEFAULT_CACHE_DIR) -> Tuple[object, str]:
+    """Parse ``text`` through the cache, returning the value and ``"hit"`` or ``"miss"``."""
+    key = cache_key(day, text)
+    found, value = load(key, cache_dir)
+    if found:
+        return value, HIT
+    value = parse(text)
+    try:
+        store(key, value, cache_dir)
+    except (OSError, pickle.PicklingError, TypeError, AttributeError):
+        # Values that cannot be serialized (e.g. holding lambdas) are simply not cached
+        pass
+    return value, MISS
+
+
+def clear(cache_dir: str = DEFAULT_CACHE_DIR) -> int:
+    if not os.path.isdir(cache_dir):
+        return 0
+    entries = os.listdir(cache_dir)
+    shutil.rmtree(cache_dir)
+    return len(entries)
@@ -0,0 +1,253 @@
+"""Long-lived solver daemon serving JSON requests over a Unix socket.
+
+The daemon keeps solver modules imported and parsed inputs warm between
+requests, so a repeated solve only pays for the solver itself. Each request
+and response is one line of JSON:
+
+* ``{"op": "solve", "day": 1, "parts": [1, 2], "scale": null, "seed": 0}``
+  returns ``{"ok": true, "result": {...}}`` in the ``DayResult.to_dict()`` shape;
+* ``{"op": "status"}``, ``{"op": "invalidate", "day": 1}`` (all days when
+  ``day`` is omitted) and ``{"op": "shutdown"}``.
+
+Before each solve the day's ``.py`` files and input file are stat'ed: a changed
+source reloads only that day's modules, and a changed input drops only that
+day's parsed input. Parsed values are kept pickled and thawed for each part,
+because several solvers mutate their input.
+"""
+import asyncio
+import contextlib
+import io
+import json
+import os
+import pickle
+import socket
+import sys
+import traceback
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Dict, Iterable, Optional, Tuple
+
+from aoc.generators import generate
+from aoc.registry import PARTS, ROOT, Day, get_day, get_part, load_module
+from aoc.runner import DayResult, timed
+
+DEFAULT_SOCKET = os.path.join(ROOT, ".aoc_daemon.sock")
+
+WARM, COLD = "warm", "cold"
+
+
+class DaemonError(Exception):
+    pass
+
+
+@dataclass
+class WarmInput:
+    stamp: Optional[int]
+    text: str
+    frozen: Optional[bytes]
+
+
+@dataclass
+class WarmDay:
+    module: object
+    stamp: Tuple
+    inputs: Dict[Tuple[Optional[float], int], WarmInput] = field(default_factory=dict)
+
+
+def _source_stamp(day: Day) -> Tuple:
+    """Modification times of every module in the day's directory (sibling imports included)."""
+    directory = os.path.dirname(day.module_file)
+    return tuple(sorted((entry.name, entry.stat().st_mtime_ns)
+                        for entry in os.scandir(directory) if entry.name.endswith(".py")))
+
+
+def _input_stamp(day: Day) -> Optional[int]:
+    try:
+        return os.stat(day.input_file).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def _unload(day: Day):
+    directory = os.path.dirname(day.module_file)
+    for name, module in list(sys.modules.items()):
+        path = getattr(module, "__file__", None)
+        if path and os.path.dirname(os.path.abspath(path)) == directory:
+            del sys.modules[name]
+
+
+class SolverDaemon:
+    def __init__(self):
+        self.days: Dict[int, WarmDay] = {}
+        self.requests = 0
+        self.started = perf_counter()
+        self._stopped: Optional[asyncio.Event] = None
+
+    def _warm_day(self, day: Day) -> WarmDay:
+        stamp = _source_stamp(day)
+        entry = self.days.get(day.number)
+        if entry is None or entry.stamp != stamp:
+            if entry is not None:
+                _unload(day)
+            entry = WarmDay(load_module(day), stamp)
+            self.days[day.number] = entry
+        return entry
+
+    def solve(self, number: int, parts: Iterable[int] = PARTS, scale: Optional[float] = None,
+              seed: int = 0) -> DayResult:
+        day = get_day(number)
+        result = DayResult(number)
+        with contextlib.redirect_stdout(io.StringIO()):
+            try:
+                entry = timed(result, "load", self._warm_day, day)
+                stamp = _input_stamp(day) if scale is None else None
+                warm = entry.inputs.get((scale, seed))
+                if warm is not None and warm.stamp == stamp:
+                    result.cache, data = WARM, None
+                else:
+                    result.cache = COLD
+                    if scale is None:
+                        text = timed(result, "read", day.read_input)
+                    else:
+                        text = timed(result, "read", generate, number, scale, seed)
+                    data = timed(result, "parse", entry.module.parse, text)
+                    warm = WarmInput(stamp, text, _freeze(data))
+                    entry.inputs[(scale, seed)] = warm
+            except Exception:
+                result.errors["setup"] = traceback.format_exc(limit=-1).strip()
+                return result
+
+            for part in parts:
+                solver = get_part(entry.module, part)
+                if solver is None:
+                    continue
+                try:
+                    if data is None:
+                        data = self._thaw(result, entry, warm)
+                    result.answers[part] = timed(result, f"part{part}", solver, data)
+                except Exception:
+                    result.errors[f"part{part}"] = traceback.format_exc(limit=-1).strip()
+                data = None
+        return result
+
+    @staticmethod
+    def _thaw(result: DayResult, entry: WarmDay, warm: WarmInput):
+        """A private copy of the parsed input; time spent is added to the parse phase."""
+        start = perf_counter()
+        try:
+            if warm.frozen is not None:
+                return pickle.loads(warm.frozen)
+            return entry.module.parse(warm.text)
+        finally:
+            result.timings["parse"] = result.timings.get("parse", 0.0) + perf_counter() - start
+
+    def invalidate(self, number: Optional[int] = None) -> list:
+        numbers = list(self.days) if number is None else [number]
+        for number in numbers:
+            if self.days.pop(number, None) is not None:
+                _unload(get_day(number))
+        return numbers
+
+    def status(self) -> dict:
+        return {
+            "pid": os.getpid(),
+            "uptime": perf_counter() - self.started,
+            "requests": self.requests,
+            "days": {str(number): len(entry.inputs) for number, entry in sorted(self.days.items())},
+        }
+
+    def dispatch(self, request: dict) -> dict:
+        self.requests += 1
+        op = request.get("op", "solve")
+        if op == "solve":
+            result = self.solve(int(request["day"]), request.get("parts") or PARTS,
+                                request.get("scale"), request.get("seed", 0))
+            return {"result": result.to_dict()}
+        if op == "status":
+            return self.status()
+        if op == "invalidate":
+            day = request.get("day")
+            return {"invalidated": self.invalidate(None if day is None else int(day))}
+        if op == "shutdown":
+            self._stopped.set()
+            return {}
+        raise ValueError(f"Unknown op: {op}")
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while line := await reader.readline():
+                try:
+                    response = {"ok": True, **self.dispatch(json.loads(line))}
+                except Exception as e:
+                    response = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+                writer.write(json.dumps(response).encode() + b"\n")
+                await writer.drain()
+        except (asyncio.CancelledError, ConnectionError):
+            # Clients hanging up, and connections still open at shutdown, simply end the handler
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, path: str = DEFAULT_SOCKET):
+        if os.path.exists(path):
+            if _is_listening(path):
+                raise DaemonError(f"A daemon is already listening on {path}")
+            os.unlink(path)
+        self._stopped = asyncio.Event()
+        server = await asyncio.start_unix_server(self._handle, path=path)
+        try:
+            async with server:
+                await self._stopped.wait()
+        finally:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(path)
+
+
+def _freeze(data) -> Optional[bytes]:
+    try:
+        return pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        # Values that cannot be pickled (e.g. holding lambdas) are re-parsed from the text instead
+        return None
+
+
+def _is_listening(path: str) -> bool:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(path)
+        except OSError:
+            return False
+    return True
+
+
+def serve(path: str = DEFAULT_SOCKET):
+    asyncio.run(SolverDaemon().serve(path))
+
+
+def request(message: dict, path: str = DEFAULT_SOCKET, timeout: Optional[float] = None) -> dict:
+    """Send one request to a running daemon and return its response."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        try:
+            sock.connect(path)
+        except (FileNotFoundError, ConnectionRefusedError):
+            raise DaemonError(f"No daemon listening on {path}; start one with 'python -m aoc daemon'") from None
+        sock.sendall(json.dumps(message).encode() + b"\n")
+        with sock.makefile("rb") as stream:
+            line = stream.readline()
+    if not line:
+        raise DaemonError("Daemon closed the connection")
+    response = json.loads(line)
+    if not response.pop("ok", False):
+        raise DaemonError(response.get("error", "unknown error"))
+    return response
+
+
+def result_from_dict(entry: dict) -> DayResult:
+    return DayResult(
+        day=entry["day"],
+        answers={int(part): answer for part, answer in entry["answers"].items()},
+        timings=entry["timings"],
+        errors=entry["errors"],
+        cache=entry.get("cache"),
+    )
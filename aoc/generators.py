@@ -0,0 +1,495 @@
+"""Synthetic puzzle inputs at a configurable scale.
+
+``generate(day, scale, seed)`` returns input text in the same format as
+``DayN/input.txt``. A scale of 1 is roughly the size of a real puzzle input;
+larger scales multiply the number of records (reports, robots, codes, buyers,
+...) or, for grid puzzles, the number of cells. Output is fully determined by
+the seed, so runtime and memory can be compared across solver versions.
+"""
+import math
+import random
+import string
+from typing import Callable, Dict, List
+
+GENERATORS: Dict[int, Callable[[float, random.Random], str]] = {}
+
+
+def generator(day: int):
+    def register(function):
+        GENERATORS[day] = function
+        return function
+    return register
+
+
+def generate(day: int, scale: float = 1, seed: int = 0) -> str:
+    try:
+        function = GENERATORS[day]
+    except KeyError:
+        raise ValueError(f"No input generator for day {day}") from None
+    return function(scale, random.Random(seed))
+
+
+def _count(base: int, scale: float) -> int:
+    return max(1, round(base * scale))
+
+
+def _side(base: int, scale: float, minimum: int = 5) -> int:
+    """Grid side length giving ``scale`` times the cells of a ``base`` x ``base`` grid."""
+    return max(minimum, round(base * math.sqrt(scale)))
+
+
+def _odd(n: int) -> int:
+    return n if n % 2 else n + 1
+
+
+def _grid_text(grid: List[List[str]]) -> str:
+    return "\n".join("".join(row) for row in grid) + "\n"
+
+
+@generator(1)
+def day01(scale, rng):
+    rows = _count(1000, scale)
+    # Draw the right column partly from the left one so the similarity score is non-trivial
+    left = [rng.randint(10000, 99999) for _ in range(rows)]
+    right = [rng.choice(left) if rng.random() < 0.3 else rng.randint(10000, 99999) for _ in range(rows)]
+    return "".join(f"{x}   {y}\n" for x, y in zip(left, right))
+
+
+@generator(2)
+def day02(scale, rng):
+    lines = []
+    for _ in range(_count(1000, scale)):
+        level = rng.randint(1, 90)
+        sign = rng.choice((1, -1))
+        report = [level]
+        for _ in range(rng.randint(4, 7)):
+            level += sign * rng.randint(1, 3)
+            report.append(level)
+        # Break roughly two thirds of the reports with one or two bad levels
+        for _ in range(rng.choice((0, 1, 1, 2))):
+            report[rng.randrange(len(report))] += rng.choice((-5, -2, 0, 4, 7))
+        lines.append(" ".join(map(str, report)))
+    return "\n".join(lines) + "\n"
+
+
+@generator(3)
+def day03(scale, rng):
+    noise = "mul()do'nt,0123456789 +-*/<>[]{}%!@#^&?;:~whyselectfromwherewho"
+    decoys = ["mul(", "mul[3,4]", "mul(4*", "mul ( 2 , 4 )", "do_not_mul(5,5)", "don't", "do(", "mul(1234,5)"]
+    tokens = []
+    for _ in range(_count(6 * 700, scale)):
+        choice = rng.random()
+        if choice < 0.55:
+            tokens.append(f"mul({rng.randint(1, 999)},{rng.randint(1, 999)})")
+        elif choice < 0.6:
+            tokens.append("do()")
+        elif choice < 0.65:
+            tokens.append("don't()")
+        elif choice < 0.75:
+            tokens.append(rng.choice(decoys))
+        tokens.append("".join(rng.choice(noise) for _ in range(rng.randint(0, 6))))
+    text = "".join(tokens)
+    width = 3000
+    return "\n".join(text[i:i + width] for i in range(0, len(text), width)) + "\n"
+
+
+@generator(4)
+def day04(scale, rng):
+    side = _side(140, scale)
+    grid = [[rng.choice("XMAS") for _ in range(side)] for _ in range(side)]
+    return _grid_text(grid)
+
+
+@generator(5)
+def day05(scale, rng):
+    # Rules totally order a universe of 49 two-digit pages, like the real input
+    pages = rng.sample(range(10, 100), 49)
+    rank = {page: index for index, page in enumerate(pages)}
+    rules = [(a, b) for i, a in enumerate(pages) for b in pages[i + 1:]]
+    rng.shuffle(rules)
+    updates = []
+    for _ in range(_count(200, scale)):
+        update = rng.sample(pages, rng.choice(range(5, 24, 2)))
+        if rng.random() < 0.5:
+            update.sort(key=rank.__getitem__)
+        updates.append(",".join(map(str, update)))
+    return "\n".join(f"{a}|{b}" for a, b in rules) + "\n\n" + "\n".join(updates) + "\n"
+
+
+def _guard_walk(grid: List[List[str]], r: int, c: int) -> int:
+    """Cells the guard visits from ``(r, c)``, facing up, before it leaves the map (0 if it loops)."""
+    rows, cols = len(grid), len(grid[0])
+    dr, dc = -1, 0
+    seen = set()
+    cells = set()
+    while True:
+        if (r, c, dr, dc) in seen:
+            return 0
+        seen.add((r, c, dr, dc))
+        cells.add((r, c))
+        nr, nc = r + dr, c + dc
+        if not (0 <= nr < rows and 0 <= nc < cols):
+            return len(cells)
+        if grid[nr][nc] == "#":
+            dr, dc = dc, -dr
+        else:
+            r, c = nr, nc
+
+
+@generator(6)
+def day06(scale, rng):
+    side = _side(130, scale)
+    while True:
+        # About 5% obstacles, like the real input
+        grid = [["#" if rng.random() < 0.05 else "." for _ in range(side)] for _ in range(side)]
+        # Patrols on a random map are short, so keep the longest of a few starts; the puzzle also
+        # guarantees the guard eventually walks off the map, which a walk of 0 (a loop) does not
+        best, start = 0, None
+        for _ in range(32):
+            r, c = rng.randrange(side // 4, 3 * side // 4), rng.randrange(side // 4, 3 * side // 4)
+            walk = _guard_walk(grid, r, c) if grid[r][c] == "." else 0
+            if walk > best:
+                best, start = walk, (r, c)
+        if start is not None:
+            grid[start[0]][start[1]] = "^"
+            return _grid_text(grid)
+
+
+@generator(7)
+def day07(scale, rng):
+    lines = []
+    for _ in range(_count(850, scale)):
+        numbers = [rng.randint(1, 999) if rng.random() < 0.3 else rng.randint(1, 99) for _ in range(rng.randint(3, 12))]
+        target = numbers[0]
+        for number in numbers[1:]:
+            op = rng.choice("+*|")
+            if op == "+":
+                target += number
+            elif op == "*":
+                target *= number
+            else:
+                target = target * 10 ** len(str(number)) + number
+        if rng.random() < 0.4:
+            target += rng.randint(1, 1000)
+        lines.append(f"{target}: {' '.join(map(str, numbers))}")
+    return "\n".join(lines) + "\n"
+
+
+@generator(8)
+def day08(scale, rng):
+    side = _side(50, scale)
+    grid = [["."] * side for _ in range(side)]
+    frequencies = string.ascii_letters + string.digits
+    cells = rng.sample(range(side * side), min(side * side, _count(200, scale)))
+    for cell in cells:
+        grid[cell // side][cell % side] = rng.choice(frequencies)
+    return _grid_text(grid)
+
+
+@generator(9)
+def day09(scale, rng):
+    files = _count(10000, scale)
+    digits = []
+    for index in range(files):
+        digits.append(str(rng.randint(1, 9)))
+        if index < files - 1:
+            digits.append(str(rng.randint(0, 9)))
+    return "".join(digits) + "\n"
+
+
+@generator(10)
+def day10(scale, rng):
+    side = _side(46, scale)
+    offset = [rng.randrange(10) for _ in range(side)]
+    grid = [[str((r + offset[c] + c // 3) % 10) for c in range(side)] for r in range(side)]
+    # Sprinkle noise so that only some ramps lead from 0 to 9
+    for _ in range(side * side // 8):
+        grid[rng.randrange(side)][rng.randrange(side)] = str(rng.randrange(10))
+    return _grid_text(grid)
+
+
+@generator(11)
+def day11(scale, rng):
+    stones = [rng.choice((rng.randint(0, 9), rng.randint(10, 9999), rng.randint(10000, 9999999)))
+              for _ in range(_count(8, scale))]
+    return " ".join(map(str, stones)) + "\n"
+
+
+@generator(12)
+def day12(scale, rng):
+    side = _side(140, scale)
+    block = 6
+    coarse = [[rng.choice(string.ascii_uppercase) for _ in range(side // block + 2)] for _ in range(side // block + 2)]
+    grid = []
+    for r in range(side):
+        row = []
+        for c in range(side):
+            # Jitter the block borders so regions get irregular outlines
+            cr = (r + rng.randint(-2, 2)) // block
+            cc = (c + rng.randint(-2, 2)) // block
+            row.append(coarse[max(cr, 0)][max(cc, 0)])
+        grid.append(row)
+    return _grid_text(grid)
+
+
+@generator(13)
+def day13(scale, rng):
+    machines = []
+    for _ in range(_count(320, scale)):
+        ax, ay, bx, by = (rng.randint(10, 99) for _ in range(4))
+        if rng.random() < 0.6:
+            a, b = rng.randint(0, 100), rng.randint(0, 100)
+            px, py = a * ax + b * bx, a * ay + b * by
+        else:
+            px, py = rng.randint(1000, 20000), rng.randint(1000, 20000)
+        machines.append(f"Button A: X+{ax}, Y+{ay}\nButton B: X+{bx}, Y+{by}\nPrize: X={px}, Y={py}\n")
+    return "\n".join(machines)
+
+
+@generator(14)
+def day14(scale, rng):
+    # Day14 hard-codes the 101 x 103 room, so only the robot count scales
+    return "".join(
+        f"p={rng.randrange(101)},{rng.randrange(103)} v={rng.randint(-99, 99)},{rng.randint(-99, 99)}\n"
+        for _ in range(_count(500, scale))
+    )
+
+
+@generator(15)
+def day15(scale, rng):
+    side = _side(50, scale)
+    grid = [["#"] * side] + [["#"] + ["."] * (side - 2) + ["#"] for _ in range(side - 2)] + [["#"] * side]
+    for r in range(1, side - 1):
+        for c in range(1, side - 1):
+            roll = rng.random()
+            if roll < 0.08:
+                grid[r][c] = "#"
+            elif roll < 0.35:
+                grid[r][c] = "O"
+    grid[side // 2][side // 2] = "@"
+    moves = "".join(rng.choice("<>^v") for _ in range(_count(20000, scale)))
+    return _grid_text(grid) + "\n" + "\n".join(moves[i:i + 1000] for i in range(0, len(moves), 1000)) + "\n"
+
+
+@generator(16)
+def day16(scale, rng):
+    side = _odd(_side(141, scale))
+    grid = [["#"] * side for _ in range(side)]
+    # Carve a perfect maze with an iterative depth-first search ...
+    stack = [(side - 2, 1)]
+    grid[side - 2][1] = "."
+    while stack:
+        r, c = stack[-1]
+        options = [(r + dr, c + dc, dr, dc) for dr, dc in ((-2, 0), (2, 0), (0, -2), (0, 2))
+                   if 0 < r + dr < side - 1 and 0 < c + dc < side - 1 and grid[r + dr][c + dc] == "#"]
+        if not options:
+            stack.pop()
+            continue
+        nr, nc, dr, dc = rng.choice(options)
+        grid[r + dr // 2][c + dc // 2] = "."
+        grid[nr][nc] = "."
+        stack.append((nr, nc))
+    # ... then knock out some walls so there are several equally good routes
+    for _ in range(side * side // 30):
+        r, c = rng.randrange(1, side - 1), rng.randrange(1, side - 1)
+        if (r % 2) != (c % 2):
+            grid[r][c] = "."
+    grid[side - 2][1] = "S"
+    grid[1][side - 2] = "E"
+    return _grid_text(grid)
+
+
+def _day17_output(a: int, xor1: int, xor2: int) -> List[int]:
+    output = []
+    while True:
+        b = (a % 8) ^ xor1
+        b ^= (a >> b) ^ xor2
+        output.append(b % 8)
+        a >>= 3
+        if a == 0:
+            return output
+
+
+def _day17_quine_exists(program: List[int], xor1: int, xor2: int) -> bool:
+    candidates = [0]
+    for cursor in range(len(program) - 1, -1, -1):
+        candidates = [value * 8 + digit for value in candidates for digit in range(8)
+                      if value * 8 + digit and _day17_output(value * 8 + digit, xor1, xor2) == program[cursor:]]
+        if not candidates:
+            return False
+    return True
+
+
+@generator(17)
+def day17(scale, rng):
+    # The program shape is fixed by the puzzle; scale lengthens the part 1 output via register A
+    while True:
+        xor1, xor2 = rng.randrange(8), rng.randrange(8)
+        program = [2, 4, 1, xor1, 7, 5, 4, rng.randrange(8), 1, xor2, 5, 5, 0, 3, 3, 0]
+        if _day17_quine_exists(program, xor1, xor2):
+            break
+    register_a = rng.getrandbits(max(3, round(27 * scale))) | 1
+    return (f"Register A: {register_a}\nRegister B: 0\nRegister C: 0\n\n"
+            f"Program: {','.join(map(str, program))}\n")
+
+
+def _day18_exit_reachable(side: int, fallen) -> bool:
+    """Whether the exit can still be reached from the start once every byte in ``fallen`` has dropped."""
+    seen = {(0, 0)}
+    frontier = [(0, 0)]
+    while frontier:
+        x, y = frontier.pop()
+        for cell in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+            if 0 <= cell[0] < side and 0 <= cell[1] < side and cell not in fallen and cell not in seen:
+                seen.add(cell)
+                frontier.append(cell)
+    return (side - 1, side - 1) in seen
+
+
+@generator(18)
+def day18(scale, rng):
+    # Part 1 always drops 1024 bytes clear of the kept path below, and the (side - 1) ** 2 cells off
+    # that path have to hold them, so small scales bottom out at a 33 x 33 grid
+    side = _side(71, scale, minimum=33)
+    corners = ((0, 0), (side - 1, side - 1))
+    # A random monotone path between the corners is kept out of the bytes part 1 drops, so its exit stays
+    # reachable at any scale
+    moves = [(1, 0)] * (side - 1) + [(0, 1)] * (side - 1)
+    rng.shuffle(moves)
+    x = y = 0
+    path = set()
+    for dx, dy in moves:
+        x, y = x + dx, y + dy
+        path.add((x, y))
+    cells = [(x, y) for y in range(side) for x in range(side) if (x, y) not in corners]
+    on_path = [cell for cell in cells if cell in path]
+    # Enough bytes fall after part 1's to block the whole path, so that one of them can cut off the exit
+    count = max(round(len(cells) * 0.68), 1024 + len(on_path))
+    dropped = 1024
+    off_path = [cell for cell in cells if cell not in path]
+    rng.shuffle(off_path)
+    rest = off_path[dropped:] + on_path
+    rng.shuffle(rest)
+    fallen = (off_path[:dropped] + rest)[:count]
+    # Part 2 needs a byte that cuts off the exit; walling in the start always does
+    if _day18_exit_reachable(side, set(fallen)):
+        fallen += [cell for cell in ((1, 0), (0, 1)) if cell not in fallen]
+    return "".join(f"{x},{y}\n" for x, y in fallen)
+
+
+@generator(19)
+def day19(scale, rng):
+    colours = "wubrg"
+    patterns = sorted({"".join(rng.choice(colours) for _ in range(rng.randint(1, 8))) for _ in range(450)})
+    patterns = [pattern for pattern in patterns if pattern != "g"]
+    designs = []
+    for _ in range(_count(400, scale)):
+        design = ""
+        while len(design) < rng.randint(40, 60):
+            design += rng.choice(patterns)
+        if rng.random() < 0.3:
+            # Without a single-stripe "g" towel a stray "gg" is usually unmakeable
+            position = rng.randrange(len(design))
+            design = design[:position] + "gg" + design[position:]
+        designs.append(design)
+    return ", ".join(patterns) + "\n\n" + "\n".join(designs) + "\n"
+
+
+@generator(20)
+def day20(scale, rng):
+    side = _odd(_side(141, scale, minimum=7))
+    grid = [["#"] * side for _ in range(side)]
+    # A single serpentine track: corridors on odd rows joined alternately at each end
+    corridors = list(range(1, side - 1, 2))
+    for index, r in enumerate(corridors):
+        for c in range(1, side - 1):
+            grid[r][c] = "."
+        if index + 1 < len(corridors):
+            grid[r + 1][side - 2 if index % 2 == 0 else 1] = "."
+    last = corridors[-1]
+    grid[1][1] = "S"
+    grid[last][side - 2 if len(corridors) % 2 else 1] = "E"
+    return _grid_text(grid)
+
+
+@generator(21)
+def day21(scale, rng):
+    return "".join(f"{rng.randint(1, 999):03d}A\n" for _ in range(_count(5, scale)))
+
+
+@generator(22)
+def day22(scale, rng):
+    return "".join(f"{rng.randint(1, 16777215)}\n" for _ in range(_count(1540, scale)))
+
+
+@generator(23)
+def day23(scale, rng):
+    names = [a + b for a in string.ascii_lowercase for b in string.ascii_lowercase]
+    nodes = rng.sample(names, min(len(names), _count(520, scale)))
+    limit = len(nodes) * (len(nodes) - 1) // 2
+    edges = set()
+    while len(edges) < min(limit, _count(3380, scale)):
+        a, b = rng.sample(nodes, 2)
+        edges.add((min(a, b), max(a, b)))
+    return "".join(f"{a}-{b}\n" for a, b in edges)
+
+
+@generator(24)
+def day24(scale, rng):
+    bits = max(2, round(45 * scale))
+    width = max(2, len(str(bits)))
+    wire = lambda prefix, i: f"{prefix}{i:0{width}d}"
+    used = set()
+
+    def name():
+        while True:
+            candidate = "".join(rng.choice(string.ascii_lowercase) for _ in range(3))
+            if candidate not in used and candidate[0] not in "xyz":
+                used.add(candidate)
+                return candidate
+
+    # A ripple-carry adder; the final carry is the top output bit
+    gates = [[wire("x", 0), "XOR", wire("y", 0), wire("z", 0)]]
+    carry = name()
+    gates.append([wire("x", 0), "AND", wire("y", 0), carry])
+    for i in range(1, bits):
+        partial, direct, chained = name(), name(), name()
+        out_carry = wire("z", bits) if i == bits - 1 else name()
+        gates += [
+            [wire("x", i), "XOR", wire("y", i), partial],
+            [wire("x", i), "AND", wire("y", i), direct],
+            [partial, "XOR", carry, wire("z", i)],
+            [partial, "AND", carry, chained],
+            [direct, "OR", chained, out_carry],
+        ]
+        carry = out_carry
+    # Swap four pairs of outputs inside single bit adders, as in the puzzle. Only pairs where
+    # neither gate feeds the other are swapped, so the circuit stays acyclic. The two ANDs
+    # feeding the carry OR are never swapped with each other: that leaves the adder correct.
+    safe_pairs = [(0, 1), (1, 2), (2, 3), (2, 4)]
+    for i in rng.sample(range(1, bits - 1), min(4, bits - 2)):
+        first, second = rng.choice(safe_pairs)
+        first, second = 2 + 5 * (i - 1) + first, 2 + 5 * (i - 1) + second
+        gates[first][3], gates[second][3] = gates[second][3], gates[first][3]
+    for gate in gates:
+        if rng.random() < 0.5:
+            gate[0], gate[2] = gate[2], gate[0]
+    rng.shuffle(gates)
+    values = [f"{wire(prefix, i)}: {rng.randint(0, 1)}" for prefix in "xy" for i in range(bits)]
+    return "\n".join(values) + "\n\n" + "\n".join(f"{a} {op} {b} -> {out}" for a, op, b, out in gates) + "\n"
+
+
+@generator(25)
+def day25(scale, rng):
+    schematics = []
+    for _ in range(_count(500, scale)):
+        heights = [rng.randint(0, 5) for _ in range(5)]
+        is_lock = rng.random() < 0.5
+        rows = []
+        for row in range(7):
+            if is_lock:
+                rows.append("".join("#" if row <= height else "." for height in heights))
+            else:
+                rows.append("".join("#" if row >= 6 - height else "." for height in heights))
+        schematics.append("\n".join(rows))
+    return "\n\n".join(schematics) + "\n"
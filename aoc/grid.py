@@ -0,0 +1,122 @@
+"""Flat byte grid with a padded border, shared by the grid puzzles.
+
+Cells are stored row-major in a single ``bytearray`` (one byte per cell) with a
+border of ``margin`` cells (one by default) on every side. Cell ``(row, col)``
+lives at index ``(row + margin) * stride + col + margin``, so a neighbour is
+always ``index + offset`` and stepping off the map lands on the border value
+instead of needing a bounds check; a wider margin does the same for jumps of up
+to ``margin`` cells. Inner loops can then work on plain ints rather than
+coordinate tuples.
+"""
+from typing import Iterator, Optional, Tuple
+
+BORDER = 0xFF
+
+# Translation table mapping the ASCII digits to their values, for height maps
+DIGITS = bytes.maketrans(b"0123456789", bytes(range(10)))
+
+
+class Grid:
+    __slots__ = ("height", "width", "margin", "stride", "cells", "border", "orthogonal", "diagonal", "around")
+
+    def __init__(self, height: int, width: int, fill: int = 0, border: int = BORDER, margin: int = 1):
+        self.height = height
+        self.width = width
+        self.margin = margin
+        self.stride = width + 2 * margin
+        self.border = border
+        self.cells = bytearray([border]) * ((height + 2 * margin) * self.stride)
+        row = bytes([fill]) * width
+        for r in range(height):
+            start = self.index(r, 0)
+            self.cells[start:start + width] = row
+
+        stride = self.stride
+        # Clockwise from up, so turning right is ``(d + 1) % 4``
+        self.orthogonal = (-stride, 1, stride, -1)
+        self.diagonal = (-stride - 1, -stride + 1, stride + 1, stride - 1)
+        self.around = self.orthogonal + self.diagonal
+
+    @classmethod
+    def from_text(cls, text: str, table: Optional[bytes] = None, border: int = BORDER, margin: int = 1) -> "Grid":
+        """Build a grid from lines of text, optionally mapping bytes through ``table``."""
+        lines = [line.strip() for line in text.splitlines() if line.strip()]
+        grid = cls(len(lines), len(lines[0]) if lines else 0, border=border, margin=margin)
+        for r, line in enumerate(lines):
+            if len(line) != grid.width:
+                raise ValueError(f"Row {r} has {len(line)} cells, expected {grid.width}")
+            data = line.encode()
+            if table is not None:
+                data = data.translate(table)
+            start = grid.index(r, 0)
+            grid.cells[start:start + grid.width] = data
+        return grid
+
+    def index(self, row: int, col: int) -> int:
+        return (row + self.margin) * self.stride + col + self.margin
+
+    def position(self, index: int) -> Tuple[int, int]:
+        row, col = divmod(index, self.stride)
+        return row - self.margin, col - self.margin
+
+    def offset(self, d_row: int, d_col: int) -> int:
+        return d_row * self.stride + d_col
+
+    def __getitem__(self, index: int) -> int:
+        return self.cells[index]
+
+    def __setitem__(self, index: int, value: int):
+        self.cells[index] = value
+
+    def __len__(self) -> int:
+        return self.height * self.width
+
+    def __repr__(self) -> str:
+        return f"Grid({self.height}x{self.width})"
+
+    def row(self, r: int) -> memoryview:
+        """Zero-copy view of one row, without the border."""
+        start = self.index(r, 0)
+        return memoryview(self.cells)[start:start + self.width]
+
+    def indices(self, value: Optional[int] = None) -> Iterator[int]:
+        """Indices of the cells inside the border, optionally only those equal to ``value``."""
+        cells, width = self.cells, self.width
+        if value is None:
+            for r in range(self.height):
+                start = self.index(r, 0)
+                yield from range(start, start + width)
+            return
+        needle = bytes([value])
+        for r in range(self.height):
+            start = self.index(r, 0)
+            end = start + width
+            found = cells.find(needle, start, end)
+            while found != -1:
+                yield found
+                found = cells.find(needle, found + 1, end)
+
+    def find(self, value: int) -> int:
+        """Index of the first cell equal to ``value``, or -1."""
+        return next(self.indices(value), -1)
+
+    def copy(self) -> "Grid":
+        clone = Grid.__new__(Grid)
+        for name in Grid.__slots__:
+            setattr(clone, name, getattr(self, name))
+        clone.cells = bytearray(self.cells)
+        return clone
+
+    def to_text(self, table: Optional[bytes] = None) -> str:
+        rows = (bytes(self.row(r)) for r in range(self.height))
+        if table is not None:
+            rows = (row.translate(table) for row in rows)
+        return "\n".join(row.decode("latin-1") for row in rows)
+
+    def to_numpy(self, padded: bool = False):
+        """``uint8`` view of the cells (shared memory, not a copy)."""
+        import numpy as np
+
+        margin = self.margin
+        array = np.frombuffer(self.cells, dtype=np.uint8).reshape(self.height + 2 * margin, self.stride)
+        return array if padded else array[margin:margin + self.height, margin:margin + self.width]
@@ -0,0 +1,208 @@
+"""Fan days and parts out across a process pool.
+
+Each task runs in a fresh worker process (``max_tasks_per_child=1``) so that one
+day cannot leak memory, module state or mutated inputs into another. Workers
+enforce a wall-clock timeout with ``SIGALRM`` and a peak RSS limit with a
+watchdog thread; hitting either is reported as that task's error, along with
+the phase timings recorded before it.
+"""
+import os
+import resource
+import signal
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from aoc.registry import PARTS, get_day
+from aoc.runner import DayResult, format_duration, run_day
+
+
+class TaskTimeout(BaseException):
+    """Raised by the alarm handler; a BaseException so solver code cannot swallow it."""
+
+
+class TaskMemoryLimit(BaseException):
+    """Raised when the worker's peak RSS passes its limit; a BaseException for the same reason."""
+
+
+# How often the memory watchdog samples the worker's peak RSS
+MEMORY_POLL_SECONDS = 0.02
+
+_rss_limit_kb: Optional[int] = None
+# Whether the alarm and watchdog may still interrupt the task: a signal that arrives after the task
+# has finished is dropped instead of raising into the code that reports it
+_armed = False
+
+
+@dataclass
+class TaskResult:
+    day: int
+    parts: Tuple[int, ...]
+    answers: Dict[int, object] = field(default_factory=dict)
+    timings: Dict[str, float] = field(default_factory=dict)
+    errors: Dict[str, str] = field(default_factory=dict)
+    wall: float = 0.0
+    peak_rss_kb: int = 0
+
+    def to_dict(self) -> dict:
+        return {
+            "day": self.day,
+            "parts": list(self.parts),
+            "answers": {str(part): answer for part, answer in self.answers.items()},
+            "timings": self.timings,
+            "errors": self.errors,
+            "wall": self.wall,
+            "peak_rss_kb": self.peak_rss_kb,
+        }
+
+
+def _peak_rss_kb() -> int:
+    # ru_maxrss is reported in kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def _watch_rss(thread_id: int, stop: threading.Event):
+    """Interrupt the task's thread once the worker's peak RSS passes ``_rss_limit_kb``.
+
+    ``RLIMIT_AS`` would cap virtual address space instead, which NumPy and
+    memory-mapped inputs reserve well beyond what they touch. The peak is
+    sampled every ``MEMORY_POLL_SECONDS``, so a task can overshoot the limit by
+    what it allocates in between.
+    """
+    while not stop.wait(MEMORY_POLL_SECONDS):
+        if _peak_rss_kb() > _rss_limit_kb:
+            signal.pthread_kill(thread_id, signal.SIGUSR1)
+            return
+
+
+def _on_alarm(signum, frame):
+    if _armed:
+        raise TaskTimeout("task exceeded its wall-clock timeout")
+
+
+def _on_memory_limit(signum, frame):
+    if _armed:
+        raise TaskMemoryLimit(f"task exceeded its peak RSS limit ({_rss_limit_kb // 1024} MB)")
+
+
+def _run_task(number: int, parts: Tuple[int, ...], timeout: Optional[float], memory_limit_mb: Optional[int] = None,
+              scale: Optional[float] = None, seed: int = 0, use_cache: bool = False) -> dict:
+    global _armed, _rss_limit_kb
+    if scale is not None:
+        from aoc.generators import generate
+    text = generate(number, scale, seed) if scale is not None else None
+    start = perf_counter()
+    # Passed in so the phases timed before an interruption are still reported
+    result = DayResult(number)
+    stop = threading.Event()
+    watchdog = None
+    try:
+        try:
+            _armed = True
+            if timeout:
+                signal.signal(signal.SIGALRM, _on_alarm)
+                signal.setitimer(signal.ITIMER_REAL, timeout)
+            if memory_limit_mb:
+                _rss_limit_kb = memory_limit_mb * 1024
+                signal.signal(signal.SIGUSR1, _on_memory_limit)
+                watchdog = threading.Thread(target=_watch_rss, args=(threading.get_ident(), stop), daemon=True)
+                watchdog.start()
+            run_day(get_day(number), parts, text=text, quiet=True, use_cache=use_cache, result=result)
+        finally:
+            # Disarmed first, so the limits cannot interrupt anything past this point
+            _armed = False
+            if timeout:
+                signal.setitimer(signal.ITIMER_REAL, 0)
+            if watchdog is not None:
+                stop.set()
+                watchdog.join()
+                signal.signal(signal.SIGUSR1, signal.SIG_IGN)
+    # A limit hit while the task was being torn down still lands here
+    except TaskTimeout as e:
+        result.errors["timeout"] = f"TaskTimeout: {e} ({timeout}s)"
+    except TaskMemoryLimit as e:
+        result.errors["memory"] = f"TaskMemoryLimit: {e}"
+    outcome = result.to_dict()
+    outcome["wall"] = perf_counter() - start
+    outcome["peak_rss_kb"] = _peak_rss_kb()
+    return outcome
+
+
+def plan_tasks(numbers: Iterable[int], parts: Iterable[int] = PARTS, split_parts: bool = True) -> List[Tuple[int, Tuple[int, ...]]]:
+    parts = tuple(parts)
+    if split_parts:
+        return [(number, (part,)) for number in numbers for part in parts]
+    return [(number, parts) for number in numbers]
+
+
+def run_parallel(
+    numbers: Iterable[int],
+    parts: Iterable[int] = PARTS,
+    jobs: Optional[int] = None,
+    timeout: Optional[float] = None,
+    memory_limit_mb: Optional[int] = None,
+    split_parts: bool = True,
+    scale: Optional[float] = None,
+    seed: int = 0,
+    use_cache: bool = False,
+) -> Tuple[List[TaskResult], float]:
+    """Run the selected days on a process pool.
+
+    Returns the task results ordered by day and part, and the wall time of the
+    whole run.
+    """
+    tasks = plan_tasks(numbers, parts, split_parts)
+    jobs = jobs or os.cpu_count() or 1
+    results = []
+    start = perf_counter()
+    with ProcessPoolExecutor(max_workers=min(jobs, max(len(tasks), 1)), max_tasks_per_child=1) as executor:
+        futures = {
+            executor.submit(_run_task, number, task_parts, timeout, memory_limit_mb, scale, seed, use_cache):
+                (number, task_parts)
+            for number, task_parts in tasks
+        }
+        for future in as_completed(futures):
+            number, task_parts = futures[future]
+            result = TaskResult(number, task_parts)
+            try:
+                outcome = future.result()
+            # The limits are BaseExceptions, so one that escaped the worker's task is caught by name
+            except TaskTimeout as e:
+                result.errors["timeout"] = f"TaskTimeout: {e}"
+            except TaskMemoryLimit as e:
+                result.errors["memory"] = f"TaskMemoryLimit: {e}"
+            except Exception as e:
+                result.errors["worker"] = f"{type(e).__name__}: {e}"
+            else:
+                result.answers = {int(part): answer for part, answer in outcome["answers"].items()}
+                result.timings = outcome["timings"]
+                result.errors = outcome["errors"]
+                result.wall = outcome["wall"]
+                result.peak_rss_kb = outcome["peak_rss_kb"]
+            results.append(result)
+    elapsed = perf_counter() - start
+    results.sort(key=lambda result: (result.day, result.parts))
+    return results, elapsed
+
+
+def format_parallel_report(results: List[TaskResult], elapsed: float) -> str:
+    header = f"{'day':>4} {'parts':>5} {'parse':>10} {'solve':>10} {'wall':>10} {'peak rss':>10}  answers"
+    lines = [header, "-" * len(header)]
+    for result in results:
+        parse = result.timings.get("parse")
+        solve = sum(seconds for phase, seconds in result.timings.items() if phase.startswith("part"))
+        answers = ", ".join(f"{part}: {answer}" for part, answer in sorted(result.answers.items()))
+        errors = ", ".join(f"{phase} failed: {error.splitlines()[-1]}" for phase, error in result.errors.items())
+        lines.append(
+            f"{result.day:>4} {','.join(map(str, result.parts)):>5} "
+            f"{format_duration(parse) if parse is not None else '-':>10} {format_duration(solve):>10} "
+            f"{format_duration(result.wall):>10} {result.peak_rss_kb / 1024:>8.1f}MB  "
+            + "; ".join(filter(None, [answers, errors]))
+        )
+    busy = sum(result.wall for result in results)
+    lines.append("-" * len(header))
+    lines.append(f"wall {format_duration(elapsed)}, task time {format_duration(busy)}, "
+                 f"speedup {busy / elapsed if elapsed else 0:.1f}x")
+    return "\n".join(lines)
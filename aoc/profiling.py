@@ -0,0 +1,224 @@
+"""Hierarchical timing spans and counters for the solvers.
+
+Profiling is off by default: ``span`` then hands back a shared no-op context
+and ``count``/``profile`` reduce to a flag check, so instrumented code can stay
+in the hot path. After ``enable()``, spans nest into a tree that records wall
+time, counters and (with ``track_memory=True``) tracemalloc allocation and
+peak, and can be exported as JSON or in the Chrome trace event format
+(``chrome://tracing``, Perfetto).
+
+Every instrumented day imports this module, so ``json``, ``threading`` and
+``tracemalloc`` (about 20 ms together) are only imported once profiling is
+enabled or exported.
+"""
+import contextlib
+import functools
+import os
+from time import perf_counter
+from typing import Dict, List, Optional
+
+_enabled = False
+_track_memory = False
+_origin = 0.0
+_roots: List["Span"] = []
+_stack: List["Span"] = []
+_null_span = contextlib.nullcontext()
+
+
+class Span:
+    __slots__ = ("name", "start", "end", "children", "counters", "allocated", "peak", "_high_water")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.start = 0.0
+        self.end = 0.0
+        self.children: List[Span] = []
+        self.counters: Dict[str, int] = {}
+        self.allocated: Optional[int] = None
+        self.peak: Optional[int] = None
+        self._high_water = 0
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+    def __enter__(self):
+        parent = _stack[-1] if _stack else None
+        (parent.children if parent else _roots).append(self)
+        _stack.append(self)
+        if _track_memory:
+            import tracemalloc
+
+            # tracemalloc has a single peak: fold it into the parent before resetting it for this span
+            current, peak = tracemalloc.get_traced_memory()
+            if parent is not None:
+                parent._high_water = max(parent._high_water, peak)
+            tracemalloc.reset_peak()
+            self.allocated = self._high_water = current
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.end = perf_counter()
+        _stack.pop()
+        if _track_memory and self.allocated is not None:
+            import tracemalloc
+
+            current, peak = tracemalloc.get_traced_memory()
+            self._high_water = max(self._high_water, peak)
+            self.peak = self._high_water - self.allocated
+            self.allocated = current - self.allocated
+            if _stack:
+                _stack[-1]._high_water = max(_stack[-1]._high_water, self._high_water)
+        return False
+
+    def to_dict(self) -> dict:
+        entry = {"name": self.name, "start": self.start - _origin, "duration": self.duration}
+        if self.counters:
+            entry["counters"] = dict(self.counters)
+        if self.allocated is not None:
+            entry["allocated"] = self.allocated
+            entry["peak"] = self.peak
+        if self.children:
+            entry["children"] = [child.to_dict() for child in self.children]
+        return entry
+
+
+def enable(track_memory: bool = False):
+    """Start recording spans, discarding anything recorded earlier."""
+    global _enabled, _track_memory, _origin
+    reset()
+    _enabled = True
+    _track_memory = track_memory
+    _origin = perf_counter()
+    if track_memory:
+        import tracemalloc
+
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+
+def disable():
+    global _enabled, _track_memory
+    if _track_memory:
+        import tracemalloc
+
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+    _enabled = False
+    _track_memory = False
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def reset():
+    _roots.clear()
+    _stack.clear()
+
+
+def span(name: str):
+    """Context manager timing a named region, nested under the enclosing span."""
+    if not _enabled:
+        return _null_span
+    return Span(name)
+
+
+def profile(function=None, *, name: Optional[str] = None):
+    """Decorator wrapping every call of ``function`` in a span named after it."""
+    if function is None:
+        return functools.partial(profile, name=name)
+    label = name or function.__name__
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        if not _enabled:
+            return function(*args, **kwargs)
+        with Span(label):
+            return function(*args, **kwargs)
+    return wrapper
+
+
+def count(name: str, amount: int = 1):
+    """Add to a counter on the innermost open span."""
+    if _enabled and _stack:
+        counters = _stack[-1].counters
+        counters[name] = counters.get(name, 0) + amount
+
+
+def spans() -> List[Span]:
+    return list(_roots)
+
+
+def totals() -> Dict[str, int]:
+    """Counters summed over every recorded span."""
+    result: Dict[str, int] = {}
+    pending = list(_roots)
+    while pending:
+        current = pending.pop()
+        for key, value in current.counters.items():
+            result[key] = result.get(key, 0) + value
+        pending.extend(current.children)
+    return result
+
+
+def to_dict() -> dict:
+    return {"spans": [root.to_dict() for root in _roots], "counters": totals()}
+
+
+def to_chrome_trace() -> dict:
+    """Complete ("X") events in microseconds, one per span, with counters as args."""
+    import threading
+
+    events = []
+    pid, tid = os.getpid(), threading.get_ident()
+    pending = list(_roots)
+    while pending:
+        current = pending.pop()
+        args = dict(current.counters)
+        if current.allocated is not None:
+            args.update(allocated_bytes=current.allocated, peak_bytes=current.peak)
+        events.append({
+            "name": current.name,
+            "ph": "X",
+            "ts": (current.start - _origin) * 1e6,
+            "dur": current.duration * 1e6,
+            "pid": pid,
+            "tid": tid,
+            "args": args,
+        })
+        pending.extend(current.children)
+    events.sort(key=lambda event: event["ts"])
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def export_json(path: str):
+    import json
+
+    with open(path, "w") as file:
+        json.dump(to_dict(), file, indent=2)
+
+
+def export_chrome_trace(path: str):
+    import json
+
+    with open(path, "w") as file:
+        json.dump(to_chrome_trace(), file)
+
+
+def format_report() -> str:
+    lines = []
+
+    def visit(current: Span, depth: int):
+        details = [f"{current.duration:.5f} sec"]
+        if current.peak is not None:
+            details.append(f"peak {current.peak / 1024:.1f} KiB")
+        details.extend(f"{key}={value}" for key, value in current.counters.items())
+        lines.append(f"{'  ' * depth}{current.name}: {', '.join(details)}")
+        for child in current.children:
+            visit(child, depth + 1)
+
+    for root in _roots:
+        visit(root, 0)
+    return "\n".join(lines)
@@ -0,0 +1,141 @@
+"""Registry of the daily solvers and their puzzle inputs.
+
+Every solver module exposes ``parse(text)`` plus ``part1(data)`` and, where the
+puzzle has one, ``part2(data)``. Modules are imported lazily from their file
+path, so a run only pays for the days it selects.
+"""
+import importlib.util
+import os
+import runpy
+import sys
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PARTS = (1, 2)
+
+
+@dataclass(frozen=True)
+class Day:
+    number: int
+    module_path: str
+    input_path: str
+
+    @property
+    def name(self) -> str:
+        return f"day{self.number:02d}"
+
+    @property
+    def module_file(self) -> str:
+        return os.path.join(ROOT, self.module_path)
+
+    @property
+    def input_file(self) -> str:
+        return os.path.join(ROOT, self.input_path)
+
+    def read_input(self) -> str:
+        with open(self.input_file, "r") as file:
+            return file.read()
+
+
+DAYS: Dict[int, Day] = {day.number: day for day in [
+    Day(1, "Day1/day1_02.py", "Day1/day1.txt"),
+    Day(2, "Day2/day2_01.py", "Day2/input.txt"),
+    Day(3, "Day3/day3_01.py", "Day3/input.txt"),
+    Day(4, "Day4/day4_01.py", "Day4/input.txt"),
+    Day(5, "Day5/day5_01.py", "Day5/input.txt"),
+    Day(6, "Day6/day06_jump.py", "Day6/input.txt"),
+    Day(7, "Day7/day7_01.py", "Day7/input.txt"),
+    Day(8, "Day8/day08_01.py", "Day8/input.txt"),
+    Day(9, "Day9/day09_01.py", "Day9/input.txt"),
+    Day(10, "Day10/day10_01.py", "Day10/input.txt"),
+    Day(11, "Day11/day11_01.py", "Day11/input.txt"),
+    Day(12, "Day12/day12_01.py", "Day12/input.txt"),
+    Day(13, "Day13/day13_01.py", "Day13/input.txt"),
+    Day(14, "Day14/day14_01.py", "Day14/input.txt"),
+    Day(15, "Day15/day15_01.py", "Day15/input.txt"),
+    Day(16, "Day16/day16_01.py", "Day16/input.txt"),
+    Day(17, "Day 17/day17_01.py", "Day 17/input.txt"),
+    Day(18, "Day18/day18_01.py", "Day18/input.txt"),
+    Day(19, "Day19/day19.py", "Day19/input.txt"),
+    Day(20, "Day20/day20.py", "Day20/input.txt"),
+    Day(21, "Day21/day21.py", "Day21/input.txt"),
+    Day(22, "Day22/day22.py", "Day22/input.txt"),
+    # No Day23 entry: Day23/day23.py is a copy of the Day24 wire-adder solver, not a LAN-party solution
+    Day(24, "Day24/day24.py", "Day24/input.txt"),
+    Day(25, "Day25/day25.py", "Day25/input.txt"),
+]}
+
+
+def get_day(number: int) -> Day:
+    try:
+        return DAYS[number]
+    except KeyError:
+        raise ValueError(f"No solver registered for day {number}") from None
+
+
+def parse_selection(specs: Iterable[str]) -> List[int]:
+    """Expand day selections such as ``["1-5", "9,12"]`` into day numbers.
+
+    An empty selection means every registered day, and ranges only cover
+    registered days.
+    """
+    numbers = []
+    selected = False
+    for spec in specs:
+        for item in spec.split(","):
+            item = item.strip()
+            if not item:
+                continue
+            selected = True
+            if "-" in item:
+                first, last = item.split("-", 1)
+                # Ranges skip unregistered days; a day named on its own must exist
+                numbers.extend(number for number in range(int(first), int(last) + 1) if number in DAYS)
+            else:
+                numbers.append(int(item))
+    if not selected:
+        return sorted(DAYS)
+    for number in numbers:
+        get_day(number)
+    return sorted(set(numbers))
+
+
+def load_module(day: Day):
+    """Import a solver module from its file, reusing it if already loaded."""
+    module_name = f"aoc_{day.name}"
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+
+    # Sibling imports such as ``import day1_01`` resolve from the day directory
+    directory = os.path.dirname(day.module_file)
+    if directory not in sys.path:
+        sys.path.append(directory)
+
+    spec = importlib.util.spec_from_file_location(module_name, day.module_file)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[module_name]
+        raise
+    return module
+
+
+def run_script(path: str, argv: Iterable[str] = ()):
+    """Run a solver file as ``__main__``, as ``python path`` would, with the ``aoc`` package importable.
+
+    The file's directory goes first on ``sys.path`` so its sibling imports
+    resolve, and ``sys.argv`` holds ``path`` followed by ``argv``.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    if directory not in sys.path:
+        sys.path.insert(0, directory)
+    sys.argv = [path, *argv]
+    runpy.run_path(path, run_name="__main__")
+
+
+def get_part(module, part: int) -> Optional[Callable]:
+    return getattr(module, f"part{part}", None)
@@ -0,0 +1,129 @@
+"""Run any subset of the daily solvers in-process and time each phase."""
+import contextlib
+import io
+import traceback
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Dict, Iterable, List, Optional
+
+from aoc import profiling
+from aoc.registry import PARTS, Day, get_day, get_part, load_module
+
+
+@dataclass
+class DayResult:
+    day: int
+    answers: Dict[int, object] = field(default_factory=dict)
+    timings: Dict[str, float] = field(default_factory=dict)
+    errors: Dict[str, str] = field(default_factory=dict)
+    cache: Optional[str] = None
+
+    @property
+    def total(self) -> float:
+        return sum(self.timings.values())
+
+    def to_dict(self) -> dict:
+        return {
+            "day": self.day,
+            "answers": {str(part): _jsonable(answer) for part, answer in self.answers.items()},
+            "timings": self.timings,
+            "errors": self.errors,
+            "cache": self.cache,
+        }
+
+
+def _jsonable(answer):
+    if answer is None or isinstance(answer, (bool, int, float, str)):
+        return answer
+    try:
+        return int(answer)
+    except (TypeError, ValueError):
+        return str(answer)
+
+
+def timed(result: DayResult, phase: str, function, *args):
+    """Call ``function(*args)``, recording its wall time as ``phase`` of ``result`` even when it raises."""
+    with profiling.span(phase):
+        start = perf_counter()
+        try:
+            return function(*args)
+        finally:
+            result.timings[phase] = perf_counter() - start
+
+
+def run_day(day: Day, parts: Iterable[int] = PARTS, text: Optional[str] = None, quiet: bool = False,
+            use_cache: bool = False, result: Optional[DayResult] = None) -> DayResult:
+    """Load, parse and solve the requested parts of one day.
+
+    Failures are recorded against the phase that raised them so that one broken
+    day does not abort the rest of a run. With ``use_cache`` the parsed input is
+    served from the content-addressed cache in ``aoc.cache``. A caller that may
+    interrupt the run (e.g. with a timeout) can pass its own ``result`` to keep
+    the phases recorded so far.
+    """
+    result = DayResult(day.number) if result is None else result
+    output = io.StringIO() if quiet else None
+    with contextlib.redirect_stdout(output) if quiet else contextlib.nullcontext(), profiling.span(day.name):
+        try:
+            module = timed(result, "load", load_module, day)
+            if text is None:
+                text = timed(result, "read", day.read_input)
+            if use_cache:
+                from aoc.cache import cached_parse
+
+                data, result.cache = timed(result, "parse", cached_parse, day, module.parse, text)
+            else:
+                data = timed(result, "parse", module.parse, text)
+        except Exception:
+            result.errors["setup"] = traceback.format_exc(limit=-1).strip()
+            return result
+
+        for part in parts:
+            solver = get_part(module, part)
+            if solver is None:
+                continue
+            try:
+                result.answers[part] = timed(result, f"part{part}", solver, data)
+            except Exception:
+                result.errors[f"part{part}"] = traceback.format_exc(limit=-1).strip()
+    return result
+
+
+def run_days(numbers: Iterable[int], parts: Iterable[int] = PARTS, quiet: bool = False,
+             scale: Optional[float] = None, seed: int = 0, use_cache: bool = False) -> List[DayResult]:
+    """Run each day on its puzzle input, or on a generated input when ``scale`` is given."""
+    parts = tuple(parts)
+    if scale is not None:
+        from aoc.generators import generate
+    results = []
+    for number in numbers:
+        text = generate(number, scale, seed) if scale is not None else None
+        results.append(run_day(get_day(number), parts, text=text, quiet=quiet, use_cache=use_cache))
+    return results
+
+
+def format_duration(seconds: float) -> str:
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.0f} µs"
+    if seconds < 1:
+        return f"{seconds * 1e3:.2f} ms"
+    return f"{seconds:.3f} s"
+
+
+def format_report(results: List[DayResult]) -> str:
+    phases = ["load", "read", "parse", "part1", "part2"]
+    header = f"{'day':>4} " + " ".join(f"{phase:>10}" for phase in phases) + f" {'total':>10}  answers"
+    lines = [header, "-" * len(header)]
+    for result in results:
+        cells = [format_duration(result.timings[phase]) if phase in result.timings else "-" for phase in phases]
+        answers = ", ".join(f"{part}: {answer}" for part, answer in sorted(result.answers.items()))
+        if result.cache:
+            answers += f" (cache {result.cache})"
+        errors = ", ".join(f"{phase} failed: {error.splitlines()[-1]}" for phase, error in result.errors.items())
+        lines.append(
+            f"{result.day:>4} " + " ".join(f"{cell:>10}" for cell in cells)
+            + f" {format_duration(result.total):>10}  " + "; ".join(filter(None, [answers, errors]))
+        )
+    lines.append("-" * len(header))
+    lines.append(f"{'all':>4} {'':>54} {format_duration(sum(r.total for r in results)):>10}")
+    return "\n".join(lines)
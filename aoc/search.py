@@ -0,0 +1,211 @@
+"""Shortest-path searches over integer-encoded states.
+
+States are plain ints in ``range(size)``, typically a ``aoc.grid.Grid`` cell
+index or ``cell * 4 + direction``, so distances, closed sets and predecessors
+live in flat lists indexed by state instead of dicts of tuples. Each search is
+driven by a ``neighbors(state)`` function: it yields ``(next_state, cost)``
+pairs (costs are non-negative ints), except for ``bfs`` where every step costs
+one and it yields bare states.
+
+All searches accept several start states (multi-source), an optional
+``goal(state)`` predicate that stops the search once the goal distance is
+settled, and ``record_dag=True`` to keep every predecessor on a shortest path
+rather than a single parent.
+"""
+from dataclasses import dataclass
+from heapq import heappop, heappush
+from typing import Callable, Iterable, List, Optional, Set
+
+from aoc import profiling
+
+INF = float("inf")
+
+
+@dataclass
+class SearchResult:
+    dist: list
+    parents: Optional[List[Optional[List[int]]]]
+    goals: List[int]
+    expanded: int
+
+    @property
+    def goal(self) -> Optional[int]:
+        return self.goals[0] if self.goals else None
+
+    def distance(self, state: int):
+        return self.dist[state]
+
+    def path(self, state: int) -> List[int]:
+        """One shortest path from a start to ``state`` (needs ``record_dag``)."""
+        if self.parents is None:
+            raise ValueError("Search was run without record_dag")
+        if self.dist[state] == INF:
+            return []
+        path = [state]
+        while self.parents[state]:
+            state = self.parents[state][0]
+            path.append(state)
+        path.reverse()
+        return path
+
+    def backtrack(self, states: Iterable[int]) -> Set[int]:
+        """Every state lying on some shortest path to one of ``states`` (needs ``record_dag``)."""
+        if self.parents is None:
+            raise ValueError("Search was run without record_dag")
+        parents = self.parents
+        seen = set()
+        pending = [state for state in states if self.dist[state] != INF]
+        while pending:
+            state = pending.pop()
+            if state in seen:
+                continue
+            seen.add(state)
+            if parents[state]:
+                pending.extend(parents[state])
+        return seen
+
+
+def _relax(dist, parents, state, next_state, distance) -> bool:
+    """Record ``distance`` for ``next_state``; True when it is an improvement."""
+    known = dist[next_state]
+    if distance < known:
+        dist[next_state] = distance
+        if parents is not None:
+            parents[next_state] = [state]
+        return True
+    if parents is not None and distance == known and state not in parents[next_state]:
+        parents[next_state].append(state)
+    return False
+
+
+def dijkstra(starts: Iterable[int], neighbors: Callable, size: int, goal: Optional[Callable] = None,
+             record_dag: bool = False, heuristic: Optional[Callable] = None) -> SearchResult:
+    """Dijkstra's algorithm, or A* when a consistent ``heuristic(state)`` is given.
+
+    Heap entries are single ints (``priority * size + state``) so pushes do not
+    allocate tuples.
+    """
+    dist = [INF] * size
+    parents = [None] * size if record_dag else None
+    closed = bytearray(size)
+    heap = []
+    for start in starts:
+        dist[start] = 0
+        if parents is not None:
+            parents[start] = []
+        heappush(heap, (heuristic(start) if heuristic else 0) * size + start)
+
+    goals = []
+    best = INF
+    expanded = 0
+    while heap:
+        priority, state = divmod(heappop(heap), size)
+        if closed[state]:
+            continue
+        if priority > best:
+            break
+        closed[state] = 1
+        expanded += 1
+        distance = dist[state]
+        if goal is not None and goal(state):
+            goals.append(state)
+            best = distance
+            if not record_dag:
+                break
+            continue
+        for next_state, cost in neighbors(state):
+            if _relax(dist, parents, state, next_state, distance + cost):
+                heappush(heap, (distance + cost + (heuristic(next_state) if heuristic else 0)) * size + next_state)
+
+    profiling.count("states expanded", expanded)
+    return SearchResult(dist, parents, goals, expanded)
+
+
+def astar(starts: Iterable[int], neighbors: Callable, size: int, heuristic: Callable,
+          goal: Optional[Callable] = None, record_dag: bool = False) -> SearchResult:
+    return dijkstra(starts, neighbors, size, goal, record_dag, heuristic)
+
+
+def bucket_search(starts: Iterable[int], neighbors: Callable, size: int, max_cost: int,
+                  goal: Optional[Callable] = None, record_dag: bool = False) -> SearchResult:
+    """Dial's algorithm: a ring of ``max_cost + 1`` buckets replaces the heap for small integer costs."""
+    dist = [INF] * size
+    parents = [None] * size if record_dag else None
+    closed = bytearray(size)
+    ring = max_cost + 1
+    buckets: List[List[int]] = [[] for _ in range(ring)]
+    pending = 0
+    for start in starts:
+        dist[start] = 0
+        if parents is not None:
+            parents[start] = []
+        buckets[0].append(start)
+        pending += 1
+
+    goals = []
+    expanded = 0
+    distance = 0
+    while pending and not (goals and distance > dist[goals[0]]):
+        bucket = buckets[distance % ring]
+        # Zero-cost moves append to the bucket being drained, so pop until it is empty
+        while bucket:
+            state = bucket.pop()
+            pending -= 1
+            if closed[state] or dist[state] != distance:
+                continue
+            closed[state] = 1
+            expanded += 1
+            if goal is not None and goal(state):
+                goals.append(state)
+                if not record_dag:
+                    pending = 0
+                    break
+                continue
+            for next_state, cost in neighbors(state):
+                if _relax(dist, parents, state, next_state, distance + cost):
+                    buckets[(distance + cost) % ring].append(next_state)
+                    pending += 1
+        distance += 1
+
+    profiling.count("states expanded", expanded)
+    return SearchResult(dist, parents, goals, expanded)
+
+
+def zero_one_bfs(starts: Iterable[int], neighbors: Callable, size: int, goal: Optional[Callable] = None,
+                 record_dag: bool = False) -> SearchResult:
+    return bucket_search(starts, neighbors, size, 1, goal, record_dag)
+
+
+def bfs(starts: Iterable[int], neighbors: Callable, size: int, goal: Optional[Callable] = None,
+        record_dag: bool = False) -> SearchResult:
+    """Breadth-first search where ``neighbors(state)`` yields bare states, one step each."""
+    dist = [INF] * size
+    parents = [None] * size if record_dag else None
+    frontier = []
+    for start in starts:
+        if dist[start] == INF:
+            dist[start] = 0
+            if parents is not None:
+                parents[start] = []
+            frontier.append(start)
+
+    goals = []
+    expanded = 0
+    distance = 0
+    while frontier:
+        following = []
+        for state in frontier:
+            expanded += 1
+            if goal is not None and goal(state):
+                goals.append(state)
+                continue
+            for next_state in neighbors(state):
+                if _relax(dist, parents, state, next_state, distance + 1):
+                    following.append(next_state)
+        if goals:
+            break
+        frontier = following
+        distance += 1
+
+    profiling.count("states expanded", expanded)
+    return SearchResult(dist, parents, goals, expanded)
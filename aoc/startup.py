@@ -0,0 +1,180 @@
+"""Cold-start analysis: import cost, module-level work and first-call latency per day.
+
+Every day is probed in a fresh interpreter started with ``-X importtime``, so
+each one pays for its own dependencies exactly as a cold run would. The probe
+loads the solver module by path, with nothing but ``importlib`` imported
+beforehand, and brackets the load with markers on stderr. The importtime lines
+between the markers are the imports the module triggered. Top-level entries
+are its direct dependencies, and whatever load time they do not account for is
+work executed at module level. The probe then times the first two calls of
+``parse`` (the gap is lazy imports and warm-up inside the parser) and,
+optionally, the first call of ``part1``.
+"""
+import json
+import re
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Iterable, List, Optional, Tuple
+
+from aoc.registry import DAYS, ROOT, get_day
+from aoc.runner import format_duration
+
+_MARKER = "-- aoc probe"
+_IMPORT_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)")
+
+_PROBE = """
+import importlib.util, io, json, os, sys, contextlib
+from time import perf_counter
+number, path, input_path, solve = {number!r}, {path!r}, {input_path!r}, {solve!r}
+sys.path.append(os.path.dirname(path))
+sys.stderr.write("{marker} start\\n"); sys.stderr.flush()
+start = perf_counter()
+spec = importlib.util.spec_from_file_location("aoc_day%02d" % number, path)
+module = importlib.util.module_from_spec(spec)
+sys.modules[spec.name] = module
+with contextlib.redirect_stdout(io.StringIO()):
+    spec.loader.exec_module(module)
+    load = perf_counter() - start
+    sys.stderr.write("{marker} end\\n"); sys.stderr.flush()
+    with open(input_path) as file:
+        text = file.read()
+    calls = []
+    for _ in range(2):
+        start = perf_counter()
+        data = module.parse(text)
+        calls.append(perf_counter() - start)
+    part1 = None
+    if solve and hasattr(module, "part1"):
+        start = perf_counter()
+        module.part1(data)
+        part1 = perf_counter() - start
+print(json.dumps({{"load": load, "parse": calls, "part1": part1}}))
+"""
+
+
+@dataclass
+class ImportCost:
+    name: str
+    self_time: float
+    cumulative: float
+
+
+@dataclass
+class StartupProfile:
+    day: int
+    load: float = 0.0
+    imports: List[ImportCost] = field(default_factory=list)
+    first_parse: float = 0.0
+    second_parse: float = 0.0
+    first_part1: Optional[float] = None
+    error: Optional[str] = None
+
+    @property
+    def import_time(self) -> float:
+        return sum(cost.cumulative for cost in self.imports)
+
+    @property
+    def module_work(self) -> float:
+        """Load time not spent importing dependencies: the module body itself."""
+        return max(0.0, self.load - self.import_time)
+
+    def to_dict(self) -> dict:
+        return {
+            "day": self.day,
+            "load": self.load,
+            "import_time": self.import_time,
+            "module_work": self.module_work,
+            "imports": [{"name": cost.name, "self": cost.self_time, "cumulative": cost.cumulative}
+                        for cost in self.imports],
+            "first_parse": self.first_parse,
+            "second_parse": self.second_parse,
+            "first_part1": self.first_part1,
+            "error": self.error,
+        }
+
+
+def parse_importtime(lines: Iterable[str]) -> List[ImportCost]:
+    """Direct (least indented) imports in a block of ``-X importtime`` output, in seconds."""
+    entries = []
+    for line in lines:
+        match = _IMPORT_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            entries.append((len(indent), ImportCost(name, int(self_us) / 1e6, int(cumulative_us) / 1e6)))
+    if not entries:
+        return []
+    top = min(depth for depth, _ in entries)
+    return [cost for depth, cost in entries if depth == top]
+
+
+def _between_markers(stderr: str) -> List[str]:
+    lines, inside = [], False
+    for line in stderr.splitlines():
+        if line.startswith(_MARKER):
+            inside = line.endswith("start")
+            continue
+        if inside:
+            lines.append(line)
+    return lines
+
+
+def probe_day(number: int, solve: bool = False) -> StartupProfile:
+    day = get_day(number)
+    profile = StartupProfile(number)
+    script = _PROBE.format(number=number, path=day.module_file, input_path=day.input_file, solve=solve,
+                           marker=_MARKER)
+    process = subprocess.run([sys.executable, "-X", "importtime", "-c", script], capture_output=True, text=True,
+                             cwd=ROOT)
+    if process.returncode != 0:
+        profile.error = process.stderr.strip().splitlines()[-1] if process.stderr.strip() else "probe failed"
+    profile.imports = parse_importtime(_between_markers(process.stderr))
+    if process.stdout.strip():
+        outcome = json.loads(process.stdout.strip().splitlines()[-1])
+        profile.load = outcome["load"]
+        profile.first_parse, profile.second_parse = outcome["parse"]
+        profile.first_part1 = outcome["part1"]
+    return profile
+
+
+def _wall(arguments: List[str]) -> float:
+    start = perf_counter()
+    subprocess.run([sys.executable, *arguments], capture_output=True, cwd=ROOT)
+    return perf_counter() - start
+
+
+def suite_startup(numbers: Iterable[int]) -> Tuple[float, float]:
+    """Wall time of a bare interpreter, and of one interpreter importing every selected day."""
+    loader = ("import sys; sys.path.insert(0, {root!r}); from aoc.registry import get_day, load_module; "
+              "[load_module(get_day(n)) for n in {numbers!r}]").format(root=ROOT, numbers=list(numbers))
+    return _wall(["-c", "pass"]), _wall(["-c", loader])
+
+
+def profile_startup(numbers: Optional[Iterable[int]] = None, solve: bool = False) -> List[StartupProfile]:
+    return [probe_day(number, solve) for number in (numbers or sorted(DAYS))]
+
+
+def format_startup_report(profiles: List[StartupProfile], interpreter: Optional[float] = None,
+                          suite: Optional[float] = None, top: int = 3) -> str:
+    header = (f"{'day':>4} {'load':>10} {'imports':>10} {'module':>10} {'parse#1':>10} {'parse#2':>10} "
+              f"{'part1#1':>10}  heaviest imports")
+    lines = [header, "-" * len(header)]
+    for profile in profiles:
+        heaviest = sorted(profile.imports, key=lambda cost: cost.cumulative, reverse=True)[:top]
+        notes = ", ".join(f"{cost.name} {format_duration(cost.cumulative)}" for cost in heaviest)
+        if profile.error:
+            notes = f"{notes}; failed: {profile.error}" if notes else f"failed: {profile.error}"
+        part1 = format_duration(profile.first_part1) if profile.first_part1 is not None else "-"
+        lines.append(
+            f"{profile.day:>4} {format_duration(profile.load):>10} {format_duration(profile.import_time):>10} "
+            f"{format_duration(profile.module_work):>10} {format_duration(profile.first_parse):>10} "
+            f"{format_duration(profile.second_parse):>10} {part1:>10}  {notes}"
+        )
+    lines.append("-" * len(header))
+    lines.append(f"{'sum':>4} {format_duration(sum(profile.load for profile in profiles)):>10} "
+                 f"(each day in its own interpreter, so shared dependencies are counted once per day)")
+    if interpreter is not None and suite is not None:
+        lines.append(f"interpreter startup {format_duration(interpreter)}, "
+                     f"all selected days in one interpreter {format_duration(suite)}")
+    return "\n".join(lines)
@@ -0,0 +1,2 @@
+"""Marks the repository root for pytest, which puts this directory on ``sys.path`` (``rootdir``
+conftest), so the tests import ``aoc`` and the day modules the same way ``python -m aoc`` does."""
@@ -0,0 +1,41 @@
+"""Fixtures shared by the tests: the solver modules under test and the seeds of their generated inputs.
+
+A test module that covers one day names it in ``DAY``; the ``day`` and
+``solve`` fixtures then work on that day's registered solver.
+"""
+import importlib
+
+import pytest
+
+from aoc.registry import get_day, load_module
+
+
+@pytest.fixture(params=range(3), ids="seed{}".format)
+def seed(request):
+    """Seed of a generated input; a test that takes it runs once per seed."""
+    return request.param
+
+
+@pytest.fixture(scope="session")
+def solver():
+    """Loader of solver modules: ``solver(6)`` is the registered Day6 module, and ``solver(6, "day06_parallel")``
+    another module from its directory, which loading the day put on ``sys.path``."""
+    def load(number, name=None):
+        module = load_module(get_day(number))
+        return module if name is None else importlib.import_module(name)
+    return load
+
+
+@pytest.fixture(scope="module")
+def day(request, solver):
+    """The registered solver of the test module's ``DAY``."""
+    return solver(request.module.DAY)
+
+
+@pytest.fixture(scope="module")
+def solve(day):
+    """Both answers of ``day`` for an input text, from a single parse."""
+    def run(text):
+        data = day.parse(text)
+        return day.part1(data), day.part2(data)
+    return run
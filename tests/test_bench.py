@@ -0,0 +1,38 @@
+"""Bench history: each input keeps its own baseline."""
+import json
+from dataclasses import asdict
+
+from aoc.bench import BenchResult, baseline_results, find_regressions, load_history, record_run, summarize
+
+
+def results(median):
+    return [summarize("day01.part1", [median] * 3, 1.0)]
+
+
+def test_baselines_are_kept_per_input():
+    history = {"baselines": {}, "runs": []}
+    record_run(history, results(1.0))
+    record_run(history, results(5.0), scale=2, seed=1)
+    record_run(history, results(9.0), scale=2, seed=1)
+    # Each input is compared with the first run measured on it, never with another input's
+    assert baseline_results(history)["day01.part1"]["median"] == 1.0
+    assert baseline_results(history, 2, 1)["day01.part1"]["median"] == 5.0
+    assert baseline_results(history, 2, 2) == {}
+    assert [regression.key for regression in find_regressions(results(9.0), baseline_results(history, 2, 1), 0.1)] \
+        == ["day01.part1"]
+
+    record_run(history, results(9.0), scale=2, seed=1, as_baseline=True)
+    assert baseline_results(history, 2, 1)["day01.part1"]["median"] == 9.0
+    assert baseline_results(history)["day01.part1"]["median"] == 1.0
+
+
+def test_single_baseline_histories_are_migrated(tmp_path):
+    path = tmp_path / "history.json"
+    failed = BenchResult.failed("day01.parse", "boom")
+    history = {"baseline": 1, "runs": [{"scale": None, "seed": 0, "results": {}},
+                                       {"scale": 0.5, "seed": 3, "results": {failed.key: asdict(failed)}}]}
+    path.write_text(json.dumps(history))
+    migrated = load_history(str(path))
+    assert migrated["baselines"] == {"scale=0.5,seed=3": 1}
+    assert baseline_results(migrated) == {}
+    assert list(baseline_results(migrated, 0.5, 3)) == ["day01.parse"]
@@ -0,0 +1,35 @@
+"""The parsed-input cache round-trips values in the form the solvers parsed them."""
+import json
+import os
+
+import pytest
+
+from aoc.cache import HIT, MISS, cache_key, cached_parse
+from aoc.generators import generate
+from aoc.registry import get_day
+
+
+@pytest.mark.parametrize("number", [10, 18])
+def test_grids_are_stored_as_npy(solver, number, tmp_path):
+    day = get_day(number)
+    module = solver(number)
+    parse = module.parse
+    text = generate(number, 0.1, 0)
+    parsed, status = cached_parse(day, parse, text, str(tmp_path))
+    assert status == MISS
+    cached, status = cached_parse(day, parse, text, str(tmp_path))
+    assert status == HIT
+
+    entry = tmp_path / cache_key(day, text)
+    with open(entry / "manifest.json") as file:
+        assert json.load(file)["kind"] in ("grid", "tuple")
+    grid_file = "0.npy" if number == 10 else os.path.join("0", "0.npy")
+    assert (entry / grid_file).exists()
+
+    parsed_grid, cached_grid = (parsed, cached) if number == 10 else (parsed[0], cached[0])
+    assert (cached_grid.height, cached_grid.width, cached_grid.margin) == (parsed_grid.height, parsed_grid.width,
+                                                                            parsed_grid.margin)
+    assert type(cached_grid.cells) is bytearray and cached_grid.cells == parsed_grid.cells
+    if number == 18:
+        assert cached[1] == parsed[1]
+    assert (module.part1(cached), module.part2(cached)) == (module.part1(parsed), module.part2(parsed))
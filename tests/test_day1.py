@@ -0,0 +1,62 @@
+"""Day1's bulk parser, chunked loader and searchsorted similarity against plain Python."""
+import random
+from collections import Counter
+
+import numpy as np
+import pytest
+
+from aoc.generators import generate
+
+DAY = 1
+
+
+def reference(text):
+    pairs = [tuple(map(int, line.split())) for line in text.splitlines() if line.strip()]
+    left, right = sorted(x for x, _ in pairs), sorted(y for _, y in pairs)
+    counts = Counter(right)
+    return sum(abs(x - y) for x, y in zip(left, right)), sum(x * counts[x] for x in left)
+
+
+def ragged_text(seed, lines=500):
+    """Lines of varying widths and spacing, which skip the fixed-width fast path."""
+    rng = random.Random(seed)
+    return "\n".join(f"{rng.randint(0, 10 ** rng.randint(1, 6))}{' ' * rng.randint(1, 4)}{rng.randint(0, 999)}"
+                     for _ in range(lines)) + "\n"
+
+
+def test_parts_match_reference(solve, seed):
+    for text in (generate(1, 0.5, seed), ragged_text(seed)):
+        assert solve(text) == reference(text)
+
+
+def test_parse_without_trailing_newline_and_empty(day):
+    text = generate(1, 0.1, 0)
+    assert [list(column) for column in day.parse(text.rstrip())] == [list(column) for column in day.parse(text)]
+    assert [len(column) for column in day.parse("")] == [0, 0]
+    with pytest.raises(ValueError):
+        day.parse("1 2\n3\n")
+
+
+@pytest.mark.parametrize("chunk_bytes", [7, 64, 1000])
+def test_chunked_loading_matches_parse(day, solver, tmp_path, chunk_bytes):
+    for index, text in enumerate((generate(1, 0.2, 1), ragged_text(1, 200))):
+        path = tmp_path / f"day1-{index}.txt"
+        path.write_text(text)
+        X, Y = solver(1, "day1_01").load_columns(str(path), chunk_bytes)
+        expected_X, expected_Y = day.parse(text)
+        assert np.array_equal(X, expected_X) and np.array_equal(Y, expected_Y)
+
+
+@pytest.mark.parametrize("chunk_bytes, block_rows", [(50, 3), (500, 16), (1 << 20, 1 << 16)])
+def test_external_sort_matches_reference(solver, tmp_path, chunk_bytes, block_rows):
+    day1_external = solver(1, "day1_external")
+    for index, text in enumerate((generate(1, 0.3, 2), ragged_text(2, 300))):
+        path = tmp_path / f"day1-{index}.txt"
+        path.write_text(text)
+        assert day1_external.total_distance(str(path), chunk_bytes, block_rows, str(tmp_path)) == reference(text)[0]
+
+
+def test_external_sort_rejects_uneven_lists(solver):
+    left = [np.arange(3)]
+    with pytest.raises(ValueError):
+        solver(1, "day1_external").paired_distance(left, [np.arange(2)])
@@ -0,0 +1,50 @@
+"""Day2's vectorized safety checks and prefix/suffix dampener against removing each level in turn."""
+import random
+
+import pytest
+
+from aoc.generators import generate
+
+DAY = 2
+
+
+def is_safe(levels):
+    steps = [after - before for before, after in zip(levels, levels[1:])]
+    return all(1 <= step <= 3 for step in steps) or all(-3 <= step <= -1 for step in steps)
+
+
+def reference_parts(text):
+    reports = [list(map(int, line.split())) for line in text.splitlines() if line.strip()]
+    return (sum(is_safe(levels) for levels in reports),
+            sum(any(is_safe(levels[:i] + levels[i + 1:]) for i in range(len(levels))) for levels in reports))
+
+
+def ragged_text(seed, reports=400):
+    """Reports of 1 to 9 levels, mostly near-monotonic so that one removal often decides them."""
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(reports):
+        level = rng.randint(1, 20)
+        levels = [level]
+        for _ in range(rng.randint(0, 8)):
+            level += rng.choice([1, 2, 3, 3, 0, 4, -1, 7]) * rng.choice([1, 1, 1, -1])
+            levels.append(level)
+        lines.append(" ".join(map(str, levels)))
+    return "\n".join(lines) + "\n"
+
+
+def test_parts_match_reference(solve, seed):
+    for text in (generate(2, 0.2, seed), ragged_text(seed)):
+        assert solve(text) == reference_parts(text)
+
+
+@pytest.mark.parametrize("text", ["7\n", "7 3\n", "1 9\n5\n", "1 2 9\n", "9 1 2\n", "1 5 2\n", "1 2 3 2 1\n"])
+def test_short_reports_match_reference(solve, text):
+    assert solve(text) == reference_parts(text)
+
+
+def test_small_batches_match_reference(day, solve, seed, monkeypatch):
+    # Batches of a few reports, the last one partial, split the padded array between passes
+    monkeypatch.setattr(day, "BATCH_ROWS", 7)
+    text = ragged_text(seed, reports=100)
+    assert solve(text) == reference_parts(text)
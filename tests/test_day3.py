@@ -0,0 +1,51 @@
+"""Day3's single-pass scanner and its memory-mapped map-reduce against the two-pass regex solvers."""
+import random
+
+import pytest
+
+from aoc.generators import generate
+
+DAY = 3
+PIECES = ["mul(", "mul(12,34)", "mul(1,2)", "mul(123,456)", "mul(1234,5)", "mul(4*", "do()", "don't()", "don't",
+          "do(", ")", ",", "7", "x", "mul ( 2 , 3 )", "\n"]
+
+
+def reference_parts(day, text):
+    return day.calculate_multiplications(text), day.calculate_multiplications_with_control(text)
+
+
+def token_soup(seed, pieces=300):
+    """Whole, broken and nested tokens run together, so matches start and end at every offset."""
+    rng = random.Random(seed)
+    return "".join(rng.choice(PIECES) for _ in range(pieces))
+
+
+def test_parts_match_two_pass(day, solve, seed):
+    for text in (generate(3, 0.2, seed), token_soup(seed)):
+        assert solve(text) == reference_parts(day, text)
+
+
+@pytest.mark.parametrize("text", ["", "mul(2,3)", "don't()mul(2,3)", "don't()do()mul(2,3)", "do()don't()mul(2,3)",
+                                  "mul(2,3)don't()mul(4,5)do()mul(6,7)", "mul(don't()2,3)", "don't()mul(2,3)don't()"])
+def test_control_tokens_match_two_pass(day, solve, text):
+    assert solve(text) == reference_parts(day, text)
+
+
+@pytest.mark.parametrize("chunk_bytes", [1, 3, 7, 11, 64])
+def test_chunk_summaries_match_two_pass(day, solver, seed, chunk_bytes):
+    # Chunks shorter than a token split "mul(12,34)" and "don't()" at every offset
+    day3_parallel = solver(3, "day3_parallel")
+    data = token_soup(seed).encode()
+    summaries = [day3_parallel.summarize(data, start, end)
+                 for start, end in day3_parallel.chunk_bounds(len(data), chunk_bytes)]
+    assert day3_parallel.combine(summaries) == reference_parts(day, data.decode())
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_mapped_file_matches_two_pass(day, solver, tmp_path, jobs):
+    day3_parallel = solver(3, "day3_parallel")
+    for index, text in enumerate((generate(3, 0.2, 0), token_soup(0), "")):
+        path = tmp_path / f"day3-{index}.txt"
+        path.write_text(text)
+        for chunk_bytes in (5, 13, 1 << 20):
+            assert day3_parallel.scan_file(str(path), jobs, chunk_bytes) == reference_parts(day, text)
@@ -0,0 +1,54 @@
+"""Day4's bit-packed word search and Aho-Corasick dictionary search against a cell-by-cell scan."""
+import random
+
+from aoc.generators import generate
+
+DAY = 4
+DIRECTIONS = [(dr, dc) for dr in (-1, 0, 1) for dc in (-1, 0, 1) if dr or dc]
+
+
+def reference_count(lines, word):
+    """Occurrences of ``word`` read from every cell in every direction."""
+    rows, cols = len(lines), len(lines[0])
+    return sum(
+        all(0 <= r + i * dr < rows and 0 <= c + i * dc < cols and lines[r + i * dr][c + i * dc] == letter
+            for i, letter in enumerate(word))
+        for r in range(rows) for c in range(cols) for dr, dc in DIRECTIONS
+    )
+
+
+def reference_crosses(lines):
+    """3x3 windows with MAS forwards or backwards on both diagonals."""
+    return sum(
+        {lines[r - 1][c - 1] + lines[r + 1][c + 1], lines[r - 1][c + 1] + lines[r + 1][c - 1]} <= {"MS", "SM"}
+        and lines[r][c] == "A"
+        for r in range(1, len(lines) - 1) for c in range(1, len(lines[0]) - 1)
+    )
+
+
+def random_lines(seed, rows, cols, letters="XMAS"):
+    rng = random.Random(seed)
+    return ["".join(rng.choice(letters) for _ in range(cols)) for _ in range(rows)]
+
+
+def grids(seed):
+    yield generate(4, 0.2, seed).split()
+    # Narrow, wide (more than one 64-bit word per row) and tiny grids
+    for rows, cols in ((40, 3), (5, 150), (1, 1), (2, 70)):
+        yield random_lines(seed, rows, cols)
+
+
+def test_bitmask_search_matches_reference(day, seed):
+    for lines in grids(seed):
+        grid = day.parse("\n".join(lines))
+        assert day.part1(grid) == reference_count(lines, "XMAS")
+        assert day.part2(grid) == reference_crosses(lines)
+        for word in ("MAS", "SAS", "X", "XMASXMASX"):
+            assert day.count_word(day.LetterBits(grid), word) == reference_count(lines, word)
+
+
+def test_dictionary_search_matches_reference(day, solver, seed):
+    words = ["XMAS", "MAS", "SAS", "AMMA", "S", "SX", "XMASXMASX", "QQ", "XMAS"]
+    for lines in grids(seed):
+        counts = solver(4, "day4_dictionary").count_words(day.parse("\n".join(lines)), words)
+        assert counts == {word: reference_count(lines, word) for word in words}
@@ -0,0 +1,70 @@
+"""Day5's indexed rules, comparator repair and batch validation against pairwise checks."""
+import random
+
+from aoc.generators import generate
+
+DAY = 5
+
+
+def reference_ordered(update, rules):
+    """No page comes after a page it must precede, checked for every pair."""
+    return not any((later, earlier) in rules for i, earlier in enumerate(update) for later in update[i + 1:])
+
+
+def reference_parts(text):
+    rules_section, updates_section = text.strip().split("\n\n")
+    rules = {tuple(map(int, line.split("|"))) for line in rules_section.split()}
+    updates = [list(map(int, line.split(","))) for line in updates_section.split()]
+    ordered = [update for update in updates if reference_ordered(update, rules)]
+    # With a rule between every pair, a page's position is the number of pages in the update it must follow
+    repaired = [sorted(update, key=lambda page: sum((other, page) in rules for other in update))
+                for update in updates if not reference_ordered(update, rules)]
+    return sum(update[len(update) // 2] for update in ordered), sum(update[len(update) // 2] for update in repaired)
+
+
+def random_rules(rng, pages, count, acyclic):
+    rules = set()
+    while len(rules) < count:
+        x, y = rng.sample(pages, 2)
+        if acyclic and x > y:
+            x, y = y, x
+        rules.add((x, y))
+    return rules
+
+
+def test_parts_match_reference(solve, seed):
+    text = generate(5, 0.3, seed)
+    assert solve(text) == reference_parts(text)
+
+
+def test_repair_orders_updates_under_partial_rules(day, seed):
+    rng = random.Random(seed)
+    pages = list(range(10, 60))
+    # Sparse acyclic rules leave many pairs unranked, which the comparator sort cannot handle alone
+    index = day.RuleIndex(random_rules(rng, pages, 150, acyclic=True))
+    for _ in range(100):
+        update = rng.sample(pages, rng.randint(1, 15))
+        repaired = day.repair_update(update, index)
+        assert sorted(repaired) == sorted(update)
+        assert reference_ordered(repaired, index.pairs)
+
+
+def test_cycles_are_reported(day):
+    index = day.RuleIndex([(1, 2), (2, 3), (3, 1), (4, 5)])
+    assert day.repair_update([1, 2, 3, 4, 5], index) == []
+    assert [sorted(component) for component in day.cycle_members([5, 1, 2, 3, 4], index)] == [[1, 2, 3]]
+
+
+def test_batch_validation_matches_pairwise_check(day, seed, monkeypatch):
+    rng = random.Random(seed)
+    # Over 64 ruled pages spans several bitset words, and pages past 150 have no rules at all
+    pages = list(range(10, 200))
+    rules = random_rules(rng, pages[:140], 2000, acyclic=False)
+    index = day.RuleIndex(rules)
+    updates = [rng.sample(pages, rng.randint(1, 12)) for _ in range(300)]
+    # Mostly ordered updates reach the full check, past the adjacent-pair shortcut
+    updates += [sorted(update, key=lambda page: sum((other, page) in rules for other in update)) for update in updates]
+    expected = [reference_ordered(update, rules) for update in updates]
+    assert [day.is_update_ordered(update, index) for update in updates] == expected
+    monkeypatch.setattr(day, "BATCH_LOOKUPS", 64)
+    assert day.ordered_updates(updates, index).tolist() == expected
@@ -0,0 +1,82 @@
+"""Day6's jump-table guard and its parallel candidate count against a step-by-step walk."""
+import random
+
+import pytest
+
+from aoc.generators import generate
+
+DAY = 6
+MOVES = [(-1, 0), (0, 1), (1, 0), (0, -1)]
+
+
+def reference_walk(lines, obstruction=None):
+    """Cells the guard visits one step at a time, or ``None`` when it walks in a loop."""
+    rows, cols = len(lines), len(lines[0])
+    (r, c), = [(r, c) for r, line in enumerate(lines) for c, char in enumerate(line) if char == "^"]
+    heading, visited, states = 0, {(r, c)}, set()
+    while (r, c, heading) not in states:
+        states.add((r, c, heading))
+        dr, dc = MOVES[heading]
+        if not (0 <= r + dr < rows and 0 <= c + dc < cols):
+            return visited
+        if lines[r + dr][c + dc] == "#" or (r + dr, c + dc) == obstruction:
+            heading = (heading + 1) % 4
+        else:
+            r, c = r + dr, c + dc
+            visited.add((r, c))
+    return None
+
+
+def reference_parts(text):
+    lines = text.split()
+    visited = reference_walk(lines)
+    start = next((r, c) for r, line in enumerate(lines) for c, char in enumerate(line) if char == "^")
+    return len(visited), sum(reference_walk(lines, cell) is None for cell in visited - {start})
+
+
+def text_map(seed, rows=12, cols=15):
+    """A small random map, with obstacles close enough together that most runs end at one."""
+    rng = random.Random(seed)
+    lines = [["#" if rng.random() < 0.15 else "." for _ in range(cols)] for _ in range(rows)]
+    lines[rng.randrange(rows)][rng.randrange(cols)] = "^"
+    return "\n".join("".join(line) for line in lines)
+
+
+SCALES = (0.05, 0.1)
+
+
+@pytest.mark.parametrize("scale", SCALES)
+def test_parts_match_reference(solve, scale, seed):
+    text = generate(6, scale, seed)
+    assert solve(text) == reference_parts(text)
+
+
+@pytest.mark.parametrize("scale", SCALES)
+def test_parallel_matches_reference(solver, scale, seed):
+    text = generate(6, scale, seed)
+    day06_parallel = solver(6, "day06_parallel")
+    assert day06_parallel.count_loops_parallel(day06_parallel.parse(text), jobs=2) == reference_parts(text)[1]
+
+
+def test_jumps_match_single_steps(day, seed):
+    rng = random.Random(seed)
+    text = text_map(seed)
+    lines = text.split()
+    rows, cols = len(lines), len(lines[0])
+    lab = day.parse(text)
+    stride = lab.grid.stride
+    for cell in range(len(lab.grid.cells)):
+        if lab.grid.cells[cell] != ord("."):
+            continue
+        # Padded cell to (row, column) on the text map
+        r, c = cell // stride - 1, cell % stride - 1
+        obstruction = rng.choice([None, (rng.randrange(rows), rng.randrange(cols))])
+        extra = day.EXIT if obstruction is None else (obstruction[0] + 1) * stride + obstruction[1] + 1
+        for heading, (dr, dc) in enumerate(MOVES):
+            stop_r, stop_c = r, c
+            while 0 <= stop_r + dr < rows and 0 <= stop_c + dc < cols and lines[stop_r + dr][stop_c + dc] != "#" \
+                    and (stop_r + dr, stop_c + dc) != obstruction:
+                stop_r, stop_c = stop_r + dr, stop_c + dc
+            exits = not (0 <= stop_r + dr < rows and 0 <= stop_c + dc < cols)
+            expected = day.EXIT if exits else (stop_r + 1) * stride + stop_c + 1
+            assert lab.jump(cell * 4 + heading, extra) == expected
@@ -0,0 +1,55 @@
+"""Day7's backward search and parallel chunks against trying every operator sequence left to right."""
+import itertools
+import random
+
+import pytest
+
+from aoc.generators import generate
+
+DAY = 7
+OPERATORS = {"+": int.__add__, "*": int.__mul__, "||": lambda a, b: int(f"{a}{b}")}
+
+
+def reference_can_reach(target, numbers, operators):
+    for sequence in itertools.product(operators, repeat=len(numbers) - 1):
+        value = numbers[0]
+        for operator, number in zip(sequence, numbers[1:]):
+            value = OPERATORS[operator](value, number)
+        if value == target:
+            return True
+    return False
+
+
+def reference_parts(test_cases):
+    return tuple(sum(case.target for case in test_cases if reference_can_reach(case.target, case.numbers, operators))
+                 for operators in ("+*", OPERATORS))
+
+
+def random_equation(rng):
+    """Numbers with zeros and ones among them, and a target that is reachable about half the time."""
+    numbers = [rng.choice([0, 1, rng.randint(2, 9), rng.randint(10, 120)]) for _ in range(rng.randint(1, 6))]
+    target = numbers[0]
+    for number in numbers[1:]:
+        target = OPERATORS[rng.choice(list(OPERATORS))](target, number)
+    return max(0, target + rng.choice([0, 0, 1, -1])), numbers
+
+
+def test_can_reach_matches_enumeration(day, seed):
+    rng = random.Random(seed)
+    for _ in range(500):
+        target, numbers = random_equation(rng)
+        assert day.can_reach(target, numbers) == reference_can_reach(target, numbers, "+*")
+        assert day.can_reach(target, numbers, concat=True) == reference_can_reach(target, numbers, OPERATORS)
+
+
+def test_parts_match_reference(day, solve, seed):
+    text = generate(7, 0.02, seed)
+    assert solve(text) == reference_parts(day.parse(text))
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_parallel_matches_reference(day, solver, jobs):
+    test_cases = day.parse(generate(7, 0.02, 0))
+    # Chunks smaller than the input, so that several are collected out of order
+    answers = solver(7, "day7_parallel").solve_parallel(test_cases, jobs, chunk_size=3, report=lambda line: None)
+    assert answers == reference_parts(test_cases)
@@ -0,0 +1,61 @@
+"""Day8's vectorized antinodes against checking every antenna pair, and every cell for part 2."""
+import itertools
+import random
+
+import pytest
+
+from aoc.generators import generate
+
+DAY = 8
+
+
+def antenna_pairs(lines):
+    antennas = {}
+    for r, line in enumerate(lines):
+        for c, char in enumerate(line):
+            if char != ".":
+                antennas.setdefault(char, []).append((r, c))
+    return [pair for coords in antennas.values() for pair in itertools.combinations(coords, 2)]
+
+
+def reference_parts(text):
+    lines = text.split()
+    rows, cols = len(lines), len(lines[0])
+    pairs = antenna_pairs(lines)
+    mirrored = {(2 * r2 - r1, 2 * c2 - c1) for (r1, c1), (r2, c2) in pairs}
+    mirrored |= {(2 * r1 - r2, 2 * c1 - c2) for (r1, c1), (r2, c2) in pairs}
+    part1 = sum(0 <= r < rows and 0 <= c < cols for r, c in mirrored)
+    # A cell is on the line through A and B when (B - A) x (P - A) is zero
+    part2 = sum(
+        any((r2 - r1) * (c - c1) == (c2 - c1) * (r - r1) for (r1, c1), (r2, c2) in pairs)
+        for r in range(rows) for c in range(cols)
+    )
+    return part1, part2
+
+
+def random_map(seed):
+    """A map of a few frequencies, some shapes far from square so lines leave through every side."""
+    rng = random.Random(seed)
+    rows, cols = rng.choice([(1, 20), (20, 1), (13, 13), (9, 31), (27, 6)])
+    lines = [["."] * cols for _ in range(rows)]
+    for _ in range(rng.randint(0, 12)):
+        lines[rng.randrange(rows)][rng.randrange(cols)] = rng.choice("aA0")
+    return "\n".join("".join(line) for line in lines)
+
+
+def test_parts_match_reference(solve, seed):
+    text = generate(8, 0.3, seed)
+    assert solve(text) == reference_parts(text)
+
+
+@pytest.mark.parametrize("map_seed", range(20))
+def test_random_maps_match_reference(solve, map_seed):
+    text = random_map(map_seed)
+    assert solve(text) == reference_parts(text)
+
+
+def test_small_blocks_match_reference(day, solve, seed, monkeypatch):
+    # Blocks of a few pairs and points split the pair lists and the line expansion mid-way
+    monkeypatch.setattr(day, "BLOCK_SIZE", 7)
+    text = generate(8, 0.3, seed)
+    assert solve(text) == reference_parts(text)
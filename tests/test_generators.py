@@ -0,0 +1,22 @@
+"""Generated inputs: reproducible from their seed, and readable by the registered solvers."""
+import pytest
+
+from aoc.generators import GENERATORS, generate
+from aoc.registry import DAYS
+
+
+@pytest.mark.parametrize("number", sorted(set(GENERATORS) & set(DAYS)))
+def test_small_inputs_parse(solver, number):
+    text = generate(number, 0.05, 1)
+    assert text == generate(number, 0.05, 1)
+    solver(number).parse(text)
+
+
+@pytest.mark.parametrize("scale", [0.01, 0.05, 0.1, 0.2, 0.3])
+def test_day18_small_scales_answer_both_parts(solver, scale, seed):
+    day18 = solver(18)
+    data = day18.parse(generate(18, scale, seed))
+    # Part 1's 1024 bytes leave the exit open and a later byte cuts it off
+    assert day18.part1(data) > 0
+    x, y = map(int, day18.part2(data).split(","))
+    assert (y, x) in data[1][1024:]
@@ -0,0 +1,117 @@
+"""The flat Grid and the days ported to it, against plain list-of-strings references."""
+from aoc.generators import generate
+from aoc.grid import DIGITS, Grid
+
+STEPS = ((-1, 0), (0, 1), (1, 0), (0, -1))
+
+
+def neighbours(lines, r, c):
+    for dr, dc in STEPS:
+        if 0 <= r + dr < len(lines) and 0 <= c + dc < len(lines[0]):
+            yield r + dr, c + dc
+
+
+def reference_trails(lines):
+    """Trailhead scores (distinct 9s reached) and ratings (distinct trails) by plain DFS."""
+    def ends(r, c):
+        if lines[r][c] == "9":
+            return [(r, c)]
+        return [end for nr, nc in neighbours(lines, r, c)
+                if int(lines[nr][nc]) == int(lines[r][c]) + 1 for end in ends(nr, nc)]
+
+    trails = [ends(r, c) for r, line in enumerate(lines) for c, height in enumerate(line) if height == "0"]
+    return sum(len(set(found)) for found in trails), sum(len(found) for found in trails)
+
+
+def reference_fences(lines):
+    """Sum of area * perimeter and of area * sides over the regions, by flood fill."""
+    seen, by_perimeter, by_sides = set(), 0, 0
+    for start in ((r, c) for r in range(len(lines)) for c in range(len(lines[0]))):
+        if start in seen:
+            continue
+        plant, region, stack = lines[start[0]][start[1]], {start}, [start]
+        while stack:
+            r, c = stack.pop()
+            for cell in neighbours(lines, r, c):
+                if cell not in region and lines[cell[0]][cell[1]] == plant:
+                    region.add(cell)
+                    stack.append(cell)
+        seen |= region
+        fences = {(r, c, dr, dc) for r, c in region for dr, dc in STEPS if (r + dr, c + dc) not in region}
+        # A side starts at every fence piece whose neighbour along the fence has no matching piece
+        sides = sum((r + dc, c + dr, dr, dc) not in fences for r, c, dr, dc in fences)
+        by_perimeter += len(region) * len(fences)
+        by_sides += len(region) * sides
+    return by_perimeter, by_sides
+
+
+def reference_warehouse(text, wide):
+    """Sum of box GPS coordinates after the robot's moves, pushing boxes as sets of cells."""
+    layout, moves = text.strip().split("\n\n")
+    if wide:
+        layout = layout.replace("#", "##").replace("O", "[]").replace(".", "..").replace("@", "@.")
+    cells = {(r, c): tile for r, line in enumerate(layout.splitlines()) for c, tile in enumerate(line)}
+    robot = next(cell for cell, tile in cells.items() if tile == "@")
+    for move in moves.replace("\n", ""):
+        dr, dc = {"^": (-1, 0), "v": (1, 0), "<": (0, -1), ">": (0, 1)}[move]
+        pushed, frontier, blocked = [], [robot], False
+        while frontier and not blocked:
+            ahead = []
+            for r, c in frontier:
+                cell = (r + dr, c + dc)
+                tile = cells.get(cell, "#")
+                if tile == "#":
+                    blocked = True
+                elif tile in "O[]" and cell not in pushed:
+                    halves = [cell]
+                    if tile != "O" and dr:
+                        halves.append((cell[0], cell[1] + (1 if tile == "[" else -1)))
+                    pushed += halves
+                    ahead += halves
+            frontier = ahead
+        if blocked:
+            continue
+        tiles = {cell: cells[cell] for cell in pushed}
+        for cell in pushed:
+            cells[cell] = "."
+        for (r, c), tile in tiles.items():
+            cells[r + dr, c + dc] = tile
+        cells[robot], robot = ".", (robot[0] + dr, robot[1] + dc)
+        cells[robot] = "@"
+    return sum(100 * r + c for (r, c), tile in cells.items() if tile in "O[")
+
+
+def test_grid_round_trip_and_offsets():
+    text = "abc\ndef"
+    grid = Grid.from_text(text)
+    assert grid.to_text() == text
+    assert (grid.height, grid.width, len(grid)) == (2, 3, 6)
+    for r, line in enumerate(text.splitlines()):
+        for c, letter in enumerate(line):
+            index = grid.index(r, c)
+            assert grid[index] == ord(letter) and grid.position(index) == (r, c)
+            for (dr, dc), offset in zip(STEPS, grid.orthogonal):
+                inside = 0 <= r + dr < grid.height and 0 <= c + dc < grid.width
+                assert grid[index + offset] == (ord(text.splitlines()[r + dr][c + dc]) if inside else grid.border)
+    assert list(grid.indices(ord("e"))) == [grid.index(1, 1)]
+    assert grid.find(ord("z")) == -1
+    assert Grid.from_text("19", DIGITS).to_text(bytes(range(48, 58)) + bytes(246)) == "19"
+
+
+def test_day10_matches_reference(solver, seed):
+    day10 = solver(10)
+    text = generate(10, 0.5, seed)
+    assert (day10.part1(day10.parse(text)), day10.part2(day10.parse(text))) == reference_trails(text.split())
+
+
+def test_day12_matches_reference(solver, seed):
+    day12 = solver(12)
+    text = generate(12, 0.1, seed)
+    assert (day12.part1(day12.parse(text)), day12.part2(day12.parse(text))) == reference_fences(text.split())
+
+
+def test_day15_matches_reference(solver, seed):
+    day15 = solver(15)
+    text = generate(15, 0.1, seed)
+    expected = reference_warehouse(text, wide=False), reference_warehouse(text, wide=True)
+    assert (day15.part1(day15.parse(text)), day15.part2(day15.parse(text))) == expected
@@ -0,0 +1,196 @@
+"""The shared searches against Bellman-Ford, and the days ported to them against tuple-based references."""
+import bisect
+import heapq
+import random
+from collections import deque
+
+import pytest
+
+from aoc.generators import generate
+from aoc.search import INF, astar, bfs, bucket_search, dijkstra, zero_one_bfs
+
+STEPS = ((-1, 0), (0, 1), (1, 0), (0, -1))
+
+
+def random_graph(seed, size=60, edges=240, max_cost=9):
+    rng = random.Random(seed)
+    graph = [[] for _ in range(size)]
+    for _ in range(edges):
+        graph[rng.randrange(size)].append((rng.randrange(size), rng.randint(0, max_cost)))
+    return graph
+
+
+def bellman_ford(graph, starts):
+    dist = [INF] * len(graph)
+    for start in starts:
+        dist[start] = 0
+    for _ in range(len(graph)):
+        for state, edges in enumerate(graph):
+            for next_state, cost in edges:
+                dist[next_state] = min(dist[next_state], dist[state] + cost)
+    return dist
+
+
+def on_shortest_paths(graph, starts, goals):
+    """States on some shortest path from a start to the nearest of ``goals``; searches stop at a goal."""
+    graph = [[] if state in goals else edges for state, edges in enumerate(graph)]
+    dist = bellman_ford(graph, starts)
+    best = min(dist[goal] for goal in goals)
+    reverse = [[] for _ in graph]
+    for state, edges in enumerate(graph):
+        for next_state, cost in edges:
+            reverse[next_state].append((state, cost))
+    to_goal = bellman_ford(reverse, [goal for goal in goals if dist[goal] == best])
+    return {state for state in range(len(graph)) if dist[state] + to_goal[state] == best}
+
+
+def test_weighted_searches_match_bellman_ford(seed):
+    graph = random_graph(seed)
+    neighbors = graph.__getitem__
+    expected = bellman_ford(graph, [0, 1])
+    assert dijkstra([0, 1], neighbors, len(graph)).dist == expected
+    assert astar([0, 1], neighbors, len(graph), heuristic=lambda state: 0).dist == expected
+    assert bucket_search([0, 1], neighbors, len(graph), max_cost=9).dist == expected
+
+    binary = [[(next_state, cost % 2) for next_state, cost in edges] for edges in graph]
+    assert zero_one_bfs([0], binary.__getitem__, len(graph)).dist == bellman_ford(binary, [0])
+
+    unit = [[(next_state, 1) for next_state, _ in edges] for edges in graph]
+    assert bfs([0], lambda state: [next_state for next_state, _ in unit[state]], len(graph)).dist == bellman_ford(unit, [0])
+
+
+def test_recorded_dag_covers_every_shortest_path(seed):
+    graph = random_graph(seed, max_cost=3)
+    dist = bellman_ford(graph, [0])
+    goals = {state for state in range(2, 12) if dist[state] != INF}
+    if not goals:
+        pytest.skip("no goal reachable in this graph")
+    for search in (dijkstra, lambda *args, **kwargs: bucket_search(*args, max_cost=3, **kwargs)):
+        result = search([0], graph.__getitem__, len(graph), goal=goals.__contains__, record_dag=True)
+        assert result.distance(result.goal) == min(dist[goal] for goal in goals)
+        assert result.backtrack(result.goals) == on_shortest_paths(graph, [0], goals)
+        path = result.path(result.goal)
+        assert path[0] == 0 and sum(min(cost for state, cost in graph[a] if state == b)
+                                    for a, b in zip(path, path[1:])) == result.distance(result.goal)
+
+
+def test_astar_with_manhattan_heuristic_on_a_grid():
+    rng = random.Random(7)
+    size = 30
+    walls = {(r, c) for r in range(size) for c in range(size) if rng.random() < 0.25} - {(0, 0), (size - 1, size - 1)}
+
+    def neighbors(state):
+        r, c = divmod(state, size)
+        for dr, dc in STEPS:
+            if 0 <= r + dr < size and 0 <= c + dc < size and (r + dr, c + dc) not in walls:
+                yield (r + dr) * size + c + dc, 1
+
+    goal = size * size - 1
+    result = astar([0], neighbors, size * size, heuristic=lambda state: abs(size - 1 - state // size) + abs(size - 1 - state % size),
+                   goal=lambda state: state == goal)
+    plain = dijkstra([0], neighbors, size * size)
+    assert result.distance(goal) == plain.distance(goal)
+    assert result.expanded <= plain.expanded
+
+
+def reference_maze(text):
+    """Lowest reindeer score and the tiles on any lowest-score path, Dijkstra over (row, col, heading)."""
+    lines = text.split()
+    find = lambda symbol: next((r, c) for r, line in enumerate(lines) for c, tile in enumerate(line) if tile == symbol)
+
+    def moves(state, backwards=False):
+        r, c, d = state
+        dr, dc = STEPS[d]
+        ahead = (r - dr, c - dc) if backwards else (r + dr, c + dc)
+        if lines[ahead[0]][ahead[1]] != "#":
+            yield (*ahead, d), 1
+        yield (r, c, (d + 1) % 4), 1000
+        yield (r, c, (d - 1) % 4), 1000
+
+    def distances(starts, backwards=False):
+        dist = {start: 0 for start in starts}
+        heap = [(0, start) for start in starts]
+        while heap:
+            cost, state = heapq.heappop(heap)
+            if cost > dist[state]:
+                continue
+            for next_state, step in moves(state, backwards):
+                if cost + step < dist.get(next_state, INF):
+                    dist[next_state] = cost + step
+                    heapq.heappush(heap, (cost + step, next_state))
+        return dist
+
+    end = find("E")
+    forward = distances([(*find("S"), 1)])
+    best = min(forward.get((*end, d), INF) for d in range(4))
+    backward = distances([(*end, d) for d in range(4) if forward.get((*end, d)) == best], backwards=True)
+    tiles = {state[:2] for state, cost in forward.items() if cost + backward.get(state, INF) == best}
+    return best, len(tiles)
+
+
+def reference_steps(size, corrupted):
+    """Fewest steps across a size x size memory space, or None when the exit is cut off."""
+    dist = {(0, 0): 0}
+    queue = deque([(0, 0)])
+    while queue:
+        r, c = queue.popleft()
+        for dr, dc in STEPS:
+            cell = (r + dr, c + dc)
+            if 0 <= cell[0] < size and 0 <= cell[1] < size and cell not in corrupted and cell not in dist:
+                dist[cell] = dist[r, c] + 1
+                queue.append(cell)
+    return dist.get((size - 1, size - 1))
+
+
+def reference_cheats(text, longest, minsave):
+    """Cheats of Manhattan length up to ``longest`` that save at least ``minsave`` picoseconds."""
+    lines = text.split()
+    track = {(r, c) for r, line in enumerate(lines) for c, tile in enumerate(line) if tile != "#"}
+    start = next((r, c) for r, line in enumerate(lines) for c, tile in enumerate(line) if tile == "S")
+    cost, queue = {start: 0}, deque([start])
+    while queue:
+        r, c = queue.popleft()
+        for dr, dc in STEPS:
+            if (r + dr, c + dc) in track and (r + dr, c + dc) not in cost:
+                cost[r + dr, c + dc] = cost[r, c] + 1
+                queue.append((r + dr, c + dc))
+    return sum(1 for (r, c), here in cost.items() for (tr, tc), there in cost.items()
+               if 2 <= abs(tr - r) + abs(tc - c) <= longest and there - here - abs(tr - r) - abs(tc - c) >= minsave)
+
+
+def test_day16_matches_reference(solver, seed):
+    day16 = solver(16)
+    text = generate(16, 0.1, seed)
+    assert (day16.part1(day16.parse(text)), day16.part2(day16.parse(text))) == reference_maze(text)
+
+
+def test_day18_matches_reference(solver, seed):
+    day18 = solver(18)
+    # Large enough that bytes after the 1024 part 1 drops can still cut the exit off
+    text = generate(18, 0.6, seed)
+    grid, obstacles = day18.parse(text)
+    for step in (0, len(obstacles) // 4, len(obstacles) // 2):
+        expected = reference_steps(grid.width, set(obstacles[:step]))
+        if expected is None:
+            with pytest.raises(ValueError):
+                day18.solve1(grid, obstacles, step)
+        else:
+            assert day18.solve1(grid, obstacles, step) == expected
+    # The first byte that cuts the exit off
+    first = bisect.bisect_left(range(len(obstacles) + 1), True,
+                               key=lambda step: reference_steps(grid.width, set(obstacles[:step])) is None)
+    y, x = obstacles[first - 1]
+    assert day18.part2((grid, obstacles)) == f"{x},{y}"
+    # Also when only the very last byte does, and not at all without it
+    assert day18.solve2(grid, obstacles[:first]) == f"{x},{y}"
+    with pytest.raises(ValueError):
+        day18.solve2(grid, obstacles[:first - 1])
+
+
+def test_day20_matches_reference(solver, seed):
+    day20 = solver(20)
+    text = generate(20, 0.1, seed)
+    grid = day20.parse(text)
+    for minsave in (2, 10, 30):
+        assert day20.solve1(grid, minsave) == reference_cheats(text, 2, minsave)
+        assert day20.solve2(grid, minsave) == reference_cheats(text, 20, minsave)